@@ -23,12 +23,13 @@ def create_app(config_name='default'):
     })
 
     # 블루프린트 등록
-    from app.routes import articles, scheduler, sources, auth, comments
+    from app.routes import articles, scheduler, sources, auth, comments, classifier
     app.register_blueprint(articles.bp)
     app.register_blueprint(scheduler.bp)
     app.register_blueprint(sources.bp)
     app.register_blueprint(auth.bp)
     app.register_blueprint(comments.bp)
+    app.register_blueprint(classifier.bp)
 
     # 데이터베이스 초기화
     with app.app_context():
@@ -1,3 +1,15 @@
 from app.models.article import Article
+from app.models.collection_cursor import CollectionCursor
+from app.models.api_quota import ApiQuotaUsage
+from app.models.query_stats import QueryStats
+from app.models.classifier_ruleset import ClassifierRuleset
+from app.models.article_keyword import ArticleKeyword
+from app.models.classifier_rule_generation import ClassifierRuleGeneration
+from app.models.collection_job import CollectionJob
+from app.models.lease import Lease
+from app.models.query_velocity import QueryVelocity
+from app.models.ruleset_evaluation_job import RulesetEvaluationJob
 
-__all__ = ['Article']
+__all__ = ['Article', 'CollectionCursor', 'ApiQuotaUsage', 'QueryStats', 'ClassifierRuleset', 'ArticleKeyword',
+           'ClassifierRuleGeneration', 'CollectionJob', 'Lease', 'QueryVelocity',
+           'RulesetEvaluationJob']
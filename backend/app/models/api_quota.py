@@ -0,0 +1,62 @@
+from datetime import datetime, date
+from typing import Dict, List
+from app import db
+
+
+class ApiQuotaUsage(db.Model):
+    """API 키별 일일 호출량 (네이버 검색 API 쿼터 집계)"""
+    __tablename__ = 'api_quota_usage'
+    __table_args__ = (
+        db.UniqueConstraint('api_key', 'usage_date', name='uq_api_quota_usage_key_date'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    api_key = db.Column(db.String(100), nullable=False)  # NAVER_CLIENT_ID
+    usage_date = db.Column(db.Date, nullable=False)  # KST 기준 날짜
+    request_count = db.Column(db.Integer, default=0, nullable=False)
+
+    # 메타데이터
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def get_used(cls, api_key: str, usage_date: date) -> int:
+        """해당 날짜의 누적 호출 수"""
+        usage = cls.query.filter_by(api_key=api_key, usage_date=usage_date).first()
+        return usage.request_count if usage else 0
+
+    @classmethod
+    def add_usage(cls, api_key: str, usage_date: date, count: int):
+        """호출 수 누적 (커밋은 호출자가 수행)"""
+        if count <= 0:
+            return
+
+        updated = cls.query.filter_by(api_key=api_key, usage_date=usage_date).update(
+            {cls.request_count: cls.request_count + count},
+            synchronize_session=False
+        )
+        if not updated:
+            db.session.add(cls(api_key=api_key, usage_date=usage_date, request_count=count))
+
+    @classmethod
+    def load_usage(cls, api_keys: List[str], usage_date: date) -> Dict[str, int]:
+        """여러 키의 해당 날짜 누적 호출 수"""
+        rows = cls.query.filter(cls.api_key.in_(api_keys), cls.usage_date == usage_date).all()
+        return {row.api_key: row.request_count for row in rows}
+
+    @classmethod
+    def record_usage(cls, usage: Dict[str, int], usage_date: date):
+        """키별 호출 수 누적 (커밋은 호출자가 수행)"""
+        for api_key, count in usage.items():
+            cls.add_usage(api_key, usage_date, count)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'api_key': self.api_key,
+            'usage_date': self.usage_date.isoformat() if self.usage_date else None,
+            'request_count': self.request_count,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<ApiQuotaUsage {self.api_key} {self.usage_date}: {self.request_count}>'
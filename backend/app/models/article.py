@@ -1,5 +1,12 @@
 from datetime import datetime
+from sqlalchemy import event, inspect
 from app import db
+from app.utils.normalization import canonical_key
+
+
+def _default_canonical_key(context):
+    """canonical_key 없이 생성된 기사는 url로 키 생성"""
+    return canonical_key(context.get_current_parameters()['url'])
 
 
 class Article(db.Model):
@@ -11,6 +18,10 @@ class Article(db.Model):
     description = db.Column(db.Text)
     content = db.Column(db.Text)
     url = db.Column(db.String(1000), unique=True, nullable=False)
+    canonical_key = db.Column(db.String(64), unique=True, index=True,
+                              default=_default_canonical_key)  # 정규화 URL 해시 (중복 판단용)
+    story_key = db.Column(db.String(64), index=True)  # 유사 기사 묶음 대표 기사의 canonical_key
+    minhash = db.Column(db.LargeBinary)  # 제목+요약 MinHash 서명 (유사 기사 판단용)
     source = db.Column(db.String(100))  # 출처 (네이버, 조선일보 등)
     author = db.Column(db.String(100))
     published_date = db.Column(db.DateTime)
@@ -20,6 +31,8 @@ class Article(db.Model):
     category = db.Column(db.String(50))  # 카테고리 (투자, 블록체인, 암호화폐 등)
     keywords = db.Column(db.JSON)  # 추출된 키워드
     confidence_score = db.Column(db.Float)  # AI 분류 신뢰도
+    content_hash = db.Column(db.String(40))  # 분류에 쓴 제목+요약의 해시
+    ruleset_version = db.Column(db.String(16), index=True)  # 분류에 쓴 규칙 버전
 
     # 감성 분석 및 PR 대응
     sentiment = db.Column(db.String(20))  # positive/negative/neutral
@@ -58,6 +71,8 @@ class Article(db.Model):
             'description': self.description,
             'content': self.content,
             'url': self.url,
+            'canonical_key': self.canonical_key,
+            'story_key': self.story_key,
             'source': self.source,
             'author': self.author,
             'published_date': self.published_date.isoformat() if self.published_date else None,
@@ -89,3 +104,13 @@ class Article(db.Model):
 
     def __repr__(self):
         return f'<Article {self.title[:30]}...>'
+
+
+@event.listens_for(Article, 'before_update')
+def _invalidate_content_hash(mapper, connection, target):
+    """제목/요약이 바뀌면 분류 해시를 비워 증분 재분류 대상으로 표시"""
+    state = inspect(target)
+    if state.attrs.content_hash.history.has_changes():
+        return
+    if state.attrs.title.history.has_changes() or state.attrs.description.history.has_changes():
+        target.content_hash = None
@@ -0,0 +1,50 @@
+from typing import Dict, Iterable, List, Set
+from app import db
+
+
+class ArticleKeyword(db.Model):
+    """분류기 키워드 → 기사 역색인 (기사 제목+요약에 나온 키워드)"""
+    __tablename__ = 'article_keywords'
+
+    keyword = db.Column(db.String(100), primary_key=True)  # 오토마톤 패턴 (비교 방식 그대로의 문자열)
+    article_id = db.Column(db.Integer, db.ForeignKey('articles.id', ondelete='CASCADE'),
+                           primary_key=True, index=True)
+
+    @classmethod
+    def replace(cls, postings: Dict[int, Iterable[str]]):
+        """기사별 키워드 목록으로 색인 교체 (커밋은 호출자가 수행)"""
+        if not postings:
+            return
+        article_ids = list(postings)
+        for i in range(0, len(article_ids), 500):
+            db.session.query(cls).filter(cls.article_id.in_(article_ids[i:i + 500])).delete(
+                synchronize_session=False
+            )
+        rows = [
+            {'keyword': keyword, 'article_id': article_id}
+            for article_id, keywords in postings.items() for keyword in set(keywords)
+        ]
+        if rows:
+            db.session.execute(db.insert(cls), rows)
+
+    @classmethod
+    def article_ids(cls, keywords: Iterable[str]) -> Set[int]:
+        """키워드 중 하나라도 나온 기사 ID"""
+        keywords = list(keywords)
+        ids = set()
+        for i in range(0, len(keywords), 500):
+            ids.update(
+                article_id for (article_id,) in db.session.query(cls.article_id)
+                .filter(cls.keyword.in_(keywords[i:i + 500])).distinct()
+            )
+        return ids
+
+    @classmethod
+    def remove_keywords(cls, keywords: List[str]) -> int:
+        """규칙에서 빠진 키워드의 색인 삭제"""
+        if not keywords:
+            return 0
+        return db.session.query(cls).filter(cls.keyword.in_(keywords)).delete(synchronize_session=False)
+
+    def __repr__(self):
+        return f'<ArticleKeyword {self.keyword} -> {self.article_id}>'
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Optional
+from app import db
+from app.models.classifier_ruleset import ClassifierRuleset
+
+
+class ClassifierRuleGeneration(db.Model):
+    """분류 규칙 게시 이력 (가장 큰 세대가 현재 규칙)"""
+    __tablename__ = 'classifier_rule_generations'
+
+    generation = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    version = db.Column(db.String(16), db.ForeignKey('classifier_rulesets.version'), nullable=False)
+    note = db.Column(db.String(200))  # 변경 사유
+
+    # 메타데이터
+    published_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+    published_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @classmethod
+    def current_generation(cls) -> int:
+        """현재 세대 번호 (게시된 규칙이 없으면 0)"""
+        return db.session.query(db.func.max(cls.generation)).scalar() or 0
+
+    @classmethod
+    def current(cls) -> Optional['ClassifierRuleGeneration']:
+        """현재 게시된 규칙 (없으면 None)"""
+        return cls.query.order_by(cls.generation.desc()).first()
+
+    @classmethod
+    def publish(cls, classifier, published_by: int = None, note: str = None) -> 'ClassifierRuleGeneration':
+        """분류기의 규칙을 새 세대로 게시 (이전 규칙으로 되돌릴 때도 새 세대, 커밋은 호출자가 수행)"""
+        ClassifierRuleset.record(classifier)
+        generation = cls(version=classifier.ruleset_version, published_by=published_by, note=note)
+        db.session.add(generation)
+        db.session.flush()
+        return generation
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'generation': self.generation,
+            'version': self.version,
+            'note': self.note,
+            'published_by': self.published_by,
+            'published_at': self.published_at.isoformat() if self.published_at else None
+        }
+
+    def __repr__(self):
+        return f'<ClassifierRuleGeneration {self.generation} {self.version}>'
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy.exc import IntegrityError
+from app import db
+
+
+class ClassifierRuleset(db.Model):
+    """분류 규칙 버전별 규칙 원본 (규칙 변경 시 바뀐 키워드 계산용)"""
+    __tablename__ = 'classifier_rulesets'
+
+    version = db.Column(db.String(16), primary_key=True)  # ArticleClassifier.ruleset_version
+    rules = db.Column(db.JSON, nullable=False)  # ArticleClassifier.ruleset()
+
+    # 메타데이터
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @classmethod
+    def record(cls, classifier):
+        """분류기의 규칙을 버전으로 저장 (이미 있으면 그대로, 커밋은 호출자가 수행)"""
+        if db.session.get(cls, classifier.ruleset_version) is not None:
+            return
+        try:
+            with db.session.begin_nested():
+                db.session.add(cls(version=classifier.ruleset_version, rules=classifier.ruleset()))
+        except IntegrityError:
+            # 다른 프로세스가 같은 버전을 먼저 저장함
+            pass
+
+    @classmethod
+    def load_rules(cls, version: str) -> Optional[Dict]:
+        """버전의 규칙 (저장된 적 없으면 None)"""
+        ruleset = db.session.get(cls, version)
+        return ruleset.rules if ruleset else None
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'version': self.version,
+            'rules': self.rules,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+    def __repr__(self):
+        return f'<ClassifierRuleset {self.version}>'
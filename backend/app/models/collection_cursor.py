@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from app import db
+
+
+class CollectionCursor(db.Model):
+    """검색 쿼리별 수집 워터마크 (마지막으로 수집한 최신 기사)"""
+    __tablename__ = 'collection_cursors'
+
+    id = db.Column(db.Integer, primary_key=True)
+    search_query = db.Column(db.String(200), unique=True, nullable=False)
+    last_published_date = db.Column(db.DateTime)  # 최신 기사 pubDate (UTC)
+    last_url = db.Column(db.String(1000))  # 최신 기사 URL
+
+    # 메타데이터
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def load_watermarks(cls, queries: Iterable[str]) -> Dict[str, Tuple[Optional[datetime], Optional[str]]]:
+        """쿼리별 (last_published_date, last_url) 워터마크 조회"""
+        cursors = cls.query.filter(cls.search_query.in_(list(queries))).all()
+        return {cursor.search_query: (cursor.last_published_date, cursor.last_url) for cursor in cursors}
+
+    @classmethod
+    def save_watermarks(cls, watermarks: Dict[str, Tuple[Optional[datetime], Optional[str]]]):
+        """워터마크를 세션에 반영 (커밋은 호출자가 기사 저장과 함께 수행)"""
+        if not watermarks:
+            return
+
+        existing = {
+            cursor.search_query: cursor
+            for cursor in cls.query.filter(cls.search_query.in_(list(watermarks.keys()))).all()
+        }
+        for query, (published_date, url) in watermarks.items():
+            cursor = existing.get(query)
+            if cursor is None:
+                cursor = cls(search_query=query)
+                db.session.add(cursor)
+            cursor.last_published_date = published_date
+            cursor.last_url = url
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'search_query': self.search_query,
+            'last_published_date': self.last_published_date.isoformat() if self.last_published_date else None,
+            'last_url': self.last_url,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<CollectionCursor {self.search_query}>'
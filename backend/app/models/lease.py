@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from app import db
+
+
+class Lease(db.Model):
+    """
+    이름별 배타적 임대 (프로세스/스레드 간 단일 실행 잠금)
+
+    보유자가 만료 전에 갱신하지 않으면 다른 보유자가 가져갈 수 있으므로,
+    보유 프로세스가 종료돼도 잠금이 영구히 남지 않는다.
+    """
+    __tablename__ = 'leases'
+
+    name = db.Column(db.String(50), primary_key=True)  # 잠금 이름 (예: 'collection')
+    holder = db.Column(db.String(64), nullable=False)  # 보유자 ID (예: 수집 작업 ID)
+    acquired_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    @classmethod
+    def acquire(cls, name: str, holder: str, ttl: timedelta) -> bool:
+        """
+        임대 획득 (비어 있거나 만료됐거나 이미 보유 중이면 성공, 커밋은 호출자가 수행)
+
+        Args:
+            name: 잠금 이름
+            holder: 보유자 ID
+            ttl: 유효 시간 (이 안에 renew하지 않으면 만료)
+
+        Returns:
+            획득 여부
+        """
+        now = datetime.utcnow()
+        # 만료된 임대 인수 (동시에 인수하면 조건부 UPDATE 하나만 성공)
+        taken = db.session.query(cls).filter(
+            cls.name == name,
+            db.or_(cls.expires_at < now, cls.holder == holder)
+        ).update({'holder': holder, 'acquired_at': now, 'expires_at': now + ttl}, synchronize_session=False)
+        if taken:
+            return True
+        try:
+            with db.session.begin_nested():
+                db.session.add(cls(name=name, holder=holder, acquired_at=now, expires_at=now + ttl))
+            return True
+        except IntegrityError:
+            # 다른 보유자가 유효한 임대를 가지고 있음
+            return False
+
+    @classmethod
+    def renew(cls, name: str, holder: str, ttl: timedelta) -> bool:
+        """보유 중인 임대 연장 (다른 보유자에게 넘어갔으면 False, 커밋은 호출자가 수행)"""
+        return bool(db.session.query(cls).filter(cls.name == name, cls.holder == holder).update(
+            {'expires_at': datetime.utcnow() + ttl}, synchronize_session=False
+        ))
+
+    @classmethod
+    def release(cls, name: str, holder: str):
+        """보유 중인 임대 반납 (커밋은 호출자가 수행)"""
+        db.session.query(cls).filter(cls.name == name, cls.holder == holder).delete(synchronize_session=False)
+
+    @classmethod
+    def holder_of(cls, name: str) -> Optional[str]:
+        """유효한 임대의 보유자 (없거나 만료됐으면 None)"""
+        lease = db.session.query(cls.holder, cls.expires_at).filter(cls.name == name).first()
+        if lease is None or lease.expires_at < datetime.utcnow():
+            return None
+        return lease.holder
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'holder': self.holder,
+            'acquired_at': self.acquired_at.isoformat() if self.acquired_at else None,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None
+        }
+
+    def __repr__(self):
+        return f'<Lease {self.name} {self.holder}>'
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Dict, Iterable
+from app import db
+
+
+class QueryStats(db.Model):
+    """검색 쿼리별 수확량 통계 (쿼리 계획기 입력)"""
+    __tablename__ = 'query_stats'
+
+    id = db.Column(db.Integer, primary_key=True)
+    search_query = db.Column(db.String(200), unique=True, nullable=False)
+    runs = db.Column(db.Integer, default=0, nullable=False)  # 측정된 실행 횟수
+    fetched = db.Column(db.Float, default=0.0)  # 실행당 수집 기사 수 (이동 평균)
+    unique = db.Column(db.Float, default=0.0)  # 실행당 고유 기사 수 (이동 평균)
+    skipped = db.Column(db.Integer, default=0)  # 연속 제외 횟수
+
+    # 메타데이터
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def load_stats(cls, queries: Iterable[str]) -> Dict[str, Dict]:
+        """쿼리별 통계 조회"""
+        rows = cls.query.filter(cls.search_query.in_(list(queries))).all()
+        return {
+            row.search_query: {
+                'runs': row.runs,
+                'fetched': row.fetched or 0.0,
+                'unique': row.unique or 0.0,
+                'skipped': row.skipped or 0
+            }
+            for row in rows
+        }
+
+    @classmethod
+    def save_stats(cls, stats: Dict[str, Dict]):
+        """통계를 세션에 반영 (커밋은 호출자가 수행)"""
+        if not stats:
+            return
+
+        existing = {
+            row.search_query: row
+            for row in cls.query.filter(cls.search_query.in_(list(stats.keys()))).all()
+        }
+        for query, stat in stats.items():
+            row = existing.get(query)
+            if row is None:
+                row = cls(search_query=query)
+                db.session.add(row)
+            row.runs = stat['runs']
+            row.fetched = stat['fetched']
+            row.unique = stat['unique']
+            row.skipped = stat.get('skipped', 0)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'search_query': self.search_query,
+            'runs': self.runs,
+            'fetched': self.fetched,
+            'unique': self.unique,
+            'skipped': self.skipped,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<QueryStats {self.search_query}>'
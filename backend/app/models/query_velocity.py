@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Dict, Iterable
+from app import db
+
+
+class QueryVelocity(db.Model):
+    """검색 쿼리별 새 기사 유입 속도와 폴링 간격 (적응형 수집 스케줄 입력)"""
+    __tablename__ = 'query_velocity'
+
+    id = db.Column(db.Integer, primary_key=True)
+    search_query = db.Column(db.String(200), unique=True, nullable=False)
+    rate = db.Column(db.Float)  # 시간당 새 기사 수 추정치 (측정 전에는 NULL)
+    interval_seconds = db.Column(db.Integer)  # 다음 폴링까지 간격 (쿼터 예산 조정 전)
+    last_polled_at = db.Column(db.DateTime)  # 마지막으로 실제 수집한 시각 (속도 측정 기준)
+    checked_at = db.Column(db.DateTime)  # 마지막으로 수집 실행에 포함된 시각 (계획기가 제외한 경우 포함)
+    last_new = db.Column(db.Integer, default=0)  # 마지막 수집의 새 기사 수
+    last_red = db.Column(db.Integer, default=0)  # 마지막 수집의 red 등급 기사 수
+
+    # 메타데이터
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    STATE_COLUMNS = ('rate', 'interval_seconds', 'last_polled_at', 'checked_at', 'last_new', 'last_red')
+
+    @classmethod
+    def load_states(cls, queries: Iterable[str]) -> Dict[str, Dict]:
+        """쿼리별 속도 상태 조회"""
+        rows = cls.query.filter(cls.search_query.in_(list(queries))).all()
+        return {
+            row.search_query: {column: getattr(row, column) for column in cls.STATE_COLUMNS}
+            for row in rows
+        }
+
+    @classmethod
+    def save_states(cls, states: Dict[str, Dict]):
+        """속도 상태를 세션에 반영 (커밋은 호출자가 수행)"""
+        if not states:
+            return
+
+        existing = {
+            row.search_query: row
+            for row in cls.query.filter(cls.search_query.in_(list(states.keys()))).all()
+        }
+        for query, state in states.items():
+            row = existing.get(query)
+            if row is None:
+                row = cls(search_query=query)
+                db.session.add(row)
+            for column in cls.STATE_COLUMNS:
+                setattr(row, column, state.get(column))
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'search_query': self.search_query,
+            'rate': self.rate,
+            'interval_seconds': self.interval_seconds,
+            'last_polled_at': self.last_polled_at.isoformat() if self.last_polled_at else None,
+            'checked_at': self.checked_at.isoformat() if self.checked_at else None,
+            'last_new': self.last_new,
+            'last_red': self.last_red,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<QueryVelocity {self.search_query}>'
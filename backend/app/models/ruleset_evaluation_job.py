@@ -0,0 +1,67 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict
+from app import db
+
+
+class RulesetEvaluationJob(db.Model):
+    """후보 분류 규칙 평가 작업 (백그라운드 실행 상태와 결과 보고서)"""
+    __tablename__ = 'ruleset_evaluation_jobs'
+
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    status = db.Column(db.String(20), nullable=False, default='queued', index=True)  # queued → running → succeeded | failed
+    rules = db.Column(db.JSON, nullable=False)  # 요청한 후보 규칙 (바꿀 항목)
+    samples = db.Column(db.Integer, nullable=False, default=5)  # 변경 종류별 표본 수
+    report = db.Column(db.JSON)  # evaluate_ruleset 결과
+    error = db.Column(db.Text)
+
+    # 메타데이터
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @classmethod
+    def update_state(cls, job_id: str, **values):
+        """작업 상태 갱신 (ORM 객체를 읽지 않는 단일 UPDATE, 커밋은 호출자가 수행)"""
+        values['updated_at'] = datetime.utcnow()
+        db.session.query(cls).filter(cls.id == job_id).update(values, synchronize_session=False)
+
+    @classmethod
+    def expire_stale(cls, max_age: timedelta) -> int:
+        """
+        max_age 안에 끝나지 않은 대기/실행 중 작업을 실패로 표시
+        (작업 프로세스가 재시작되거나 종료된 경우, 커밋은 호출자가 수행)
+
+        Returns:
+            실패로 표시한 작업 수
+        """
+        now = datetime.utcnow()
+        return db.session.query(cls).filter(
+            cls.status.in_(('queued', 'running')),
+            cls.updated_at < now - max_age
+        ).update({
+            'status': 'failed',
+            'error': '작업 프로세스가 응답하지 않아 중단된 것으로 처리됨',
+            'finished_at': now,
+            'updated_at': now
+        }, synchronize_session=False)
+
+    def to_dict(self) -> Dict:
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'status': self.status,
+            'rules': self.rules,
+            'samples': self.samples,
+            'report': self.report,
+            'error': self.error,
+            'requested_by': self.requested_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f'<RulesetEvaluationJob {self.id} {self.status}>'
@@ -501,11 +501,20 @@ def analyze_article_ai(current_user, article_id):
     """Run AI analysis"""
     try:
         from app.services.ai_service import full_ai_analysis
+        from app.services.story_index import reuse_story_analysis
 
         article = Article.query.get(article_id)
         if not article:
             return jsonify({'error': 'Article not found'}), 404
 
+        # Reuse the analysis of a syndicated copy on first analysis
+        if not article.ai_summary and reuse_story_analysis(article):
+            db.session.commit()
+            return jsonify({
+                'message': 'AI analysis reused from the same story',
+                'article': article.to_dict()
+            })
+
         # Perform AI analysis
         analysis_result = full_ai_analysis(article)
 
@@ -536,6 +545,7 @@ def batch_analyze_articles(current_user):
     """Batch AI analysis for multiple articles"""
     try:
         from app.services.ai_service import full_ai_analysis
+        from app.services.story_index import reuse_story_analysis
 
         data = request.get_json()
         article_ids = data.get('article_ids', [])
@@ -552,6 +562,10 @@ def batch_analyze_articles(current_user):
         results = []
         for article in articles:
             try:
+                if not article.ai_summary and reuse_story_analysis(article):
+                    results.append({'id': article.id, 'status': 'reused'})
+                    continue
+
                 analysis_result = full_ai_analysis(article)
                 article.ai_summary = analysis_result['ai_summary']
                 article.risk_level = analysis_result['risk_level']
@@ -567,7 +581,7 @@ def batch_analyze_articles(current_user):
         db.session.commit()
 
         return jsonify({
-            'message': f'{len([r for r in results if r["status"] == "success"])} articles analyzed',
+            'message': f'{len([r for r in results if r["status"] in ("success", "reused")])} articles analyzed',
             'results': results
         })
 
@@ -44,6 +44,17 @@ def token_required(f):
     return decorated
 
 
+def admin_required(f):
+    """관리자 전용 데코레이터 (token_required 포함)"""
+    @wraps(f)
+    @token_required
+    def decorated(current_user, *args, **kwargs):
+        if current_user.role != 'admin':
+            return jsonify({'error': '관리자 권한이 필요합니다'}), 403
+        return f(current_user, *args, **kwargs)
+    return decorated
+
+
 def generate_token(user):
     """JWT 토큰 생성"""
     payload = {
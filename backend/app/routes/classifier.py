@@ -0,0 +1,138 @@
+from flask import Blueprint, request, jsonify, current_app, url_for
+from app import db
+from app.models.classifier_rule_generation import ClassifierRuleGeneration
+from app.routes.auth import admin_required
+from app.services.classifier_rules import get_classifier, publish_rules
+from app.services.evaluation_jobs import get_evaluation, submit_evaluation
+import logging
+
+logger = logging.getLogger(__name__)
+
+bp = Blueprint('classifier', __name__, url_prefix='/api/classifier')
+
+
+@bp.route('/rules', methods=['GET'])
+@admin_required
+def get_rules(current_user):
+    """현재 분류 규칙 조회"""
+    try:
+        classifier = get_classifier(current_app.config)
+        published = ClassifierRuleGeneration.current()
+
+        return jsonify({
+            'generation': published.generation if published else 0,
+            'version': classifier.ruleset_version,
+            'published': published.to_dict() if published else None,
+            'rules': classifier.ruleset()
+        })
+
+    except Exception as e:
+        logger.error(f"분류 규칙 조회 중 오류: {e}")
+        return jsonify({'error': '분류 규칙 조회 실패'}), 500
+
+
+@bp.route('/rules', methods=['POST'])
+@admin_required
+def publish(current_user):
+    """
+    새 분류 규칙 게시
+
+    본문: {'rules': {바꿀 항목}, 'note': 변경 사유}
+    모든 워커가 CLASSIFIER_RULES_CHECK_SECONDS 안에 재시작 없이 새 규칙을 사용한다.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        note = data.get('note')
+        if note is not None and (not isinstance(note, str) or len(note) > 200):
+            return jsonify({'error': 'note는 200자 이하 문자열이어야 합니다'}), 400
+
+        try:
+            published, changed = publish_rules(
+                current_app.config, data.get('rules'), published_by=current_user.id, note=note
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        logger.info(f"분류 규칙 게시: {current_user.email} (변경 {'있음' if changed else '없음'})")
+        return jsonify({
+            'changed': changed,
+            'generation': published.generation if published else 0,
+            'version': published.version if published else get_classifier(current_app.config).ruleset_version,
+            'published': published.to_dict() if published else None
+        }), 201 if changed else 200
+
+    except Exception as e:
+        logger.error(f"분류 규칙 게시 중 오류: {e}")
+        db.session.rollback()
+        return jsonify({'error': '분류 규칙 게시 실패'}), 500
+
+
+@bp.route('/rules/evaluate', methods=['POST'])
+@admin_required
+def evaluate(current_user):
+    """
+    후보 분류 규칙 평가 작업 등록 (게시하지 않음)
+
+    본문: {'rules': {바꿀 항목}, 'samples': 변경 종류별 표본 수}
+    저장된 기사 전체에 현재 규칙과 후보 규칙을 적용하는 작업은 백그라운드에서 실행되며,
+    결과 보고서는 status_url로 조회한다.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        samples = data.get('samples', 5)
+        if isinstance(samples, bool) or not isinstance(samples, int) or not 0 <= samples <= 50:
+            return jsonify({'error': 'samples는 0~50 사이의 정수여야 합니다'}), 400
+
+        try:
+            job = submit_evaluation(current_app._get_current_object(), data.get('rules'), samples,
+                                    requested_by=current_user.id)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        status_url = url_for('classifier.get_evaluation_status', job_id=job.id)
+        return jsonify({
+            'job_id': job.id,
+            'status': job.status,
+            'status_url': status_url
+        }), 202, {'Location': status_url}
+
+    except Exception as e:
+        logger.error(f"분류 규칙 평가 작업 등록 중 오류: {e}")
+        db.session.rollback()
+        return jsonify({'error': '분류 규칙 평가 작업 등록 실패'}), 500
+
+
+@bp.route('/rules/evaluate/<job_id>', methods=['GET'])
+@admin_required
+def get_evaluation_status(current_user, job_id):
+    """규칙 평가 작업 상태와 결과 보고서 조회"""
+    try:
+        job = get_evaluation(current_app.config, job_id)
+        if not job:
+            return jsonify({'error': '작업을 찾을 수 없습니다'}), 404
+
+        return jsonify(job.to_dict())
+
+    except Exception as e:
+        logger.error(f"분류 규칙 평가 작업 조회 중 오류: {e}")
+        db.session.rollback()
+        return jsonify({'error': '분류 규칙 평가 작업 조회 실패'}), 500
+
+
+@bp.route('/rules/history', methods=['GET'])
+@admin_required
+def get_history(current_user):
+    """분류 규칙 게시 이력 (최신순)"""
+    try:
+        limit = min(request.args.get('limit', 50, type=int), 200)
+        generations = ClassifierRuleGeneration.query.order_by(
+            ClassifierRuleGeneration.generation.desc()
+        ).limit(limit).all()
+
+        return jsonify({
+            'history': [generation.to_dict() for generation in generations]
+        })
+
+    except Exception as e:
+        logger.error(f"분류 규칙 이력 조회 중 오류: {e}")
+        return jsonify({'error': '분류 규칙 이력 조회 실패'}), 500
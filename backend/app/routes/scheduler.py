@@ -1,7 +1,11 @@
-from flask import Blueprint, jsonify, current_app
-from app.services.news_collector import NewsCollector
-from app.services.article_classifier import ArticleClassifier
-from app.models.article import Article
+from flask import Blueprint, jsonify, current_app, url_for
+from app.services.naver_client import kst_today, mask_client_id
+from app.services.collection_jobs import get_job, submit_collection
+from app.models.api_quota import ApiQuotaUsage
+from app.models.lease import Lease
+from app.models.query_velocity import QueryVelocity
+from app.services.poll_scheduler import PollScheduler
+from app.services.scheduler_leader import SCHEDULER_LEASE
 from app import db
 import logging
 
@@ -10,81 +14,70 @@ bp = Blueprint('scheduler', __name__, url_prefix='/api/scheduler')
 
 @bp.route('/collect', methods=['POST'])
 def collect_articles():
-    """기사 수집 수동 실행"""
+    """기사 수집 수동 실행 (백그라운드 작업으로 등록하고 작업 ID를 바로 반환)"""
     try:
         # 설정 가져오기
-        client_id = current_app.config.get('NAVER_CLIENT_ID')
-        client_secret = current_app.config.get('NAVER_CLIENT_SECRET')
-        search_keywords = current_app.config.get('SEARCH_KEYWORDS')
-        max_articles = current_app.config.get('MAX_ARTICLES_PER_DAY')
-
-        if not client_id or not client_secret:
+        if not current_app.config.get('NAVER_CREDENTIALS'):
             return jsonify({
                 'error': 'Naver API 키가 설정되지 않았습니다',
-                'message': 'backend/.env 파일에 NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET을 설정해주세요. 또는 샘플 데이터를 사용하세요.',
+                'message': 'backend/.env 파일에 NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET(또는 NAVER_CREDENTIALS)을 설정해주세요. 또는 샘플 데이터를 사용하세요.',
                 'docs': 'https://developers.naver.com에서 API 키를 발급받을 수 있습니다.'
             }), 400
 
-        # 1단계: 기사 수집
-        collector = NewsCollector(client_id, client_secret)
-        articles = collector.collect_medical_articles(max_articles=max_articles)
-
-        logger.info(f"수집된 기사: {len(articles)}개")
-
-        # 2단계: 의료 기사 분류
-        classifier = ArticleClassifier(search_keywords)
-        medical_articles = classifier.batch_classify(articles)
-
-        logger.info(f"의료 기사: {len(medical_articles)}개")
-
-        # 3단계: 데이터베이스 저장
-        saved_count = 0
-        skipped_count = 0
-
-        for article_data in medical_articles:
-            # URL 중복 체크
-            existing = Article.query.filter_by(url=article_data['url']).first()
-            if existing:
-                skipped_count += 1
-                continue
-
-            article = Article(
-                title=article_data['title'],
-                description=article_data['description'],
-                url=article_data['url'],
-                source=article_data['source'],
-                published_date=article_data['published_date'],
-                is_medical=article_data['is_medical'],
-                category=article_data['category'],
-                keywords=article_data['keywords'],
-                confidence_score=article_data['confidence_score']
-            )
-
-            db.session.add(article)
-            saved_count += 1
-
-        db.session.commit()
-
-        logger.info(f"저장: {saved_count}개, 중복 스킵: {skipped_count}개")
+        # 수집 → 분류 → 저장은 작업 스레드 풀에서 실행 (API 워커를 점유하지 않음)
+        # 이미 진행 중인 수집이 있으면 새로 시작하지 않고 그 작업을 돌려줌
+        job, attached = submit_collection(current_app._get_current_object())
+        status_url = url_for('scheduler.get_job_status', job_id=job.id)
 
         return jsonify({
             'success': True,
-            'collected': len(articles),
-            'medical': len(medical_articles),
-            'saved': saved_count,
-            'skipped': skipped_count
-        })
+            'job_id': job.id,
+            'status': job.status,
+            'attached': attached,
+            'status_url': status_url
+        }), 202, {'Location': status_url}
 
     except Exception as e:
-        logger.error(f"기사 수집 중 오류: {e}")
+        logger.error(f"기사 수집 작업 등록 중 오류: {e}")
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job_status(job_id):
+    """수집 작업 상태 조회 (단계별 진행 상황, 카운트, 오류)"""
+    try:
+        job = get_job(current_app.config, job_id)
+        if not job:
+            return jsonify({'error': '작업을 찾을 수 없습니다'}), 404
+
+        return jsonify(job.to_dict())
+
+    except Exception as e:
+        logger.error(f"수집 작업 조회 중 오류: {e}")
+        db.session.rollback()
+        return jsonify({'error': '수집 작업 조회 실패'}), 500
+
 @bp.route('/status', methods=['GET'])
 def get_status():
     """스케줄러 상태 조회"""
+    credentials = current_app.config.get('NAVER_CREDENTIALS') or []
+    daily_quota = current_app.config.get('NAVER_DAILY_QUOTA')
+    usage = ApiQuotaUsage.load_usage([c[0] for c in credentials], kst_today())
+
     return jsonify({
         'status': 'running',
         'collection_time': current_app.config.get('ARTICLE_COLLECTION_TIME'),
-        'max_articles_per_day': current_app.config.get('MAX_ARTICLES_PER_DAY')
+        'leader': Lease.holder_of(SCHEDULER_LEASE),  # 스케줄 작업을 실행 중인 프로세스
+        'adaptive_collection': current_app.config.get('ADAPTIVE_COLLECTION_ENABLED'),
+        'adaptive_daily_call_budget': PollScheduler.from_config(current_app.config).daily_budget,
+        'query_velocity': [row.to_dict() for row in QueryVelocity.query.order_by(QueryVelocity.search_query).all()],
+        'max_articles_per_day': current_app.config.get('MAX_ARTICLES_PER_DAY'),
+        'naver_keys': [
+            {
+                'client_id': mask_client_id(client_id),
+                'quota_used': usage.get(client_id, 0),
+                'quota_remaining': max(0, daily_quota - usage.get(client_id, 0))
+            }
+            for client_id, _ in credentials
+        ]
     })
@@ -5,6 +5,9 @@ import json
 import logging
 from flask import current_app
 
+from app.services.article_classifier import ArticleFeatures
+from app.services.classifier_rules import get_classifier
+
 logger = logging.getLogger(__name__)
 
 # Anthropic 클라이언트 초기화는 사용 시 수행
@@ -41,7 +44,7 @@ def generate_summary(title: str, description: str, content: str = None) -> str:
 한국어로 작성하고, 각 줄은 명확하고 간결하게 작성해주세요.
 
 제목: {title}
-내용: {description or content or ''}
+내용: {(content or description or '')[:4000]}
 
 요약 (3줄):"""
 
@@ -130,17 +133,17 @@ JSON만 응답해주세요:"""
         return _fallback_risk_analysis(title, description)
 
 
-def _fallback_risk_analysis(title: str, description: str) -> dict:
-    """AI 사용 불가 시 키워드 기반 폴백 분석"""
-    text = f"{title} {description}".lower()
+def get_keyword_classifier():
+    """폴백 분석용 키워드 분류기 (프로세스 공용 분류기, 현재 게시된 규칙)"""
+    return get_classifier(current_app.config)
+
 
-    # 고위험 키워드
-    red_keywords = ['소송', '고소', '사기', '피해', '검찰', '수사', '횡령', '배임', '경찰', '구속']
-    # 중위험 키워드
-    amber_keywords = ['논란', '의혹', '비판', '우려', '하락', '손실', '규제', '제재', '경고']
+def _fallback_risk_analysis(title: str, description: str, features: ArticleFeatures = None) -> dict:
+    """AI 사용 불가 시 키워드 기반 폴백 분석 (분류기 특징 벡터의 고/중위험 키워드 수 사용)"""
+    features = features or get_keyword_classifier().extract_features(title, description or "")
 
-    red_count = sum(1 for kw in red_keywords if kw in text)
-    amber_count = sum(1 for kw in amber_keywords if kw in text)
+    red_count = features.high_risk_count
+    amber_count = features.medium_risk_count
 
     if red_count >= 2:
         return {'level': 'red', 'score': 80, 'analysis': '고위험 키워드가 다수 감지되었습니다. 즉시 확인이 필요합니다.'}
@@ -242,8 +245,8 @@ def full_ai_analysis(article) -> dict:
     description = article.description or ''
     category = article.category
 
-    # 요약 생성
-    summary = generate_summary(title, description)
+    # 요약 생성 (원문 본문이 있으면 본문 기준)
+    summary = generate_summary(title, description, article.content)
 
     # 리스크 분석
     risk_result = analyze_risk(title, description, category)
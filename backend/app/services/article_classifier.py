@@ -1,9 +1,114 @@
-from typing import Dict, List, Tuple
-import re
+from typing import Dict, List, Set, Tuple
+import hashlib
+import json
 import logging
 
+from app.services.keyword_automaton import KeywordAutomaton
+
 logger = logging.getLogger(__name__)
 
+# 분류기가 계산하는 기사 필드
+CLASSIFICATION_COLUMNS = [
+    'is_medical', 'category', 'keywords', 'confidence_score',
+    'sentiment', 'needs_response', 'risk_level', 'risk_score'
+]
+
+# 분류 결과를 다시 계산할지 판단하는 기사 필드 (내용 해시, 규칙 버전)
+MEMO_COLUMNS = ['content_hash', 'ruleset_version']
+
+# 규칙에 포함되는 키워드 목록 (category_keywords 제외)
+RULESET_LISTS = [
+    'hashed_company_keywords', 'exclude_patterns', 'negative_keywords', 'positive_keywords',
+    'response_keywords', 'investment_context', 'high_risk_keywords', 'medium_risk_keywords'
+]
+
+# 점수 계산 로직이나 분류 결과로 저장하는 값(키워드 역색인 포함)을 바꾸면 올린다
+# (규칙 버전 해시에 포함되므로 올리면 기존 기사가 모두 재분류 대상이 된다)
+SCORING_REVISION = 2
+
+
+def content_hash(title: str, description: str = "") -> str:
+    """분류 입력(제목+요약)의 해시 (같으면 같은 규칙에서 분류 결과도 같다)"""
+    return hashlib.sha1(f"{title or ''}\x00{description or ''}".encode('utf-8')).hexdigest()
+
+class KeywordHits:
+    """한 기사의 키워드 매칭 결과 (오토마톤 1회 순회)"""
+
+    __slots__ = ('matches', 'text', 'title')
+
+    def __init__(self, matches: List[Tuple[str, int, str]], title: Set[str]):
+        self.matches = matches  # (키워드, 위치, 'title' | 'body')
+        self.text = {keyword for keyword, _, _ in matches}  # 제목+요약 어디든 있는 키워드
+        self.title = title  # 제목에 있는 키워드
+
+
+def match_automaton(automaton: KeywordAutomaton, title: str, description: str = "") -> KeywordHits:
+    """
+    ArticleClassifier.match_keywords와 같은 방식으로 임의의 오토마톤 매칭
+    (여러 규칙의 키워드를 합친 오토마톤으로 한 번에 순회할 때 사용)
+
+    Args:
+        automaton: 키워드 오토마톤 (패턴은 비교 방식 그대로의 문자열)
+        title: 기사 제목
+        description: 기사 요약
+
+    Returns:
+        KeywordHits (키워드별 위치와 제목/본문 구분)
+    """
+    title_lower = title.lower()
+    text = f"{title} {description}".lower()
+    # 소문자화 결과는 보통 제목 부분이 그대로 앞에 오지만, 문맥에 따라 달라지는
+    # 문자(예: 그리스어 시그마)가 있으면 제목을 따로 순회한다
+    title_length = len(title_lower) if text.startswith(title_lower) else -1
+
+    patterns = automaton.patterns
+    matches = []
+    for pattern_id, start in automaton.iter_matches(text):
+        keyword = patterns[pattern_id]
+        part = 'title' if start + len(keyword) <= title_length else 'body'
+        matches.append((keyword, start, part))
+
+    if title_length >= 0:
+        title_keywords = {keyword for keyword, _, part in matches if part == 'title'}
+    else:
+        title_keywords = {keyword for keyword, _ in automaton.find_all(title_lower)}
+    return KeywordHits(matches, title_keywords)
+
+
+# 특징 벡터의 점수 슬롯
+_NEGATIVE, _POSITIVE, _HIGH_RISK, _MEDIUM_RISK, _HIGH_RISK_COUNT, _MEDIUM_RISK_COUNT = range(6)
+_CATEGORY_BASE = 6
+
+
+class ArticleFeatures:
+    """
+    한 기사의 특징 벡터 (텍스트 정규화와 키워드 순회 1회로 계산)
+
+    분류/감성/대응 필요/리스크 점수 계산과 AI 폴백 분석이 모두 이 값을 공유한다.
+    """
+
+    __slots__ = (
+        'hits', 'keywords', 'relevance_score', 'company_found', 'is_technical',
+        'category_counts', 'negative_score', 'positive_score', 'response_keyword',
+        'high_risk_score', 'medium_risk_score', 'high_risk_count', 'medium_risk_count'
+    )
+
+    def __init__(self, hits: KeywordHits):
+        self.hits = hits
+        self.keywords: List[str] = []  # 발견된 회사/검색 키워드 (원문)
+        self.relevance_score = 0.0  # 정규화 전 관련도 점수
+        self.company_found = False  # 해시드 회사 키워드 존재 여부
+        self.is_technical = False  # 기술적 용어 'hashed' 여부
+        self.category_counts: Dict[str, int] = {}  # 카테고리별 키워드 수
+        self.negative_score = 0  # 부정 키워드 점수 (제목 2점/본문 1점)
+        self.positive_score = 0  # 긍정 키워드 점수 (제목 2점/본문 1점)
+        self.response_keyword = None  # 첫 번째 대응 필요 키워드
+        self.high_risk_score = 0  # 고위험 키워드 점수 (제목 25점/본문 10점)
+        self.medium_risk_score = 0  # 중위험 키워드 점수 (제목 15점/본문 5점)
+        self.high_risk_count = 0  # 고위험 키워드 종류 수
+        self.medium_risk_count = 0  # 중위험 키워드 종류 수
+
+
 class ArticleClassifier:
     """하이브리드 방식의 기사 분류기 (키워드 + 간단한 점수 시스템)"""
 
@@ -55,13 +160,226 @@ class ArticleClassifier:
             '피해', '논란', '의혹', '비판', '항의', '시위', '고발', '신고'
         ]
 
-    def classify_article(self, title: str, description: str = "") -> Tuple[bool, str, float, List[str]]:
+        # 'hashed'를 회사명으로 판단하는 투자/블록체인 컨텍스트
+        self.investment_context = ['투자', '벤처', 'vc', '펀딩', '포트폴리오', '암호화폐', '가상자산', '블록체인', 'web3']
+
+        # 고위험 키워드 (제목에 있으면 가중치 3배)
+        self.high_risk_keywords = [
+            '소송', '고소', '사기', '피해', '검찰', '수사', '횡령', '배임',
+            '경찰', '구속', '체포', '기소', '압수수색', '불법', '범죄'
+        ]
+
+        # 중위험 키워드
+        self.medium_risk_keywords = [
+            '논란', '의혹', '비판', '우려', '하락', '손실', '규제', '제재',
+            '경고', '위기', '실패', '철수', '폭락', '위반'
+        ]
+
+        # 점수 가중치
+        self.weights = {
+            'company_title': 3.0, 'company_body': 1.5,  # 해시드 회사 키워드 (제목/본문)
+            'search_title': 2.0, 'search_body': 1.0,  # 일반 검색 키워드 (제목/본문)
+            'company_confidence': 0.7,  # 회사 키워드가 있을 때 최소 신뢰도
+            'keyword_confidence_base': 0.5, 'keyword_confidence_step': 0.1,  # 키워드 수 기반 최소 신뢰도
+            'min_confidence': 0.04,  # 관련 기사 판단 기준
+            'sentiment_title': 2, 'sentiment_body': 1,  # 감성 키워드 (제목/본문)
+            'high_risk_title': 25, 'high_risk_body': 10,  # 고위험 키워드 (제목/본문)
+            'medium_risk_title': 15, 'medium_risk_body': 5,  # 중위험 키워드 (제목/본문)
+            'negative_risk': 15, 'positive_risk': 10, 'response_risk': 10,  # 감성/대응 필요 보정
+            'red_threshold': 70, 'amber_threshold': 40  # 리스크 레벨 기준
+        }
+
+        self._compile()
+
+    @classmethod
+    def from_ruleset(cls, rules: Dict) -> 'ArticleClassifier':
+        """
+        ruleset() 형식의 규칙으로 분류기 생성
+
+        Args:
+            rules: 키워드 목록과 가중치 (없는 항목은 기본값 사용)
+
+        Returns:
+            ArticleClassifier
+        """
+        classifier = cls(rules.get('search_keywords', []))
+        for name in RULESET_LISTS:
+            if name in rules:
+                setattr(classifier, name, list(rules[name]))
+        if 'category_keywords' in rules:
+            classifier.category_keywords = {category: list(keywords) for category, keywords in rules['category_keywords']}
+        if 'weights' in rules:
+            classifier.weights = {**classifier.weights, **rules['weights']}
+        classifier._compile()
+        return classifier
+
+    def ruleset(self) -> Dict:
+        """분류 결과를 결정하는 키워드 목록과 가중치 (순서 포함)"""
+        return {
+            'revision': SCORING_REVISION,
+            'search_keywords': list(self.search_keywords),
+            'hashed_company_keywords': self.hashed_company_keywords,
+            'exclude_patterns': self.exclude_patterns,
+            'category_keywords': [[category, keywords] for category, keywords in self.category_keywords.items()],
+            'negative_keywords': self.negative_keywords,
+            'positive_keywords': self.positive_keywords,
+            'response_keywords': self.response_keywords,
+            'investment_context': self.investment_context,
+            'high_risk_keywords': self.high_risk_keywords,
+            'medium_risk_keywords': self.medium_risk_keywords,
+            'weights': self.weights
+        }
+
+    def _compile(self):
+        """
+        모든 키워드 목록을 하나의 Aho-Corasick 오토마톤과 특징 테이블로 컴파일
+
+        각 목록은 기존 비교 방식 그대로의 문자열로 등록한다 (소문자화해 비교하던
+        목록은 소문자로, 원문 그대로 비교하던 목록은 원문 그대로).
+        """
+        patterns = [keyword.lower() for keyword in self.hashed_company_keywords]
+        patterns += [keyword.lower() for keyword in self.search_keywords]
+        patterns += self.exclude_patterns + self.investment_context + ['hashed', '해시드']
+        for keywords in self.category_keywords.values():
+            patterns += keywords
+        patterns += self.negative_keywords + self.positive_keywords + self.response_keywords
+        patterns += self.high_risk_keywords + self.medium_risk_keywords
+        self._automaton = KeywordAutomaton(patterns)
+
+        # 규칙 버전: 규칙이 같으면 프로세스/서버가 달라도 같은 값
+        payload = json.dumps(self.ruleset(), ensure_ascii=False, sort_keys=True)
+        self.ruleset_version = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+        weights = self.weights
+
+        # 관련도 키워드: (원문, 소문자, 제목 가중치, 본문 가중치)
+        # 검색 키워드 중 회사 키워드/앞선 검색 키워드와 같은 문자열은 한 번만 센다
+        self._relevance_keywords = []
+        seen = set()
+        for keywords, title_weight, body_weight in (
+                (self.hashed_company_keywords, weights['company_title'], weights['company_body']),
+                (self.search_keywords, weights['search_title'], weights['search_body'])):
+            for keyword in keywords:
+                if keywords is self.search_keywords and keyword in seen:
+                    continue
+                seen.add(keyword)
+                self._relevance_keywords.append((keyword, keyword.lower(), title_weight, body_weight))
+        self._company_keywords = frozenset(keyword.lower() for keyword in self.hashed_company_keywords)
+        self._exclude_patterns = frozenset(self.exclude_patterns)
+        self._investment_context = frozenset(self.investment_context)
+
+        # 가중 점수 (제목 우선, 제목 또는 본문): 키워드 -> [(슬롯, 제목 점수, 본문 점수)]
+        weighted: Dict[str, List[Tuple[int, int, int]]] = {}
+        for slot, keywords, title_weight, body_weight in (
+                (_NEGATIVE, self.negative_keywords, weights['sentiment_title'], weights['sentiment_body']),
+                (_POSITIVE, self.positive_keywords, weights['sentiment_title'], weights['sentiment_body']),
+                (_HIGH_RISK, self.high_risk_keywords, weights['high_risk_title'], weights['high_risk_body']),
+                (_MEDIUM_RISK, self.medium_risk_keywords, weights['medium_risk_title'], weights['medium_risk_body'])):
+            for keyword in keywords:
+                weighted.setdefault(keyword, []).append((slot, title_weight, body_weight))
+
+        # 출현 개수 (제목+요약 어디든): 키워드 -> [슬롯]
+        counted: Dict[str, List[int]] = {}
+        for keyword in self.high_risk_keywords:
+            counted.setdefault(keyword, []).append(_HIGH_RISK_COUNT)
+        for keyword in self.medium_risk_keywords:
+            counted.setdefault(keyword, []).append(_MEDIUM_RISK_COUNT)
+        self._categories = list(self.category_keywords)
+        for index, keywords in enumerate(self.category_keywords.values()):
+            for keyword in keywords:
+                counted.setdefault(keyword, []).append(_CATEGORY_BASE + index)
+
+        self._weighted = weighted
+        self._counted = counted
+        self._slot_count = _CATEGORY_BASE + len(self._categories)
+        # 대응 필요 키워드는 목록 순서상 첫 번째 키워드를 보고
+        self._response_rank = {}
+        for rank, keyword in enumerate(self.response_keywords):
+            self._response_rank.setdefault(keyword, rank)
+
+    def match_keywords(self, title: str, description: str = "") -> KeywordHits:
+        """
+        제목+요약을 한 번 순회해 모든 키워드 목록의 매칭 결과 계산
+
+        Args:
+            title: 기사 제목
+            description: 기사 요약
+
+        Returns:
+            KeywordHits (키워드별 위치와 제목/본문 구분)
+        """
+        return match_automaton(self._automaton, title, description)
+
+    def extract_features(self, title: str, description: str = "") -> ArticleFeatures:
+        """
+        기사 텍스트를 한 번 정규화/순회해 모든 점수 계산이 공유하는 특징 벡터 생성
+
+        Args:
+            title: 기사 제목
+            description: 기사 요약
+
+        Returns:
+            ArticleFeatures
+        """
+        hits = self.match_keywords(title, description)
+        text, title_hits = hits.text, hits.title
+
+        features = ArticleFeatures(hits)
+
+        # 관련도 (회사 키워드 → 검색 키워드 순서로 발견 키워드 나열)
+        score = 0.0
+        for keyword, keyword_lower, title_weight, body_weight in self._relevance_keywords:
+            if keyword_lower in text:
+                features.keywords.append(keyword)
+                score += title_weight if keyword_lower in title_hits else body_weight
+        features.relevance_score = score
+        features.company_found = not self._company_keywords.isdisjoint(text)
+
+        # 기술적 용어 "hashed" (동사로 사용된 경우)
+        if not self._exclude_patterns.isdisjoint(text):
+            features.is_technical = True
+        elif 'hashed' in text:
+            features.is_technical = not (features.company_found
+                                         or not self._investment_context.isdisjoint(text)
+                                         or '해시드' in text)
+
+        # 가중 점수/출현 개수를 키워드별 슬롯 테이블로 한 번에 누적
+        slots = [0] * self._slot_count
+        weighted, counted, response_rank = self._weighted, self._counted, self._response_rank
+        response = None
+        present = text if title_hits <= text else text | title_hits
+        for keyword in present:
+            entries = weighted.get(keyword)
+            if entries:
+                in_title = keyword in title_hits
+                for slot, title_weight, body_weight in entries:
+                    slots[slot] += title_weight if in_title else body_weight
+            if keyword in text:
+                for slot in counted.get(keyword, ()):
+                    slots[slot] += 1
+                rank = response_rank.get(keyword)
+                if rank is not None and (response is None or rank < response):
+                    response = rank
+
+        features.negative_score = slots[_NEGATIVE]
+        features.positive_score = slots[_POSITIVE]
+        features.high_risk_score = slots[_HIGH_RISK]
+        features.medium_risk_score = slots[_MEDIUM_RISK]
+        features.high_risk_count = slots[_HIGH_RISK_COUNT]
+        features.medium_risk_count = slots[_MEDIUM_RISK_COUNT]
+        features.category_counts = dict(zip(self._categories, slots[_CATEGORY_BASE:]))
+        features.response_keyword = self.response_keywords[response] if response is not None else None
+        return features
+
+    def classify_article(self, title: str, description: str = "",
+                         features: ArticleFeatures = None) -> Tuple[bool, str, float, List[str]]:
         """
         기사를 분류하여 관련 여부 판단
 
         Args:
             title: 기사 제목
             description: 기사 요약
+            features: extract_features 결과 (없으면 새로 계산)
 
         Returns:
             (is_relevant, category, confidence_score, keywords)
@@ -70,52 +388,36 @@ class ArticleClassifier:
             - confidence_score: 신뢰도 (0.0 ~ 1.0)
             - keywords: 추출된 키워드 리스트
         """
-        text = f"{title} {description}".lower()
-        found_keywords = []
-        score = 0.0
+        features = features or self.extract_features(title, description)
 
         # 0단계: 기술적 용어 "hashed" 제외 (동사로 사용된 경우)
-        is_tech_hashed = self._is_technical_hashed(text)
-        if is_tech_hashed:
+        if features.is_technical:
             logger.debug(f"기술적 용어 hashed로 판단되어 제외: {title[:50]}...")
             return False, None, 0.0, []
 
-        # 1단계: 해시드 회사 관련 핵심 키워드 체크 (높은 가중치)
-        for keyword in self.hashed_company_keywords:
-            if keyword.lower() in text:
-                found_keywords.append(keyword)
-                # 제목에 있으면 가중치 3배 (회사 관련 키워드는 더 높은 점수)
-                if keyword.lower() in title.lower():
-                    score += 3.0
-                else:
-                    score += 1.5
-
-        # 2단계: 일반 키워드 매칭
-        for keyword in self.search_keywords:
-            if keyword.lower() in text and keyword not in found_keywords:
-                found_keywords.append(keyword)
-                # 제목에 있으면 가중치 2배
-                if keyword.lower() in title.lower():
-                    score += 2.0
-                else:
-                    score += 1.0
+        # 1~2단계: 해시드 회사 키워드(제목 3점/본문 1.5점) + 일반 키워드(제목 2점/본문 1점)
+        found_keywords = list(features.keywords)
+        score = features.relevance_score
 
         # 3단계: 점수 정규화 (0.0 ~ 1.0)
-        max_possible_score = (len(self.hashed_company_keywords) * 3.0) + (len(self.search_keywords) * 2.0)
+        weights = self.weights
+        max_possible_score = (len(self.hashed_company_keywords) * weights['company_title']) + \
+            (len(self.search_keywords) * weights['search_title'])
         confidence_score = min(score / max_possible_score, 1.0) if max_possible_score > 0 else 0.0
 
         # 신뢰도 보정: 해시드 회사 키워드가 있으면 높은 신뢰도
-        hashed_company_found = any(kw.lower() in text for kw in self.hashed_company_keywords)
-        if hashed_company_found:
-            confidence_score = max(confidence_score, 0.7)
+        if features.company_found:
+            confidence_score = max(confidence_score, weights['company_confidence'])
         elif len(found_keywords) >= 1:
-            confidence_score = max(confidence_score, min(0.5 + (len(found_keywords) * 0.1), 1.0))
+            confidence_score = max(confidence_score, min(
+                weights['keyword_confidence_base'] + (len(found_keywords) * weights['keyword_confidence_step']), 1.0
+            ))
 
         # 4단계: 관련 기사 판단 (신뢰도 0.04 이상)
-        is_relevant = confidence_score >= 0.04 and len(found_keywords) >= 1
+        is_relevant = confidence_score >= weights['min_confidence'] and len(found_keywords) >= 1
 
         # 5단계: 카테고리 분류
-        category = self._classify_category(text) if is_relevant else None
+        category = self._category_from_features(features) if is_relevant else None
 
         logger.debug(f"분류 결과 - 관련: {is_relevant}, 카테고리: {category}, 신뢰도: {confidence_score:.2f}, 키워드: {found_keywords}")
 
@@ -132,77 +434,39 @@ class ArticleClassifier:
         Returns:
             True if 기술적 용어로 판단됨
         """
-        text_lower = text.lower()
-
-        # 제외 패턴 체크
-        for pattern in self.exclude_patterns:
-            if pattern in text_lower:
-                return True
-
-        # 'hashed' 또는 'Hashed'가 있는 경우 추가 확인
-        if 'hashed' in text_lower:
-            # 해시드 회사 관련 키워드가 있으면 기술적 용어 아님
-            for company_keyword in self.hashed_company_keywords:
-                if company_keyword.lower() in text_lower:
-                    return False
-
-            # 블록체인/투자 관련 컨텍스트가 있으면 회사로 판단
-            investment_context = ['투자', '벤처', 'vc', '펀딩', '포트폴리오', '암호화폐', '가상자산', '블록체인', 'web3']
-            for context in investment_context:
-                if context in text_lower:
-                    return False
-
-            # 위 조건에 해당하지 않고 'hashed'만 있는 경우 기술적 용어로 판단
-            # (단, 한글 '해시드'가 없는 경우에만)
-            if '해시드' not in text_lower:
-                return True
-
-        return False
+        return self.extract_features(text.lower()).is_technical
 
     def _classify_category(self, text: str) -> str:
         """텍스트를 기반으로 카테고리 분류"""
-        category_scores = {}
-
-        for category, keywords in self.category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            category_scores[category] = score
+        return self._category_from_features(self.extract_features(text))
 
+    def _category_from_features(self, features: ArticleFeatures) -> str:
+        """특징 벡터로 카테고리 분류 (키워드가 가장 많이 나온 카테고리)"""
         # 가장 높은 점수의 카테고리 반환
-        max_category = max(category_scores.items(), key=lambda x: x[1])
+        max_category = max(features.category_counts.items(), key=lambda x: x[1])
 
         if max_category[1] > 0:
             return max_category[0]
         else:
             return '기타'
 
-    def analyze_sentiment(self, title: str, description: str = "") -> str:
+    def analyze_sentiment(self, title: str, description: str = "", features: ArticleFeatures = None) -> str:
         """
         기사의 감성을 분석하여 긍정/부정/중립 판단
 
         Args:
             title: 기사 제목
             description: 기사 요약
+            features: extract_features 결과 (없으면 새로 계산)
 
         Returns:
             sentiment: 'positive', 'negative', 'neutral'
         """
-        text = f"{title} {description}".lower()
-
-        # 부정 키워드 카운트 (제목에 있으면 가중치 2배)
-        negative_score = 0
-        for keyword in self.negative_keywords:
-            if keyword in title.lower():
-                negative_score += 2
-            elif keyword in text:
-                negative_score += 1
-
-        # 긍정 키워드 카운트 (제목에 있으면 가중치 2배)
-        positive_score = 0
-        for keyword in self.positive_keywords:
-            if keyword in title.lower():
-                positive_score += 2
-            elif keyword in text:
-                positive_score += 1
+        features = features or self.extract_features(title, description)
+
+        # 부정/긍정 키워드 점수 (제목에 있으면 가중치 2배)
+        negative_score = features.negative_score
+        positive_score = features.positive_score
 
         # 감성 판정
         if negative_score > positive_score and negative_score >= 1:
@@ -212,28 +476,29 @@ class ArticleClassifier:
         else:
             return 'neutral'
 
-    def check_needs_response(self, title: str, description: str = "") -> bool:
+    def check_needs_response(self, title: str, description: str = "", features: ArticleFeatures = None) -> bool:
         """
         PR 대응 필요 여부 판단
 
         Args:
             title: 기사 제목
             description: 기사 요약
+            features: extract_features 결과 (없으면 새로 계산)
 
         Returns:
             needs_response: True/False
         """
-        text = f"{title} {description}".lower()
+        features = features or self.extract_features(title, description)
 
         # 대응 필요 키워드가 있으면 True
-        for keyword in self.response_keywords:
-            if keyword in text:
-                logger.debug(f"PR 대응 필요 키워드 발견: {keyword}")
-                return True
+        if features.response_keyword is not None:
+            logger.debug(f"PR 대응 필요 키워드 발견: {features.response_keyword}")
+            return True
 
         return False
 
-    def calculate_risk(self, title: str, description: str = "", sentiment: str = None) -> Tuple[str, int]:
+    def calculate_risk(self, title: str, description: str = "", sentiment: str = None,
+                       features: ArticleFeatures = None) -> Tuple[str, int]:
         """
         리스크 레벨 및 점수 계산
 
@@ -241,63 +506,40 @@ class ArticleClassifier:
             title: 기사 제목
             description: 기사 요약
             sentiment: 사전 분석된 감성 (optional)
+            features: extract_features 결과 (없으면 새로 계산)
 
         Returns:
             (risk_level, risk_score)
             - risk_level: 'red', 'amber', 'green'
             - risk_score: 0-100
         """
-        text = f"{title} {description}".lower()
+        features = features or self.extract_features(title, description)
 
         # 감성 분석 (사전 분석 결과가 없으면 새로 계산)
         if sentiment is None:
-            sentiment = self.analyze_sentiment(title, description)
-
-        # 고위험 키워드 (제목에 있으면 가중치 3배)
-        high_risk_keywords = [
-            '소송', '고소', '사기', '피해', '검찰', '수사', '횡령', '배임',
-            '경찰', '구속', '체포', '기소', '압수수색', '불법', '범죄'
-        ]
-
-        # 중위험 키워드
-        medium_risk_keywords = [
-            '논란', '의혹', '비판', '우려', '하락', '손실', '규제', '제재',
-            '경고', '위기', '실패', '철수', '폭락', '위반'
-        ]
-
-        risk_score = 0
+            sentiment = self.analyze_sentiment(title, description, features)
 
-        # 고위험 키워드 점수 계산
-        for keyword in high_risk_keywords:
-            if keyword in title.lower():
-                risk_score += 25  # 제목에 있으면 25점
-            elif keyword in text:
-                risk_score += 10  # 본문에 있으면 10점
-
-        # 중위험 키워드 점수 계산
-        for keyword in medium_risk_keywords:
-            if keyword in title.lower():
-                risk_score += 15  # 제목에 있으면 15점
-            elif keyword in text:
-                risk_score += 5   # 본문에 있으면 5점
+        # 고위험 키워드 (제목 25점/본문 10점) + 중위험 키워드 (제목 15점/본문 5점)
+        risk_score = features.high_risk_score + features.medium_risk_score
 
         # 감성에 따른 보정
+        weights = self.weights
         if sentiment == 'negative':
-            risk_score += 15
+            risk_score += weights['negative_risk']
         elif sentiment == 'positive':
-            risk_score = max(0, risk_score - 10)
+            risk_score = max(0, risk_score - weights['positive_risk'])
 
         # PR 대응 필요 시 추가 점수
-        if self.check_needs_response(title, description):
-            risk_score += 10
+        if features.response_keyword is not None:
+            risk_score += weights['response_risk']
 
         # 점수 제한 (0-100)
         risk_score = min(100, max(0, risk_score))
 
         # 레벨 결정
-        if risk_score >= 70:
+        if risk_score >= weights['red_threshold']:
             risk_level = 'red'
-        elif risk_score >= 40:
+        elif risk_score >= weights['amber_threshold']:
             risk_level = 'amber'
         else:
             risk_level = 'green'
@@ -305,6 +547,38 @@ class ArticleClassifier:
         logger.debug(f"리스크 계산 - 레벨: {risk_level}, 점수: {risk_score}")
         return risk_level, risk_score
 
+    def score_article(self, title: str, description: str = "") -> Dict:
+        """
+        기사 한 건의 분류 컬럼 값 계산
+
+        Args:
+            title: 기사 제목
+            description: 기사 요약
+
+        Returns:
+            CLASSIFICATION_COLUMNS 키와 matched_keywords(역색인용 매칭 키워드)의 딕셔너리
+        """
+        # 특징 추출은 기사당 한 번만 수행하고 모든 점수 계산이 공유
+        features = self.extract_features(title, description)
+
+        is_medical, category, confidence, keywords = self.classify_article(title, description, features)
+
+        # 감성 분석 및 리스크 레벨/점수 계산
+        sentiment = self.analyze_sentiment(title, description, features)
+        risk_level, risk_score = self.calculate_risk(title, description, sentiment, features)
+
+        return {
+            'is_medical': is_medical,
+            'category': category,
+            'confidence_score': confidence,
+            'keywords': keywords,
+            'sentiment': sentiment,
+            'needs_response': self.check_needs_response(title, description, features),
+            'risk_level': risk_level,
+            'risk_score': risk_score,
+            'matched_keywords': sorted(features.hits.text | features.hits.title)
+        }
+
     def batch_classify(self, articles: List[Dict]) -> List[Dict]:
         """
         여러 기사를 일괄 분류
@@ -318,27 +592,13 @@ class ArticleClassifier:
         classified_articles = []
 
         for article in articles:
-            title = article.get('title', '')
-            description = article.get('description', '')
-
-            is_medical, category, confidence, keywords = self.classify_article(title, description)
-
-            article['is_medical'] = is_medical
-            article['category'] = category
-            article['confidence_score'] = confidence
-            article['keywords'] = keywords
-
-            # 감성 분석 및 PR 대응 필요 여부
-            sentiment = self.analyze_sentiment(title, description)
-            article['sentiment'] = sentiment
-            article['needs_response'] = self.check_needs_response(title, description)
-
-            # 리스크 레벨 및 점수 계산
-            risk_level, risk_score = self.calculate_risk(title, description, sentiment)
-            article['risk_level'] = risk_level
-            article['risk_score'] = risk_score
+            title, description = article.get('title', ''), article.get('description', '')
+            article.update(self.score_article(title, description))
+            # 같은 내용/규칙이면 다음 수집·재분류에서 건너뛸 수 있도록 기록
+            article['content_hash'] = content_hash(title, description)
+            article['ruleset_version'] = self.ruleset_version
 
-            if is_medical:
+            if article['is_medical']:
                 classified_articles.append(article)
 
         logger.info(f"분류 완료: 전체 {len(articles)}개 중 관련 기사 {len(classified_articles)}개")
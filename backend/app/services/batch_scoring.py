@@ -0,0 +1,309 @@
+"""
+Vectorized batch scoring over a sparse article x keyword hit matrix
+"""
+import logging
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from app.services.article_classifier import ArticleClassifier, KeywordHits, match_automaton
+from app.services.keyword_automaton import KeywordAutomaton
+
+logger = logging.getLogger(__name__)
+
+
+class HitMatrix:
+    """
+    기사 x 키워드 매칭 행렬 (제목/제목+요약 두 채널, 0/1 CSR)
+
+    열은 vocabulary의 키워드 문자열에 대응하므로, 같은 키워드를 포함하는 다른
+    규칙(가중치)으로 텍스트를 다시 순회하지 않고 재채점할 수 있다.
+    """
+
+    def __init__(self, title: sparse.csr_matrix, text: sparse.csr_matrix, vocabulary: Sequence[str]):
+        self.title = title  # 제목에 있는 키워드
+        self.text = text  # 제목+요약 어디든 있는 키워드
+        self.vocabulary = list(vocabulary)
+        self.columns = {keyword: i for i, keyword in enumerate(self.vocabulary)}
+
+    def __len__(self):
+        return self.text.shape[0]
+
+    @classmethod
+    def from_hits(cls, hits: Iterable[KeywordHits], vocabulary: Sequence[str]) -> 'HitMatrix':
+        """match_keywords 결과 목록으로 행렬 생성"""
+        columns = {keyword: i for i, keyword in enumerate(vocabulary)}
+        channels = {'title': ([0], []), 'text': ([0], [])}
+        for hit in hits:
+            for name, keywords in (('title', hit.title), ('text', hit.text)):
+                indptr, indices = channels[name]
+                indices.extend(sorted(columns[keyword] for keyword in keywords))
+                indptr.append(len(indices))
+
+        shape = (len(channels['text'][0]) - 1, len(vocabulary))
+        matrices = {}
+        for name, (indptr, indices) in channels.items():
+            matrices[name] = sparse.csr_matrix(
+                (np.ones(len(indices), dtype=np.int8), np.array(indices, dtype=np.int32),
+                 np.array(indptr, dtype=np.int64)),
+                shape=shape
+            )
+        return cls(matrices['title'], matrices['text'], vocabulary)
+
+    def save(self, path: str):
+        """행렬과 어휘를 npz 파일로 저장"""
+        np.savez_compressed(
+            path,
+            vocabulary=np.array(self.vocabulary, dtype=str),
+            **{f"{name}_{part}": getattr(getattr(self, name), part)
+               for name in ('title', 'text') for part in ('data', 'indices', 'indptr')},
+            shape=np.array(self.text.shape)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'HitMatrix':
+        """save로 저장한 파일 읽기"""
+        with np.load(path) as data:
+            shape = tuple(data['shape'])
+            matrices = [
+                sparse.csr_matrix((data[f"{name}_data"], data[f"{name}_indices"], data[f"{name}_indptr"]),
+                                  shape=shape)
+                for name in ('title', 'text')
+            ]
+            return cls(matrices[0], matrices[1], data['vocabulary'].tolist())
+
+
+def shared_automaton(classifiers: Iterable[ArticleClassifier]) -> KeywordAutomaton:
+    """여러 분류기의 키워드를 합친 오토마톤 (한 번 순회한 행렬을 모든 분류기로 채점)"""
+    return KeywordAutomaton(keyword for classifier in classifiers for keyword in classifier._automaton.patterns)
+
+
+class BatchScorer:
+    """
+    ArticleClassifier의 점수 규칙을 가중치 벡터로 옮긴 배치 채점기
+
+    분류/감성/리스크 점수는 키워드 매칭의 선형 결합이므로, 배치 전체의 매칭 행렬과
+    가중치 벡터의 곱으로 계산한다. 결과는 ArticleClassifier.score_article과 비트 단위로 같다.
+    """
+
+    def __init__(self, classifier: ArticleClassifier):
+        self.classifier = classifier
+
+    def extract(self, articles: Iterable[Tuple[str, str]], automaton: KeywordAutomaton = None) -> HitMatrix:
+        """
+        (제목, 요약) 목록을 순회해 매칭 행렬 생성
+
+        Args:
+            articles: (title, description) 튜플 목록
+            automaton: 순회할 오토마톤 (없으면 분류기 오토마톤, 여러 규칙을 같은 행렬로
+                채점하려면 shared_automaton 결과)
+
+        Returns:
+            HitMatrix (어휘는 오토마톤의 키워드)
+        """
+        automaton = automaton or self.classifier._automaton
+        hits = (match_automaton(automaton, title or '', description or '') for title, description in articles)
+        return HitMatrix.from_hits(hits, automaton.patterns)
+
+    def _vectors(self, matrix: HitMatrix) -> Dict[str, np.ndarray]:
+        """행렬의 어휘 기준 가중치 벡터 (어휘에 없는 규칙 키워드가 있으면 ValueError)"""
+        classifier = self.classifier
+        columns = matrix.columns
+        missing = [keyword for keyword in classifier._automaton.patterns if keyword not in columns]
+        if missing:
+            raise ValueError(f"매칭 행렬 어휘에 없는 키워드: {missing[:10]}")
+
+        size = len(matrix.vocabulary)
+
+        def vector(dtype):
+            return np.zeros(size, dtype=dtype)
+
+        vectors = {
+            'relevance_title': vector(np.float64), 'relevance_body': vector(np.float64),
+            'found': vector(np.int64), 'company': vector(np.int64), 'exclude': vector(np.int64),
+            'context': vector(np.int64), 'response': vector(np.int64),
+            'negative_title': vector(np.int64), 'negative_body': vector(np.int64),
+            'positive_title': vector(np.int64), 'positive_body': vector(np.int64),
+            'risk_title': vector(np.int64), 'risk_body': vector(np.int64)
+        }
+        for keyword, keyword_lower, title_weight, body_weight in classifier._relevance_keywords:
+            vectors['relevance_title'][columns[keyword_lower]] += title_weight
+            vectors['relevance_body'][columns[keyword_lower]] += body_weight
+            vectors['found'][columns[keyword_lower]] += 1
+        for name, keywords in (('company', classifier._company_keywords),
+                               ('exclude', classifier._exclude_patterns),
+                               ('context', classifier._investment_context),
+                               ('response', classifier._response_rank)):
+            for keyword in keywords:
+                vectors[name][columns[keyword]] = 1
+        weights = classifier.weights
+        for name, keywords, title_weight, body_weight in (
+                ('negative', classifier.negative_keywords, weights['sentiment_title'], weights['sentiment_body']),
+                ('positive', classifier.positive_keywords, weights['sentiment_title'], weights['sentiment_body']),
+                ('risk', classifier.high_risk_keywords, weights['high_risk_title'], weights['high_risk_body']),
+                ('risk', classifier.medium_risk_keywords, weights['medium_risk_title'], weights['medium_risk_body'])):
+            for keyword in keywords:
+                vectors[f"{name}_title"][columns[keyword]] += title_weight
+                vectors[f"{name}_body"][columns[keyword]] += body_weight
+
+        categories = np.zeros((size, len(classifier._categories)), dtype=np.int64)
+        for index, keywords in enumerate(classifier.category_keywords.values()):
+            for keyword in keywords:
+                categories[columns[keyword], index] += 1
+        vectors['categories'] = categories
+        return vectors
+
+    def score(self, matrix: HitMatrix) -> Dict[str, np.ndarray]:
+        """
+        매칭 행렬 전체를 한 번에 채점
+
+        Args:
+            matrix: extract 결과 (또는 같은 키워드를 포함하는 저장된 행렬)
+
+        Returns:
+            컬럼별 배열 (keywords 제외, is_technical 추가)
+            - category: 카테고리 번호 (관련 없으면 -1, '기타'는 -2)
+            - sentiment: 0 neutral / 1 negative / 2 positive
+            - risk_level: 0 green / 1 amber / 2 red
+        """
+        v = self._vectors(matrix)
+        title, text = matrix.title, matrix.text
+        title_in_text = title.multiply(text).tocsr()
+        body_only = (text - title_in_text).tocsr()  # 요약에만 있는 키워드
+        weighted_body = (text.maximum(title) - title).tocsr()  # 제목에 없는 키워드 (제목/본문 가중 점수용)
+
+        def weighted(name):
+            return title @ v[f"{name}_title"] + weighted_body @ v[f"{name}_body"]
+
+        # 관련도 점수: 제목/본문 가중치가 0.5 단위라 합산 순서와 무관하게 정확하다
+        relevance = title_in_text @ v['relevance_title'] + body_only @ v['relevance_body']
+        found = text @ v['found']
+        company = (text @ v['company']) > 0
+        context = (text @ v['context']) > 0
+        columns = matrix.columns
+        has_hashed = self._column(text, columns.get('hashed'))
+        has_hashed_ko = self._column(text, columns.get('해시드'))
+        technical = ((text @ v['exclude']) > 0) | (has_hashed & ~(company | context | has_hashed_ko))
+
+        classifier = self.classifier
+        weights = classifier.weights
+        max_possible = (len(classifier.hashed_company_keywords) * weights['company_title'] +
+                        len(classifier.search_keywords) * weights['search_title'])
+        if max_possible > 0:
+            confidence = np.minimum(relevance / max_possible, 1.0)
+        else:
+            confidence = np.zeros(len(matrix), dtype=np.float64)
+        keyword_confidence = np.minimum(
+            weights['keyword_confidence_base'] + found * weights['keyword_confidence_step'], 1.0
+        )
+        confidence = np.where(company, np.maximum(confidence, weights['company_confidence']),
+                              np.where(found >= 1, np.maximum(confidence, keyword_confidence), confidence))
+        relevant = (confidence >= weights['min_confidence']) & (found >= 1) & ~technical
+        confidence = np.where(technical, 0.0, confidence)
+
+        category_counts = text @ v['categories']
+        category = np.argmax(category_counts, axis=1) if category_counts.shape[1] else np.zeros(len(matrix), int)
+        best = category_counts.max(axis=1) if category_counts.shape[1] else np.zeros(len(matrix), int)
+        category = np.where(best > 0, category, -2)
+        category = np.where(relevant, category, -1)
+
+        negative = weighted('negative')
+        positive = weighted('positive')
+        sentiment = np.where((negative > positive) & (negative >= 1), 1,
+                             np.where((positive > negative) & (positive >= 1), 2, 0))
+
+        needs_response = (text @ v['response']) > 0
+        risk = weighted('risk')
+        risk = np.where(sentiment == 1, risk + weights['negative_risk'],
+                        np.where(sentiment == 2, np.maximum(0, risk - weights['positive_risk']), risk))
+        risk = np.clip(risk + np.where(needs_response, weights['response_risk'], 0), 0, 100)
+        risk_level = np.where(risk >= weights['red_threshold'], 2,
+                              np.where(risk >= weights['amber_threshold'], 1, 0))
+
+        return {
+            'is_medical': relevant,
+            'is_technical': technical,
+            'category': category,
+            'confidence_score': confidence,
+            'sentiment': sentiment,
+            'needs_response': needs_response,
+            'risk_level': risk_level,
+            'risk_score': risk
+        }
+
+    @staticmethod
+    def _column(matrix: sparse.csr_matrix, column) -> np.ndarray:
+        """한 키워드 열의 존재 여부 (어휘에 없으면 모두 False)"""
+        if column is None:
+            return np.zeros(matrix.shape[0], dtype=bool)
+        return matrix[:, column].toarray().ravel() > 0
+
+    def keywords(self, matrix: HitMatrix, technical: np.ndarray = None) -> List[List[str]]:
+        """
+        기사별 발견 키워드 목록 (회사 키워드 → 검색 키워드 순서, 원문 표기)
+
+        Args:
+            matrix: 매칭 행렬
+            technical: 기술적 용어로 제외된 기사 (해당 행은 빈 목록)
+        """
+        # 관련도 키워드 열만 잘라, 키워드가 하나라도 있는 행만 순서대로 복원
+        entries: Dict[int, List[Tuple[int, str]]] = {}
+        for rank, (keyword, keyword_lower, _, _) in enumerate(self.classifier._relevance_keywords):
+            entries.setdefault(matrix.columns[keyword_lower], []).append((rank, keyword))
+        columns = sorted(entries, key=lambda column: entries[column][0][0])
+        groups = [entries[column] for column in columns]
+
+        result = [[] for _ in range(len(matrix))]
+        if not columns:
+            return result
+        text = matrix.text[:, columns].tocsr()
+        counts = np.diff(text.indptr)
+        for row in np.flatnonzero(counts).tolist():
+            if technical is not None and technical[row]:
+                continue
+            found = [entry for column in text.indices[text.indptr[row]:text.indptr[row + 1]].tolist()
+                     for entry in groups[column]]
+            found.sort()
+            result[row] = [keyword for _, keyword in found]
+        return result
+
+    def rows(self, matrix: HitMatrix, scores: Dict[str, np.ndarray] = None) -> List[Dict]:
+        """
+        채점 결과를 ArticleClassifier.score_article과 같은 형식의 딕셔너리 목록으로 변환
+
+        Args:
+            matrix: 매칭 행렬
+            scores: score 결과 (없으면 새로 계산)
+        """
+        scores = scores if scores is not None else self.score(matrix)
+        categories = self.classifier._categories
+        keywords = self.keywords(matrix, scores['is_technical'])
+
+        # 역색인용 매칭 키워드 (제목 또는 제목+요약에 나온 키워드)
+        present = matrix.text.maximum(matrix.title).tocsr()
+        present.sort_indices()
+        vocabulary = matrix.vocabulary
+
+        sentiments = ('neutral', 'negative', 'positive')
+        levels = ('green', 'amber', 'red')
+        result = []
+        for row, (relevant, category, confidence, sentiment, response, level, risk) in enumerate(zip(
+                scores['is_medical'].tolist(), scores['category'].tolist(),
+                scores['confidence_score'].tolist(), scores['sentiment'].tolist(),
+                scores['needs_response'].tolist(), scores['risk_level'].tolist(),
+                scores['risk_score'].tolist())):
+            result.append({
+                'is_medical': relevant,
+                'category': categories[category] if category >= 0 else ('기타' if category == -2 else None),
+                'confidence_score': confidence,
+                'keywords': keywords[row],
+                'sentiment': sentiments[sentiment],
+                'needs_response': response,
+                'risk_level': levels[level],
+                'risk_score': risk,
+                'matched_keywords': sorted(
+                    vocabulary[column] for column in present.indices[present.indptr[row]:present.indptr[row + 1]].tolist()
+                )
+            })
+        return result
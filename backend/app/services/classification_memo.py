@@ -0,0 +1,89 @@
+"""
+Skip rescoring stored articles whose text and ruleset have not changed
+"""
+import logging
+from contextlib import nullcontext
+from typing import Dict, List
+
+from flask import current_app, has_app_context
+
+from app.services.article_classifier import CLASSIFICATION_COLUMNS, content_hash
+from app.services.url_filter import get_url_filter
+
+logger = logging.getLogger(__name__)
+
+
+class MemoizedClassifier:
+    """
+    저장된 분류 결과를 재사용하는 분류 단계
+
+    ArticleClassifier와 같은 batch_classify 인터페이스를 제공한다. 이미 저장된
+    기사 중 내용 해시(content_hash)와 규칙 버전(ruleset_version)이 모두 같은 기사는
+    분류하지 않고 저장된 결과를 복사하며, 나머지만 안쪽 분류기로 넘긴다.
+    파이프라인의 분류 스레드에서도 쓸 수 있도록 생성 시점의 앱으로 컨텍스트를 연다.
+    """
+
+    def __init__(self, classifier):
+        """
+        Args:
+            classifier: ruleset_version과 batch_classify를 제공하는 분류기 (앱 컨텍스트 안에서 생성)
+        """
+        self.classifier = classifier
+        self.ruleset_version = classifier.ruleset_version
+        self.app = current_app._get_current_object()
+        # URL 필터는 DB에서 채우므로 호출 스레드(앱 컨텍스트)에서 미리 가져온다
+        self.url_filter = get_url_filter(self.app.config)
+        self.reused = 0
+
+    def _stored(self, keys: List[str]) -> Dict[str, Dict]:
+        """canonical_key별 저장된 분류 결과 (현재 규칙 버전인 기사만)"""
+        from app import db
+        from app.models.article import Article
+
+        columns = [getattr(Article, column) for column in CLASSIFICATION_COLUMNS]
+        with nullcontext() if has_app_context() else self.app.app_context():
+            rows = (db.session.query(Article.canonical_key, Article.content_hash, *columns)
+                    .filter(Article.canonical_key.in_(keys),
+                            Article.ruleset_version == self.ruleset_version)
+                    .all())
+        return {
+            row.canonical_key: {
+                'content_hash': row.content_hash,
+                **{column: getattr(row, column) for column in CLASSIFICATION_COLUMNS}
+            }
+            for row in rows
+        }
+
+    def batch_classify(self, articles: List[Dict]) -> List[Dict]:
+        """
+        내용과 규칙이 같은 저장 기사는 저장된 결과를 쓰고 나머지만 분류
+
+        Returns:
+            관련 기사 목록 (입력 순서 유지)
+        """
+        # URL 필터가 "없음"이라고 한 기사는 새 기사이므로 조회하지 않는다
+        keys = [
+            article['canonical_key'] for article in articles
+            if article.get('canonical_key') and
+            (self.url_filter is None or self.url_filter.might_contain(article['canonical_key']))
+        ]
+        stored = self._stored(keys) if keys else {}
+
+        pending = []
+        for article in articles:
+            memo = stored.get(article.get('canonical_key'))
+            if memo is not None:
+                digest = content_hash(article.get('title', ''), article.get('description', ''))
+                if memo['content_hash'] == digest:
+                    article.update(memo)
+                    article['ruleset_version'] = self.ruleset_version
+                    continue
+            pending.append(article)
+
+        if pending:
+            self.classifier.batch_classify(pending)
+        reused = len(articles) - len(pending)
+        if reused:
+            self.reused += reused
+            logger.info(f"내용/규칙이 같은 저장 기사 {reused}개는 분류 생략")
+        return [article for article in articles if article.get('is_medical')]
@@ -0,0 +1,223 @@
+"""
+Versioned classifier rule store with a process-wide compiled classifier cache
+"""
+import logging
+import math
+import threading
+import time
+from numbers import Real
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from app.models.classifier_rule_generation import ClassifierRuleGeneration
+from app.models.classifier_ruleset import ClassifierRuleset
+from app.services.article_classifier import ArticleClassifier, RULESET_LISTS, SCORING_REVISION
+
+logger = logging.getLogger(__name__)
+
+# 키워드 역색인 컬럼 길이 (ArticleKeyword.keyword)
+MAX_KEYWORD_LENGTH = 100
+
+# 관련도 가중치는 0.5 단위만 허용 (BatchScorer가 행렬 곱으로 합산해도 score_article과 같은 값)
+RELEVANCE_WEIGHTS = {'company_title', 'company_body', 'search_title', 'search_body'}
+# 감성/리스크 점수는 정수 (risk_score는 Integer 컬럼)
+INTEGER_WEIGHTS = {
+    'sentiment_title', 'sentiment_body', 'high_risk_title', 'high_risk_body',
+    'medium_risk_title', 'medium_risk_body', 'negative_risk', 'positive_risk', 'response_risk',
+    'red_threshold', 'amber_threshold'
+}
+
+_classifier: Optional[ArticleClassifier] = None
+_generation: Optional[int] = None
+_checked_at = 0.0
+_classifier_lock = threading.Lock()
+
+
+def get_classifier(config) -> ArticleClassifier:
+    """
+    프로세스 공용 분류기 (현재 세대의 규칙으로 한 번만 컴파일)
+
+    CLASSIFIER_RULES_CHECK_SECONDS마다 DB의 현재 세대 번호만 확인하고, 세대가
+    바뀐 경우에만 다시 컴파일한다. 게시된 규칙이 없으면 코드의 기본 규칙과
+    SEARCH_KEYWORDS를 쓴다. 앱 컨텍스트 안에서 호출해야 한다.
+    반환된 분류기는 여러 스레드가 공유하므로 수정하면 안 된다.
+    """
+    global _classifier, _generation, _checked_at
+    interval = config.get('CLASSIFIER_RULES_CHECK_SECONDS', 10)
+
+    with _classifier_lock:
+        now = time.monotonic()
+        if _classifier is not None and now - _checked_at < interval:
+            return _classifier
+
+        generation = _current_generation()
+        _checked_at = now
+        if generation is None:
+            # 세대 확인 실패: 컴파일된 분류기가 있으면 그대로 사용
+            if _classifier is not None:
+                return _classifier
+            generation = 0
+        if _classifier is None or generation != _generation:
+            _classifier = _load_classifier(config, generation)
+            _generation = generation
+        return _classifier
+
+
+def _current_generation() -> Optional[int]:
+    """DB의 현재 세대 번호 (조회 실패 시 None)"""
+    try:
+        return ClassifierRuleGeneration.current_generation()
+    except SQLAlchemyError as e:
+        logger.warning(f"분류 규칙 세대 조회 실패: {e}")
+        db.session.rollback()
+        return None
+
+
+def _load_classifier(config, generation: int) -> ArticleClassifier:
+    """세대의 규칙으로 분류기 컴파일 (0이면 기본 규칙)"""
+    if generation:
+        published = db.session.get(ClassifierRuleGeneration, generation)
+        rules = ClassifierRuleset.load_rules(published.version)
+        classifier = ArticleClassifier.from_ruleset(rules)
+    else:
+        classifier = ArticleClassifier(config.get('SEARCH_KEYWORDS'))
+    logger.info(f"분류 규칙 세대 {generation} 컴파일 (규칙 버전 {classifier.ruleset_version})")
+    return classifier
+
+
+def reset_classifier():
+    """다음 호출 때 현재 세대를 다시 확인하고 컴파일하도록 캐시 초기화"""
+    global _classifier, _generation, _checked_at
+    with _classifier_lock:
+        _classifier = None
+        _generation = None
+        _checked_at = 0.0
+
+
+def _keyword_list(name: str, value) -> list:
+    """키워드 목록 검증"""
+    if not isinstance(value, list):
+        raise ValueError(f"{name}: 문자열 목록이어야 합니다")
+    for keyword in value:
+        if not isinstance(keyword, str) or not keyword.strip():
+            raise ValueError(f"{name}: 빈 문자열이 아닌 문자열만 허용됩니다 ({keyword!r})")
+        if len(keyword) > MAX_KEYWORD_LENGTH:
+            raise ValueError(f"{name}: 키워드는 {MAX_KEYWORD_LENGTH}자 이하여야 합니다 ({keyword[:20]}...)")
+    return list(value)
+
+
+def validate_rules(rules: Dict, base: Dict) -> Dict:
+    """
+    게시할 규칙 검증 후 현재 규칙에 병합
+
+    Args:
+        rules: ruleset() 형식의 일부 또는 전체 (category_keywords는 [[카테고리, 키워드 목록]]
+            또는 {카테고리: 키워드 목록}, weights는 바꿀 항목만)
+        base: 현재 규칙 (ArticleClassifier.ruleset())
+
+    Returns:
+        병합된 전체 규칙
+
+    Raises:
+        ValueError: 알 수 없는 항목이거나 형식이 잘못된 경우
+    """
+    if not isinstance(rules, dict) or not rules:
+        raise ValueError("규칙은 비어 있지 않은 객체여야 합니다")
+
+    known = {'revision', 'search_keywords', 'category_keywords', 'weights', *RULESET_LISTS}
+    unknown = sorted(set(rules) - known)
+    if unknown:
+        raise ValueError(f"알 수 없는 규칙 항목: {', '.join(unknown)}")
+    if rules.get('revision', SCORING_REVISION) != SCORING_REVISION:
+        raise ValueError(f"채점 방식 revision이 다릅니다 (현재 {SCORING_REVISION})")
+
+    merged = {**base, 'revision': SCORING_REVISION}
+    for name in ['search_keywords', *RULESET_LISTS]:
+        if name in rules:
+            merged[name] = _keyword_list(name, rules[name])
+
+    if 'category_keywords' in rules:
+        categories = rules['category_keywords']
+        if isinstance(categories, dict):
+            categories = list(categories.items())
+        if not isinstance(categories, list) or not categories:
+            raise ValueError("category_keywords: [[카테고리, 키워드 목록]] 형식이어야 합니다")
+        pairs = []
+        for pair in categories:
+            if not isinstance(pair, (list, tuple)) or len(pair) != 2 or not isinstance(pair[0], str) or not pair[0]:
+                raise ValueError("category_keywords: [[카테고리, 키워드 목록]] 형식이어야 합니다")
+            pairs.append([pair[0], _keyword_list(f"category_keywords.{pair[0]}", pair[1])])
+        if len({category for category, _ in pairs}) != len(pairs):
+            raise ValueError("category_keywords: 카테고리 이름이 중복됩니다")
+        merged['category_keywords'] = pairs
+
+    if 'weights' in rules:
+        weights = rules['weights']
+        if not isinstance(weights, dict):
+            raise ValueError("weights: 객체여야 합니다")
+        unknown = sorted(set(weights) - set(base['weights']))
+        if unknown:
+            raise ValueError(f"알 수 없는 가중치: {', '.join(unknown)}")
+        checked = {}
+        for name, value in weights.items():
+            if isinstance(value, bool) or not isinstance(value, Real) or not math.isfinite(value):
+                raise ValueError(f"weights.{name}: 숫자여야 합니다")
+            if name in INTEGER_WEIGHTS:
+                if value != int(value):
+                    raise ValueError(f"weights.{name}: 정수여야 합니다")
+                value = int(value)
+            elif name in RELEVANCE_WEIGHTS and value * 2 != int(value * 2):
+                raise ValueError(f"weights.{name}: 0.5 단위여야 합니다")
+            checked[name] = value
+        merged['weights'] = {**base['weights'], **checked}
+
+    return merged
+
+
+def compile_candidate(rules: Dict, base: ArticleClassifier) -> ArticleClassifier:
+    """
+    바꿀 규칙을 기준 분류기의 규칙에 병합해 후보 분류기 컴파일
+
+    Raises:
+        ValueError: 규칙 형식이 잘못된 경우
+    """
+    return ArticleClassifier.from_ruleset(validate_rules(rules, base.ruleset()))
+
+
+def publish_rules(config, rules: Dict, published_by: int = None,
+                  note: str = None) -> Tuple[ClassifierRuleGeneration, bool]:
+    """
+    새 규칙을 다음 세대로 게시 (커밋 포함)
+
+    다른 프로세스는 CLASSIFIER_RULES_CHECK_SECONDS 안에 세대 변경을 보고 다시 컴파일한다.
+    이미 저장된 기사는 reclassify_articles.py가 바뀐 키워드가 나온 기사만 재분류한다.
+
+    Args:
+        config: Flask 앱 설정
+        rules: 바꿀 규칙 (validate_rules 참고)
+        published_by: 게시한 사용자 ID
+        note: 변경 사유
+
+    Returns:
+        (현재 세대, 새 세대를 만들었는지). 현재 규칙과 같으면 새 세대를 만들지 않는다.
+
+    Raises:
+        ValueError: 규칙 형식이 잘못된 경우
+    """
+    current = get_classifier(config)
+    classifier = compile_candidate(rules, current)
+
+    latest = ClassifierRuleGeneration.current()
+    current_version = latest.version if latest else current.ruleset_version
+    if classifier.ruleset_version == current_version:
+        return latest, False
+
+    generation = ClassifierRuleGeneration.publish(classifier, published_by=published_by, note=note)
+    db.session.commit()
+    logger.info(f"분류 규칙 세대 {generation.generation} 게시 (규칙 버전 {generation.version})")
+
+    # 이 프로세스는 바로 새 규칙 사용
+    reset_classifier()
+    return generation, True
@@ -0,0 +1,294 @@
+"""
+Background collection jobs: submit returns a job id, a worker pool runs run_collection.
+Runs are single-flight across threads and processes via a DB lease.
+"""
+import logging
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app import db
+from app.models.collection_job import CollectionJob
+from app.models.api_quota import ApiQuotaUsage
+from app.models.lease import Lease
+from app.models.query_velocity import QueryVelocity
+from app.services.content_fetcher import start_content_fetch
+from app.services.ingestion import run_collection
+from app.services.naver_client import KST, kst_today
+from app.services.poll_scheduler import PollScheduler
+from app.services.query_planner import QueryPlanner
+
+logger = logging.getLogger(__name__)
+
+# 수집 단일 실행 임대 이름
+COLLECTION_LEASE = 'collection'
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(config) -> ThreadPoolExecutor:
+    """프로세스 공용 수집 작업 스레드 풀 (처음 제출 시 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.get('COLLECTION_JOB_WORKERS', 1),
+                thread_name_prefix='collection-job'
+            )
+        return _executor
+
+
+def submit_collection(app, requested_by: int = None, queries: List[str] = None) -> Tuple[CollectionJob, bool]:
+    """
+    수집 작업을 등록하고 백그라운드 스레드 풀에서 실행 (바로 반환, 단일 실행)
+
+    DB 임대(Lease 'collection')로 프로세스/스레드와 무관하게 수집은 한 번에 하나만
+    실행한다. 진행 중인 수집이 요청한 쿼리를 모두 수집하면 새로 시작하지 않고 그
+    작업을 돌려준다. 일부만 수집하면 (적응형 스케줄의 부분 수집) 임대가 반납된 뒤
+    실행할 대기 작업을 등록하거나, 요청을 포함하는 대기 작업이 이미 있으면 그 작업을 돌려준다.
+
+    Args:
+        app: Flask 앱 (작업 스레드에서 앱 컨텍스트 생성)
+        requested_by: 요청한 사용자 ID
+        queries: 수집할 쿼리 (기본값: SEARCH_KEYWORDS 전체)
+
+    Returns:
+        (CollectionJob, 진행 중이거나 대기 중인 작업에 합류했는지)
+    """
+    all_queries = QueryPlanner.from_config(app.config).queries
+    requested = set(queries or all_queries)
+    ttl = _lease_ttl(app.config)
+    # 응답이 없는 작업 정리 (보유 임대도 같은 시간이 지나면 만료됨)
+    CollectionJob.expire_stale(ttl)
+    db.session.commit()
+
+    for _ in range(3):
+        job_id = uuid.uuid4().hex
+        if Lease.acquire(COLLECTION_LEASE, job_id, ttl):
+            # 임대와 작업 행을 같은 커밋으로 저장 (임대 보유자 작업은 항상 조회 가능)
+            job = CollectionJob(id=job_id, requested_by=requested_by, queries=queries)
+            db.session.add(job)
+            db.session.commit()
+            try:
+                _get_executor(app.config).submit(_run_job, app, job.id, queries)
+            except Exception:
+                _finish(job.id, status='failed', error='작업 실행기 시작 실패')
+                raise
+            logger.info(f"수집 작업 등록: {job.id}")
+            return job, False
+
+        db.session.rollback()
+        holder = Lease.holder_of(COLLECTION_LEASE)
+        job = db.session.get(CollectionJob, holder) if holder else None
+        if job is not None:
+            if requested <= set(job.queries or all_queries):
+                logger.info(f"진행 중인 수집 작업 {job.id}에 합류")
+                return job, True
+            return _queue_after_lease(app, requested_by, queries, requested, all_queries)
+        # 조회 사이에 임대가 반납됨 → 다시 획득 시도
+
+    raise RuntimeError('수집 잠금을 획득하지 못했습니다')
+
+
+def _queue_after_lease(app, requested_by: Optional[int], queries: Optional[List[str]], requested: set,
+                       all_queries: List[str]) -> Tuple[CollectionJob, bool]:
+    """진행 중인 수집이 요청한 쿼리를 모두 포함하지 않을 때: 임대가 반납되면 실행할 작업 등록"""
+    waiting = (CollectionJob.query
+               .filter(CollectionJob.status == 'queued', CollectionJob.stage == 'waiting')
+               .order_by(CollectionJob.created_at).all())
+    for job in waiting:
+        if requested <= set(job.queries or all_queries):
+            logger.info(f"대기 중인 수집 작업 {job.id}에 합류")
+            return job, True
+
+    job = CollectionJob(requested_by=requested_by, queries=queries, stage='waiting')
+    db.session.add(job)
+    db.session.commit()
+    threading.Thread(target=_wait_for_lease, args=(app, job.id, queries),
+                     name=f'collection-wait-{job.id[:8]}', daemon=True).start()
+    logger.info(f"수집 작업 등록: {job.id} (진행 중인 수집이 끝난 뒤 실행)")
+    return job, False
+
+
+def _wait_for_lease(app, job_id: str, queries: Optional[List[str]]):
+    """대기 스레드: 수집 임대를 얻을 때까지 하트비트를 기록하며 기다린 뒤 작업 스레드 풀에 제출"""
+    with app.app_context():
+        try:
+            ttl = _lease_ttl(app.config)
+            interval = app.config.get('COLLECTION_JOB_PROGRESS_SECONDS', 1.0)
+            while not Lease.acquire(COLLECTION_LEASE, job_id, ttl):
+                db.session.rollback()
+                job = db.session.get(CollectionJob, job_id, populate_existing=True)
+                if job is None or job.status != 'queued':
+                    # 응답 지연으로 실패 처리된 작업
+                    return
+                CollectionJob.update_state(job_id)
+                db.session.commit()
+                time.sleep(interval)
+
+            # 임대와 단계 변경을 같은 커밋으로 저장
+            CollectionJob.update_state(job_id, stage='queued')
+            db.session.commit()
+            _get_executor(app.config).submit(_run_job, app, job_id, queries)
+
+        except Exception as e:
+            logger.error(f"수집 작업 {job_id} 대기 중 오류: {e}")
+            db.session.rollback()
+            try:
+                _finish(job_id, status='failed', error=str(e))
+            except Exception as record_error:
+                logger.error(f"수집 작업 {job_id} 실패 기록 중 오류: {record_error}")
+                db.session.rollback()
+        finally:
+            db.session.remove()
+
+
+def collect_due_queries(app) -> Optional[CollectionJob]:
+    """
+    적응형 스케줄 1회 확인: 폴링 간격이 지난 쿼리가 있으면 수집 작업 등록 (기다리지 않음)
+
+    스케줄러 리더가 ADAPTIVE_TICK_SECONDS마다 호출한다. 간격은 쿼리별 유입 속도로 정하고,
+    오늘(KST) 남은 API 호출 예산을 남은 시간에 나눠 쓰도록 늘린다.
+
+    Returns:
+        등록했거나 합류한 CollectionJob (수집할 쿼리가 없으면 None)
+    """
+    config = app.config
+    scheduler = PollScheduler.from_config(config)
+    queries = QueryPlanner.from_config(config).queries
+    states = QueryVelocity.load_states(queries)
+
+    credentials = config.get('NAVER_CREDENTIALS') or []
+    used_today = sum(ApiQuotaUsage.load_usage([c[0] for c in credentials], kst_today()).values())
+    now_kst = datetime.now(KST)
+    midnight = datetime.combine(now_kst.date() + timedelta(days=1), datetime.min.time(), tzinfo=KST)
+    factor = scheduler.budget_factor(states, queries, used_today, (midnight - now_kst).total_seconds())
+    db.session.commit()
+
+    due = scheduler.due(queries, states, datetime.utcnow(), factor)
+    if not due:
+        if math.isinf(factor):
+            logger.debug(f"오늘 적응형 수집 호출 예산 소진 ({used_today}/{scheduler.daily_budget})")
+        return None
+
+    logger.info(f"적응형 수집: {due} (간격 배율 {factor:.2f})")
+    job, _ = submit_collection(app, queries=None if len(due) == len(queries) else due)
+    return job
+
+
+def wait_for_job(config, job_id: str, poll_interval: float = 1.0) -> CollectionJob:
+    """
+    수집 작업이 끝날 때까지 대기 (다른 프로세스가 실행 중인 작업도 DB로 확인)
+
+    작업 프로세스가 응답하지 않으면 get_job이 실패로 정리하므로 무한히 기다리지 않는다.
+
+    Returns:
+        끝난 CollectionJob (status가 'succeeded' 또는 'failed')
+    """
+    while True:
+        # 새 트랜잭션에서 최신 상태 조회
+        db.session.rollback()
+        job = get_job(config, job_id)
+        if job is None or job.status in ('succeeded', 'failed'):
+            return job
+        time.sleep(poll_interval)
+
+
+def get_job(config, job_id: str) -> Optional[CollectionJob]:
+    """
+    수집 작업 조회 (진행 상황이 오래 갱신되지 않은 작업은 실패로 정리)
+
+    Args:
+        config: Flask 앱 설정
+        job_id: 작업 ID
+
+    Returns:
+        CollectionJob (없으면 None)
+    """
+    CollectionJob.expire_stale(_lease_ttl(config))
+    # 정리한 작업이 없어도 커밋해 쓰기 트랜잭션을 바로 끝냄 (SQLite 잠금 유지 방지)
+    db.session.commit()
+    return db.session.get(CollectionJob, job_id, populate_existing=True)
+
+
+def _lease_ttl(config) -> timedelta:
+    """수집 임대 유효 시간 (진행 상황 하트비트가 이 시간 동안 없으면 만료)"""
+    return timedelta(seconds=config.get('COLLECTION_JOB_STALE_SECONDS', 600))
+
+
+class CollectionLeaseLost(Exception):
+    """응답 지연으로 수집 임대가 만료돼 다른 작업에 넘어감"""
+
+
+class _ProgressReporter:
+    """run_collection 진행 콜백을 작업 행에 기록하고 수집 임대 갱신 (단계가 바뀌거나 interval마다)"""
+
+    def __init__(self, job_id: str, interval: float, ttl: timedelta):
+        self.job_id = job_id
+        self.interval = interval
+        self.ttl = ttl
+        self._stage = None
+        self._reported_at = 0.0
+
+    def __call__(self, stage: str, stats: Dict[str, int]):
+        now = time.monotonic()
+        if stage == self._stage and now - self._reported_at < self.interval:
+            return
+        self._stage = stage
+        self._reported_at = now
+        try:
+            CollectionJob.update_state(self.job_id, stage=stage, counts=dict(stats))
+            renewed = Lease.renew(COLLECTION_LEASE, self.job_id, self.ttl)
+            db.session.commit()
+        except Exception as e:
+            # 진행 상황 기록 실패로 수집을 중단하지 않는다
+            logger.warning(f"수집 작업 {self.job_id} 진행 상황 기록 실패: {e}")
+            db.session.rollback()
+            return
+        if not renewed:
+            # 다른 작업이 이미 수집 중이므로 중복 수집하지 않도록 중단
+            raise CollectionLeaseLost(f"수집 임대가 다른 작업에 넘어감: {self.job_id}")
+
+
+def _finish(job_id: str, **values):
+    """작업 종료 상태 기록과 수집 임대 반납을 한 커밋으로 수행"""
+    CollectionJob.update_state(job_id, finished_at=datetime.utcnow(), **values)
+    Lease.release(COLLECTION_LEASE, job_id)
+    db.session.commit()
+
+
+def _run_job(app, job_id: str, queries: List[str] = None):
+    """작업 스레드: 앱 컨텍스트에서 수집 1회 실행 후 결과/오류 기록, 수집 임대 반납"""
+    with app.app_context():
+        try:
+            CollectionJob.update_state(job_id, status='running', stage='preparing', started_at=datetime.utcnow())
+            db.session.commit()
+
+            reporter = _ProgressReporter(
+                job_id, app.config.get('COLLECTION_JOB_PROGRESS_SECONDS', 1.0), _lease_ttl(app.config)
+            )
+            stats = run_collection(app.config, progress=reporter, queries=queries)
+            logger.info(f"수집 작업 {job_id} 완료: 수집 {stats['collected']}개, 관련 {stats['relevant']}개, "
+                        f"저장 {stats['inserted']}개, 중복 스킵 {stats['skipped']}개")
+
+            _finish(job_id, status='succeeded', stage='done', counts=stats)
+
+            # 원문 본문 수집 (별도 백그라운드 스레드)
+            if stats['inserted'] and app.config.get('CONTENT_FETCH_ENABLED'):
+                start_content_fetch(app)
+
+        except Exception as e:
+            logger.error(f"수집 작업 {job_id} 실패: {e}")
+            db.session.rollback()
+            try:
+                _finish(job_id, status='failed', error=str(e))
+            except Exception as record_error:
+                logger.error(f"수집 작업 {job_id} 실패 기록 중 오류: {record_error}")
+                db.session.rollback()
+        finally:
+            db.session.remove()
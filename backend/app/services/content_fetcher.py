@@ -0,0 +1,295 @@
+"""
+Full-text article fetcher with per-domain politeness
+"""
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+
+class DomainThrottle:
+    """도메인별 동시 접속 수 제한 및 요청 간 최소 간격 유지"""
+
+    def __init__(self, max_connections: int = 2, min_interval: float = 1.0):
+        self.max_connections = max(1, max_connections)
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, domain: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(domain)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_connections)
+                self._semaphores[domain] = semaphore
+            return semaphore
+
+    def acquire(self, domain: str):
+        """도메인 슬롯을 얻고, 직전 요청으로부터 min_interval이 지날 때까지 대기"""
+        self._semaphore(domain).acquire()
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_allowed.get(domain, 0.0))
+            self._next_allowed[domain] = start_at + self.min_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def release(self, domain: str):
+        self._semaphore(domain).release()
+
+
+class _ArticleTextTarget:
+    """
+    lxml 파서 타깃: 스트리밍으로 들어오는 HTML에서 본문 텍스트만 모은다
+
+    본문 컨테이너(네이버 뉴스 #dic_area 등 또는 <article>)가 있으면 그 안의
+    텍스트를, 없으면 충분히 긴 <p> 문단들을 본문으로 사용한다.
+    """
+
+    BODY_IDS = {'dic_area', 'newsct_article', 'articlebodycontents', 'articlebody', 'article_body',
+                'article-body', 'news_body_area', 'articletxt', 'article_txt'}
+    SKIP_TAGS = {'script', 'style', 'noscript', 'iframe', 'svg', 'button', 'figcaption', 'form'}
+    BLOCK_TAGS = {'p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'tr', 'section', 'article'}
+    MIN_PARAGRAPH_LENGTH = 30
+
+    def __init__(self):
+        self._stack = []  # (tag, is_body, is_skip)
+        self._body_depth = 0
+        self._skip_depth = 0
+        self._paragraph_depth = 0
+        self._body_parts = []
+        self._paragraph = []
+        self._paragraphs = []
+
+    def start(self, tag, attrib):
+        tag = tag.lower() if isinstance(tag, str) else ''
+        element_id = (attrib.get('id') or '').lower()
+        is_body = element_id in self.BODY_IDS or tag == 'article' or attrib.get('itemprop') == 'articleBody'
+        is_skip = tag in self.SKIP_TAGS
+        self._stack.append((tag, is_body, is_skip))
+
+        if is_body:
+            self._body_depth += 1
+        if is_skip:
+            self._skip_depth += 1
+        if tag == 'p':
+            self._paragraph_depth += 1
+        if self._body_depth and tag in self.BLOCK_TAGS:
+            self._body_parts.append('\n')
+
+    def end(self, tag):
+        if not self._stack:
+            return
+        tag, is_body, is_skip = self._stack.pop()
+        if is_body:
+            self._body_depth -= 1
+        if is_skip:
+            self._skip_depth -= 1
+        if tag == 'p':
+            self._paragraph_depth -= 1
+            text = ' '.join(''.join(self._paragraph).split())
+            if len(text) >= self.MIN_PARAGRAPH_LENGTH:
+                self._paragraphs.append(text)
+            self._paragraph = []
+
+    def data(self, text):
+        if self._skip_depth:
+            return
+        if self._body_depth:
+            self._body_parts.append(text)
+        if self._paragraph_depth:
+            self._paragraph.append(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self) -> str:
+        body = '\n'.join(
+            ' '.join(line.split())
+            for line in ''.join(self._body_parts).splitlines()
+        )
+        body = '\n'.join(line for line in body.splitlines() if line)
+        if len(body) >= self.MIN_PARAGRAPH_LENGTH:
+            return body
+        return '\n'.join(self._paragraphs)
+
+
+class ContentFetcher:
+    """기사 원문 페이지를 받아 본문 텍스트를 추출하는 수집기"""
+
+    USER_AGENT = 'Mozilla/5.0 (compatible; HashedArticleBot/1.0)'
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(self, max_workers: int = 8, per_domain_connections: int = 2,
+                 per_domain_delay: float = 1.0, max_bytes: int = 2 * 1024 * 1024,
+                 timeout: float = 10, max_content_length: int = 20000):
+        self.max_workers = max(1, max_workers)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.max_content_length = max_content_length
+        self.throttle = DomainThrottle(per_domain_connections, per_domain_delay)
+
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': self.USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @classmethod
+    def from_config(cls, config) -> 'ContentFetcher':
+        """앱 설정으로 수집기 생성"""
+        return cls(
+            max_workers=config.get('CONTENT_FETCH_WORKERS', 8),
+            per_domain_connections=config.get('CONTENT_FETCH_PER_DOMAIN', 2),
+            per_domain_delay=config.get('CONTENT_FETCH_DOMAIN_DELAY', 1.0),
+            max_bytes=config.get('CONTENT_FETCH_MAX_BYTES', 2 * 1024 * 1024)
+        )
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def fetch(self, url: str) -> Optional[str]:
+        """
+        기사 페이지를 스트리밍으로 받아 본문 텍스트 추출
+
+        Args:
+            url: 기사 URL (리다이렉트는 따라간다)
+
+        Returns:
+            본문 텍스트 (실패 시 None)
+        """
+        domain = urlsplit(url).netloc.lower()
+        if not domain:
+            return None
+
+        self.throttle.acquire(domain)
+        try:
+            with self.session.get(url, stream=True, timeout=self.timeout, allow_redirects=True) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type.lower():
+                    logger.debug(f"HTML이 아닌 응답 건너뜀: {url} ({content_type})")
+                    return None
+
+                text = self._extract(response)
+        except requests.RequestException as e:
+            logger.warning(f"본문 수집 실패: {url} ({e})")
+            return None
+        except etree.LxmlError as e:
+            logger.warning(f"본문 파싱 실패: {url} ({e})")
+            return None
+        except Exception as e:
+            # 한 페이지의 예기치 않은 오류로 배치 전체가 중단되지 않도록 실패로 처리
+            logger.warning(f"본문 수집 중 오류: {url} ({e})")
+            return None
+        finally:
+            self.throttle.release(domain)
+
+        return text[:self.max_content_length] if text else None
+
+    def fetch_many(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """여러 URL을 제한된 워커 풀로 동시에 수집"""
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self.fetch, urls)))
+
+    def _extract(self, response: requests.Response) -> str:
+        """응답 본문을 청크 단위로 파서에 흘려 넣으며 텍스트 추출 (max_bytes에서 중단)"""
+        try:
+            parser = etree.HTMLParser(target=_ArticleTextTarget(), encoding=self._encoding(response))
+        except (LookupError, ValueError):
+            # 알 수 없는 charset은 무시하고 lxml이 meta 태그로 판단
+            logger.debug(f"알 수 없는 charset 무시: {response.url}")
+            parser = etree.HTMLParser(target=_ArticleTextTarget())
+        received = 0
+        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_bytes:
+                logger.debug(f"응답 크기 제한 초과, 일부만 사용: {response.url}")
+                break
+            parser.feed(chunk)
+        return parser.close()
+
+    def _encoding(self, response: requests.Response) -> Optional[str]:
+        """Content-Type 헤더의 charset (없으면 lxml이 meta 태그로 판단)"""
+        content_type = response.headers.get('Content-Type', '')
+        for part in content_type.split(';'):
+            key, _, value = part.strip().partition('=')
+            if key.lower() == 'charset' and value:
+                return value.strip('"\' ').lower()
+        return None
+
+
+def fill_article_content(app, article_ids: List[int] = None, limit: int = 200, batch_size: int = 20):
+    """
+    본문이 비어 있는 기사의 원문을 수집해 저장
+
+    수집에 실패한 기사는 빈 문자열로 표시해 다시 시도하지 않는다.
+
+    Args:
+        app: Flask 앱 (백그라운드 스레드에서 호출되므로 직접 앱 컨텍스트를 연다)
+        article_ids: 대상 기사 ID (None이면 본문 없는 최신 기사)
+        limit: 최대 처리 기사 수
+        batch_size: 커밋 단위
+    """
+    from app import db
+    from app.models.article import Article
+
+    with app.app_context():
+        query = Article.query.filter(Article.content.is_(None))
+        if article_ids is not None:
+            if not article_ids:
+                return 0
+            query = query.filter(Article.id.in_(article_ids))
+        targets = [(a.id, a.url) for a in query.order_by(Article.id.desc()).limit(limit).all()]
+        if not targets:
+            return 0
+
+        filled = 0
+        with ContentFetcher.from_config(app.config) as fetcher:
+            for i in range(0, len(targets), batch_size):
+                batch = targets[i:i + batch_size]
+                try:
+                    contents = fetcher.fetch_many([url for _, url in batch])
+                    for article_id, url in batch:
+                        content = contents.get(url)
+                        Article.query.filter_by(id=article_id).update(
+                            {Article.content: content or ''}, synchronize_session=False
+                        )
+                        filled += 1 if content else 0
+                    db.session.commit()
+                except Exception as e:
+                    logger.error(f"본문 저장 중 오류: {e}")
+                    db.session.rollback()
+
+        logger.info(f"본문 수집 완료: {len(targets)}개 중 {filled}개")
+        return filled
+
+
+def start_content_fetch(app, article_ids: List[int] = None):
+    """수집 흐름을 막지 않도록 백그라운드 스레드에서 본문 수집 시작"""
+    thread = threading.Thread(
+        target=fill_article_content,
+        args=(app, article_ids),
+        name='content-fetch',
+        daemon=True
+    )
+    thread.start()
+    return thread
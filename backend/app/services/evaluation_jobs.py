@@ -0,0 +1,99 @@
+"""
+Background ruleset evaluation jobs: the admin endpoint returns a job id, a single worker thread runs evaluate_ruleset
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from app import db
+from app.models.ruleset_evaluation_job import RulesetEvaluationJob
+from app.services.classifier_rules import compile_candidate, get_classifier
+from app.services.ruleset_evaluation import evaluate_ruleset
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """프로세스 공용 평가 작업 스레드 (평가는 작업 프로세스를 여러 개 쓰므로 한 번에 하나만 실행)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ruleset-evaluation')
+        return _executor
+
+
+def submit_evaluation(app, rules: Dict, samples: int = 5, requested_by: int = None) -> RulesetEvaluationJob:
+    """
+    후보 규칙 평가 작업을 등록하고 백그라운드에서 실행 (바로 반환)
+
+    Args:
+        app: Flask 앱 (작업 스레드에서 앱 컨텍스트 생성)
+        rules: 바꿀 규칙 (validate_rules 참고)
+        samples: 변경 종류별 표본 기사 수
+        requested_by: 요청한 사용자 ID
+
+    Returns:
+        등록된 RulesetEvaluationJob
+
+    Raises:
+        ValueError: 규칙 형식이 잘못된 경우 (작업을 등록하지 않음)
+    """
+    # 형식 오류는 요청에서 바로 알려준다
+    compile_candidate(rules, get_classifier(app.config))
+
+    job = RulesetEvaluationJob(rules=rules, samples=samples, requested_by=requested_by)
+    db.session.add(job)
+    db.session.commit()
+    _get_executor().submit(_run_job, app, job.id)
+    logger.info(f"분류 규칙 평가 작업 등록: {job.id}")
+    return job
+
+
+def get_evaluation(config, job_id: str) -> Optional[RulesetEvaluationJob]:
+    """
+    평가 작업 조회 (RULESET_EVALUATION_TIMEOUT_SECONDS 안에 끝나지 않은 작업은 실패로 정리)
+
+    Returns:
+        RulesetEvaluationJob (없으면 None)
+    """
+    RulesetEvaluationJob.expire_stale(timedelta(seconds=config.get('RULESET_EVALUATION_TIMEOUT_SECONDS', 1800)))
+    db.session.commit()
+    return db.session.get(RulesetEvaluationJob, job_id, populate_existing=True)
+
+
+def _run_job(app, job_id: str):
+    """작업 스레드: 현재 규칙과 후보 규칙을 저장된 기사 전체에 적용해 보고서 기록"""
+    with app.app_context():
+        try:
+            job = db.session.get(RulesetEvaluationJob, job_id)
+            rules, samples = job.rules, job.samples
+            RulesetEvaluationJob.update_state(job_id, status='running', started_at=datetime.utcnow())
+            db.session.commit()
+
+            current = get_classifier(app.config)
+            report = evaluate_ruleset(
+                current, compile_candidate(rules, current),
+                workers=app.config.get('CLASSIFY_WORKERS', 0),
+                chunk_size=app.config.get('CLASSIFY_CHUNK_SIZE', 2000),
+                samples=samples
+            )
+
+            RulesetEvaluationJob.update_state(job_id, status='succeeded', report=report, finished_at=datetime.utcnow())
+            db.session.commit()
+
+        except Exception as e:
+            logger.error(f"분류 규칙 평가 작업 {job_id} 실패: {e}")
+            db.session.rollback()
+            try:
+                RulesetEvaluationJob.update_state(job_id, status='failed', error=str(e), finished_at=datetime.utcnow())
+                db.session.commit()
+            except Exception as record_error:
+                logger.error(f"분류 규칙 평가 작업 {job_id} 실패 기록 중 오류: {record_error}")
+                db.session.rollback()
+        finally:
+            db.session.remove()
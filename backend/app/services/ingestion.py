@@ -0,0 +1,330 @@
+"""
+Article ingestion: bulk upserts and the shared collection run
+"""
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from flask import current_app
+from sqlalchemy import insert as generic_insert
+
+from app import db
+from app.models.article import Article
+from app.models.api_quota import ApiQuotaUsage
+from app.models.article_keyword import ArticleKeyword
+from app.models.classifier_ruleset import ClassifierRuleset
+from app.models.collection_cursor import CollectionCursor
+from app.models.query_stats import QueryStats
+from app.models.query_velocity import QueryVelocity
+from app.services.article_classifier import CLASSIFICATION_COLUMNS, MEMO_COLUMNS, content_hash
+from app.services.classification_memo import MemoizedClassifier
+from app.services.classifier_rules import get_classifier
+from app.services.naver_client import kst_today
+from app.services.news_collector import NewsCollector
+from app.services.pipeline import ArticlePipeline
+from app.services.poll_scheduler import PollScheduler
+from app.services.query_planner import QueryPlanner
+from app.services.story_index import StoryMatcher, get_story_index
+from app.services.url_filter import get_url_filter
+from app.utils.normalization import canonical_key
+
+logger = logging.getLogger(__name__)
+
+# 한 INSERT 문에 넣을 최대 행 수 (SQLite 바인드 변수 한도 고려)
+MAX_ROWS_PER_STATEMENT = 500
+
+
+def _to_row(article_data: Dict, now: datetime) -> Dict:
+    """분류된 기사 딕셔너리를 articles 테이블 행으로 변환"""
+    return {
+        'title': article_data['title'][:500],
+        'description': article_data.get('description'),
+        'url': article_data['url'],
+        'canonical_key': article_data['canonical_key'],
+        'story_key': article_data.get('story_key') or article_data['canonical_key'],
+        'minhash': article_data.get('minhash'),
+        'source': article_data.get('source'),
+        'published_date': article_data.get('published_date'),
+        'is_medical': article_data.get('is_medical', False),
+        'category': article_data.get('category'),
+        'keywords': article_data.get('keywords'),
+        'confidence_score': article_data.get('confidence_score'),
+        'sentiment': article_data.get('sentiment'),
+        'needs_response': article_data.get('needs_response', False),
+        'risk_level': article_data.get('risk_level') or 'green',
+        'risk_score': article_data.get('risk_score') or 0,
+        'content_hash': article_data.get('content_hash') or content_hash(
+            article_data['title'], article_data.get('description')
+        ),
+        'ruleset_version': article_data.get('ruleset_version'),
+        'status': 'pending',
+        'created_at': now,
+        'updated_at': now
+    }
+
+
+def _insert_statement(rows: List[Dict], update: bool):
+    """방언별 INSERT ... ON CONFLICT 문 생성"""
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        # ON CONFLICT 미지원 DB: 기존 기사를 미리 걸러내므로 일반 INSERT
+        return generic_insert(Article.__table__).values(rows)
+
+    stmt = insert(Article.__table__).values(rows)
+    if update:
+        set_ = {column: stmt.excluded[column] for column in CLASSIFICATION_COLUMNS + MEMO_COLUMNS}
+        set_['updated_at'] = stmt.excluded.updated_at
+        return stmt.on_conflict_do_update(index_elements=['canonical_key'], set_=set_)
+    # url, canonical_key 어느 쪽이 충돌해도 건너뛰고, 실제로 삽입된 키만 돌려받아
+    # 다른 프로세스가 먼저 넣은 기사를 구분한다
+    return stmt.on_conflict_do_nothing().returning(Article.__table__.c.canonical_key)
+
+
+def ingest_articles(articles: List[Dict], update: bool = False, commit: bool = True) -> Dict[str, int]:
+    """
+    분류된 기사 배치를 한 번에 저장
+
+    중복 판단은 정규화 URL 키(canonical_key) 기준이다. 프로세스 공용 URL 필터로
+    이미 저장됐을 수 있는 키만 골라 DB에서 확인하고, INSERT ... ON CONFLICT 문
+    몇 개로 배치를 처리한다. 다른 프로세스가 먼저 넣은 기사는 ON CONFLICT가
+    걸러내므로 충돌 없이 처리된다.
+
+    Args:
+        articles: batch_classify 결과 기사 딕셔너리 목록
+        update: True면 이미 있는 기사의 분류 결과를 갱신 (DO UPDATE), False면 건너뜀 (DO NOTHING)
+        commit: 배치 저장 후 커밋 여부
+
+    Returns:
+        {'inserted': n, 'updated': n, 'skipped': n}
+    """
+    counts = {'inserted': 0, 'updated': 0, 'skipped': 0}
+    if not articles:
+        return counts
+
+    # 같은 배치 안의 중복 기사 제거 (마지막 값 사용)
+    unique = {}
+    for article_data in articles:
+        if article_data.get('url'):
+            key = article_data.get('canonical_key') or canonical_key(article_data['url'])
+            unique[key] = {**article_data, 'canonical_key': key}
+    counts['skipped'] += len(articles) - len(unique)
+
+    # URL 필터가 키와 URL 모두 "없음"이라고 한 기사는 DB 확인 없이 새 기사로 본다
+    # (update 모드는 삽입/갱신 수를 정확히 세야 하므로 모두 확인: 필터는 프로세스별이라
+    # 다른 프로세스가 넣은 기사를 모르고, 그런 기사는 ON CONFLICT에서 갱신된다)
+    url_filter = get_url_filter(current_app.config)
+    candidates = [
+        key for key, article_data in unique.items()
+        if update or url_filter is None or url_filter.might_contain(key)
+        or url_filter.might_contain(article_data['url'])
+    ]
+
+    try:
+        existing = set()
+        legacy = set()
+        if candidates:
+            existing = {
+                key for (key,) in db.session.query(Article.canonical_key)
+                .filter(Article.canonical_key.in_(candidates))
+            }
+            # 키는 다르지만 URL이 같은 기존 행 (키 도입 전에 저장된 기사)
+            stored_urls = {
+                url for (url,) in db.session.query(Article.url)
+                .filter(Article.url.in_([unique[key]['url'] for key in candidates]))
+            }
+            legacy = {
+                key for key in candidates
+                if key not in existing and unique[key]['url'] in stored_urls
+            }
+
+        # 이미 있는 기사는 update 모드에서만 다시 보낸다 (동시 삽입은 ON CONFLICT가 처리)
+        now = datetime.utcnow()
+        rows = [
+            _to_row(article_data, now)
+            for key, article_data in unique.items()
+            if key not in legacy and (update or key not in existing)
+        ]
+        inserted = None if update else set()
+        for i in range(0, len(rows), MAX_ROWS_PER_STATEMENT):
+            result = db.session.execute(_insert_statement(rows[i:i + MAX_ROWS_PER_STATEMENT], update))
+            if inserted is not None:
+                inserted.update(result.scalars().all() if result.returns_rows else
+                                (row['canonical_key'] for row in rows[i:i + MAX_ROWS_PER_STATEMENT]))
+
+        # 키워드 역색인: 이번에 분류한 기사만 (저장된 결과를 재사용한 기사는 색인이 이미 있다)
+        written = {row['canonical_key'] for row in rows} if update else inserted
+        indexed = [key for key in written if unique[key].get('matched_keywords') is not None]
+        if indexed:
+            ArticleKeyword.replace({
+                article_id: unique[key]['matched_keywords']
+                for article_id, key in db.session.query(Article.id, Article.canonical_key)
+                .filter(Article.canonical_key.in_(indexed))
+            })
+
+        if commit:
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if url_filter is not None:
+        url_filter.update(unique.keys())
+        url_filter.update(article_data['url'] for article_data in unique.values())
+
+    if update:
+        counts['inserted'] += len(unique) - len(existing) - len(legacy)
+        counts['updated'] += len(existing)
+        counts['skipped'] += len(legacy)
+    else:
+        counts['inserted'] += len(inserted)
+        counts['skipped'] += len(unique) - len(inserted)
+
+    logger.debug(f"기사 저장: {counts}")
+    return counts
+
+
+def backfill_canonical_keys(batch_size: int = 1000) -> int:
+    """
+    canonical_key가 비어 있는 기존 기사에 키 채우기
+
+    같은 키를 가진 기사가 이미 있으면(키 도입 전에 중복 저장된 기사) 비워 둔다.
+    앱 컨텍스트 안에서 호출해야 한다.
+
+    Returns:
+        키를 채운 기사 수
+    """
+    taken = set()
+    filled = 0
+    last_id = 0
+    while True:
+        rows = (db.session.query(Article.id, Article.url)
+                .filter(Article.canonical_key.is_(None), Article.id > last_id)
+                .order_by(Article.id).limit(batch_size).all())
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        keys = {row.id: canonical_key(row.url) for row in rows}
+        taken.update(
+            key for (key,) in db.session.query(Article.canonical_key)
+            .filter(Article.canonical_key.in_(set(keys.values())))
+        )
+        for article_id, key in keys.items():
+            if key in taken:
+                continue
+            taken.add(key)
+            db.session.query(Article).filter(Article.id == article_id).update(
+                {Article.canonical_key: key}, synchronize_session=False
+            )
+            filled += 1
+        db.session.commit()
+
+    if filled:
+        logger.info(f"canonical_key 채움: {filled}개")
+    return filled
+
+
+def _observe_velocity(config, planner: QueryPlanner, limits: Dict[str, int],
+                      query_urls: Dict[str, List[str]], started_at: datetime) -> Dict[str, Dict]:
+    """이번 실행의 쿼리별 새 기사 수와 red 등급 기사 수로 유입 속도 상태 갱신"""
+    scheduler = PollScheduler.from_config(config)
+    states = QueryVelocity.load_states(planner.queries)
+    red_urls = {
+        url for (url,) in db.session.query(Article.url)
+        .filter(Article.risk_level == 'red', Article.created_at >= started_at)
+    }
+    now = datetime.utcnow()
+    updated = {}
+    for query in planner.queries:
+        if limits.get(query, 0) <= 0:
+            updated[query] = scheduler.skip(states.get(query), now)
+            continue
+        urls = query_urls.get(query, [])
+        updated[query] = scheduler.observe(
+            states.get(query), len(urls), sum(1 for url in urls if url in red_urls), now
+        )
+    return updated
+
+
+def run_collection(config, progress: Callable[[str, Dict[str, int]], None] = None,
+                   queries: List[str] = None) -> Dict[str, int]:
+    """
+    증분 수집 1회 실행 (스케줄러 작업과 수동 수집 작업 공용)
+
+    수집 → 분류 → 저장 파이프라인을 돌리고, 모든 배치가 저장된 뒤 수집 커서,
+    쿼리 통계, 쿼리별 유입 속도를 갱신한다. API 사용량은 실패한 실행도 기록한다.
+    앱 컨텍스트 안에서 호출해야 한다.
+
+    Args:
+        config: Flask 앱 설정
+        progress: (단계, 통계) 콜백. 단계는 'preparing' → 'collecting'(수집/분류/저장 동시 진행)
+                  → 'finalizing' 순서이며, 'collecting' 중에는 자주 호출된다
+        queries: 수집할 쿼리 (기본값: SEARCH_KEYWORDS 전체, 적응형 스케줄은 폴링할 쿼리만 지정)
+
+    Returns:
+        {'collected', 'relevant', 'inserted', 'updated', 'skipped'}
+    """
+    report = progress or (lambda stage, stats: None)
+    report('preparing', {})
+
+    credentials = config.get('NAVER_CREDENTIALS')
+    quota_used = ApiQuotaUsage.load_usage([c[0] for c in credentials], kst_today())
+    collector = NewsCollector.from_config(config, quota_used=quota_used)
+    planner = QueryPlanner.from_config(config, queries=queries)
+    query_stats = QueryStats.load_stats(planner.queries)
+    watermarks = CollectionCursor.load_watermarks(planner.queries)
+    limits = planner.plan(query_stats)
+
+    # 프로세스 공용 분류기 (게시된 규칙 세대가 바뀐 경우에만 다시 컴파일)
+    classifier = get_classifier(config)
+    # 규칙 변경 시 바뀐 키워드를 계산할 수 있도록 규칙 기록
+    ClassifierRuleset.record(classifier)
+    story_index = get_story_index(config)
+    if story_index is not None:
+        # 유사 기사를 스토리로 묶음 (분류는 기사별, AI 분석 결과는 스토리 안에서 재사용)
+        classifier = StoryMatcher(classifier, story_index)
+    # 이미 저장된 기사는 내용과 규칙이 같으면 저장된 분류 결과 사용
+    classifier = MemoizedClassifier(classifier)
+
+    pipeline = ArticlePipeline(
+        classifier,
+        ingest_articles,
+        batch_size=config.get('INGEST_BATCH_SIZE', 100),
+        progress=lambda stats: report('collecting', stats)
+    )
+    report('collecting', {})
+    started_at = datetime.utcnow()
+    try:
+        with collector:
+            new_watermarks, stats = pipeline.run(
+                lambda emit: collector.stream_incremental(
+                    emit, watermarks, queries=planner.queries, limits=limits, probes=planner.probes
+                )
+            )
+    finally:
+        # 실패하거나 임대를 잃은 실행도 이미 쓴 API 호출 수는 따로 커밋
+        # (기록이 빠지면 다음 실행과 적응형 예산이 일일 쿼터를 넘길 수 있다)
+        db.session.rollback()
+        ApiQuotaUsage.record_usage(collector.drain_quota_usage(), kst_today())
+        db.session.commit()
+
+    # 수집 커서, 쿼리 통계 갱신 (모든 배치 저장 후)
+    report('finalizing', stats)
+    CollectionCursor.save_watermarks(new_watermarks)
+    if queries is None:
+        QueryStats.save_stats(planner.update_stats(
+            query_stats, planner.measure(collector.last_query_urls)
+        ))
+    else:
+        # 쿼리 간 중복 비율은 모든 쿼리를 함께 수집한 실행에서만 측정
+        QueryStats.save_stats(planner.update_skipped(query_stats, limits))
+    QueryVelocity.save_states(_observe_velocity(config, planner, limits, collector.last_query_urls, started_at))
+    db.session.commit()
+
+    for key in ('inserted', 'updated', 'skipped'):
+        stats.setdefault(key, 0)
+    return stats
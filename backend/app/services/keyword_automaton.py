@@ -0,0 +1,87 @@
+"""
+Aho-Corasick multi-pattern keyword matcher
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class KeywordAutomaton:
+    """
+    여러 키워드를 한 번의 텍스트 순회로 찾는 Aho-Corasick 오토마톤
+
+    키워드 수와 무관하게 텍스트 길이에 비례하는 시간으로 모든 출현 위치를
+    찾는다 (겹치는 키워드와 접두사 관계인 키워드도 모두 보고).
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: 찾을 키워드 (대소문자 구분, 중복/빈 문자열은 무시)
+        """
+        self.patterns: List[str] = list(dict.fromkeys(p for p in patterns if p))
+        self.pattern_ids: Dict[str, int] = {p: i for i, p in enumerate(self.patterns)}
+        self._lengths = [len(p) for p in self.patterns]
+
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Tuple[int, ...]] = [()]
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    output.append(())
+                    goto[state][ch] = next_state
+                state = next_state
+            output[state] += (pattern_id,)
+
+        # 실패 링크 (BFS), 출력은 실패 링크를 따라 합쳐 둔다
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                fail[next_state] = target if target != next_state else 0
+                output[next_state] += output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        self._alphabet = frozenset(ch for pattern in self.patterns for ch in pattern)
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        텍스트의 모든 키워드 출현 위치
+
+        Yields:
+            (pattern_id, 시작 위치)
+        """
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        alphabet = self._alphabet
+        state = 0
+        for position, ch in enumerate(text):
+            # 어떤 키워드에도 없는 문자면 바로 루트로
+            if ch not in alphabet:
+                state = 0
+                continue
+            next_state = goto[state].get(ch)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(ch)
+            state = next_state or 0
+            if output[state]:
+                for pattern_id in output[state]:
+                    yield pattern_id, position - lengths[pattern_id] + 1
+
+    def find_all(self, text: str) -> List[Tuple[str, int]]:
+        """텍스트의 모든 (키워드, 시작 위치)"""
+        return [(self.patterns[pattern_id], start) for pattern_id, start in self.iter_matches(text)]
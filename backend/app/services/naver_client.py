@@ -0,0 +1,376 @@
+"""
+Naver Search API client with rate limiting, retry/backoff and quota accounting
+"""
+import random
+import threading
+import time
+import logging
+from datetime import datetime, timedelta, timezone, date
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# 네이버 API 일일 쿼터는 한국 시간 자정에 초기화된다
+KST = timezone(timedelta(hours=9))
+
+
+def kst_today() -> date:
+    """한국 시간 기준 오늘 날짜 (일일 쿼터 집계 단위)"""
+    return datetime.now(KST).date()
+
+
+class NaverApiError(Exception):
+    """재시도 후에도 실패한 네이버 API 호출"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class NaverQuotaExceededError(NaverApiError):
+    """일일 쿼터 소진"""
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷 (초당 rate개, 최대 capacity개 버스트)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """토큰을 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class DailyQuota:
+    """일일 API 호출 쿼터 카운터 (DB 저장분 + 이번 실행 사용분)"""
+
+    def __init__(self, limit: int, used: int = 0):
+        self.limit = limit
+        self.used = used
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.used)
+
+    def consume(self):
+        """호출 1회 차감 (쿼터 소진 시 NaverQuotaExceededError)"""
+        with self._lock:
+            if self.used >= self.limit:
+                raise NaverQuotaExceededError(f"일일 쿼터 소진 ({self.used}/{self.limit})", status_code=429)
+            self.used += 1
+            self._pending += 1
+
+    def exhaust(self):
+        """남은 쿼터를 모두 사용한 것으로 처리 (DB에도 반영되도록 pending에 합산)"""
+        with self._lock:
+            if self.used < self.limit:
+                self._pending += self.limit - self.used
+                self.used = self.limit
+
+    def drain_pending(self) -> int:
+        """아직 DB에 기록하지 않은 사용량을 반환하고 0으로 초기화"""
+        with self._lock:
+            pending, self._pending = self._pending, 0
+            return pending
+
+
+# 같은 프로세스 안의 스케줄러/수동 수집/백필이 client_id별 버킷을 공유한다
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_shared_bucket(client_id: str, rate: float) -> TokenBucket:
+    """client_id별 프로세스 공용 토큰 버킷"""
+    with _buckets_lock:
+        bucket = _buckets.get(client_id)
+        if bucket is None or bucket.rate != float(rate):
+            bucket = TokenBucket(rate)
+            _buckets[client_id] = bucket
+        return bucket
+
+
+def mask_client_id(client_id: str) -> str:
+    """로그/응답용 client_id 마스킹"""
+    return f"{client_id[:4]}***" if client_id else ''
+
+
+class NaverCredential:
+    """API 키 한 쌍과 키별 레이트 리밋/쿼터/상태"""
+
+    def __init__(self, client_id: str, client_secret: str,
+                 rate_per_sec: float = 10, daily_quota: int = 25000, quota_used: int = 0):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.bucket = get_shared_bucket(client_id, rate_per_sec)
+        self.quota = DailyQuota(daily_quota, used=quota_used)
+
+        # 상태: 거부된 키는 이번 실행 동안 제외, 스로틀된 키는 cooldown까지 제외
+        self.disabled_reason: Optional[str] = None
+        self.cooldown_until = 0.0
+        self.failures = 0
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret
+        }
+
+    def is_available(self, now: float) -> bool:
+        return self.disabled_reason is None and self.quota.remaining > 0 and self.cooldown_until <= now
+
+    def to_dict(self) -> Dict:
+        return {
+            'client_id': mask_client_id(self.client_id),
+            'quota_used': self.quota.used,
+            'quota_remaining': self.quota.remaining,
+            'disabled_reason': self.disabled_reason,
+            'failures': self.failures
+        }
+
+
+class NaverKeyPool:
+    """여러 API 키에 요청을 분산하는 키 풀 (라운드 로빈)"""
+
+    def __init__(self, credentials: List[NaverCredential]):
+        if not credentials:
+            raise ValueError("네이버 API 키가 하나 이상 필요합니다")
+        self.credentials = credentials
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """사용 가능한 키들의 남은 쿼터 합계"""
+        return sum(c.quota.remaining for c in self.credentials if c.disabled_reason is None)
+
+    def acquire(self) -> NaverCredential:
+        """
+        다음 사용 가능한 키를 골라 쿼터 1회를 차감
+
+        모든 키가 cooldown 중이면 가장 먼저 풀리는 키까지 대기한다.
+
+        Raises:
+            NaverQuotaExceededError: 모든 키의 쿼터가 소진됨
+            NaverApiError: 모든 키가 거부됨
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                count = len(self.credentials)
+                for offset in range(count):
+                    credential = self.credentials[(self._next + offset) % count]
+                    if credential.is_available(now):
+                        self._next = (self._next + offset + 1) % count
+                        credential.quota.consume()
+                        return credential
+
+                usable = [c for c in self.credentials if c.disabled_reason is None and c.quota.remaining > 0]
+                if not usable:
+                    if any(c.disabled_reason is None for c in self.credentials):
+                        raise NaverQuotaExceededError("모든 API 키의 일일 쿼터 소진", status_code=429)
+                    raise NaverApiError("사용 가능한 네이버 API 키가 없습니다")
+                wait = min(c.cooldown_until for c in usable) - now
+
+            time.sleep(max(0.0, wait))
+
+    def mark_success(self, credential: NaverCredential):
+        credential.failures = 0
+
+    def mark_rejected(self, credential: NaverCredential, reason: str):
+        """인증 실패 등으로 거부된 키를 이번 실행에서 제외"""
+        credential.disabled_reason = reason
+        credential.failures += 1
+        logger.error(f"네이버 API 키 제외: {mask_client_id(credential.client_id)} ({reason})")
+
+    def mark_exhausted(self, credential: NaverCredential):
+        """서버가 일일 한도 초과를 알린 키는 쿼터를 소진 처리"""
+        credential.quota.exhaust()
+        logger.warning(f"네이버 API 키 쿼터 소진: {mask_client_id(credential.client_id)}")
+
+    def mark_throttled(self, credential: NaverCredential, delay: float):
+        """초당 한도 초과(429) 키를 delay초 동안 제외"""
+        credential.failures += 1
+        credential.cooldown_until = time.monotonic() + delay
+
+    def drain_pending(self) -> Dict[str, int]:
+        """키별로 아직 DB에 기록하지 않은 사용량"""
+        return {c.client_id: c.quota.drain_pending() for c in self.credentials}
+
+    def status(self) -> List[Dict]:
+        return [c.to_dict() for c in self.credentials]
+
+
+class NaverApiClient:
+    """네이버 검색 API 공용 클라이언트"""
+
+    BASE_URL = "https://openapi.naver.com/v1/search/news.json"
+
+    # 재시도 대상 상태 코드
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+
+    # 키 자체가 거부된 경우 (다른 키로 즉시 재시도)
+    REJECT_STATUS = {401, 403}
+
+    # 네이버 오픈 API 오류 코드: 010 = 일일 사용량 초과
+    QUOTA_ERROR_CODE = '010'
+
+    def __init__(self, client_id: str = None, client_secret: str = None,
+                 rate_per_sec: float = 10, daily_quota: int = 25000, quota_used: int = 0,
+                 max_retries: int = 4, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 pool_size: int = 4, timeout: float = 10, base_url: str = None,
+                 key_pool: NaverKeyPool = None):
+        self.base_url = base_url or self.BASE_URL
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+        self.key_pool = key_pool or NaverKeyPool([
+            NaverCredential(client_id, client_secret, rate_per_sec, daily_quota, quota_used)
+        ])
+
+        # keep-alive 커넥션을 재사용하는 공유 세션 (요청마다 TLS 핸드셰이크 방지)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @classmethod
+    def from_credentials(cls, credentials: List[Tuple[str, str]], quota_used: Dict[str, int] = None,
+                         rate_per_sec: float = 10, daily_quota: int = 25000, **kwargs) -> 'NaverApiClient':
+        """(client_id, client_secret) 목록으로 키 풀 클라이언트 생성"""
+        quota_used = quota_used or {}
+        key_pool = NaverKeyPool([
+            NaverCredential(client_id, client_secret, rate_per_sec, daily_quota,
+                            quota_used.get(client_id, 0))
+            for client_id, client_secret in credentials
+        ])
+        return cls(key_pool=key_pool, **kwargs)
+
+    def close(self):
+        """공유 세션 종료"""
+        self.session.close()
+
+    def search_news(self, query: str, display: int = 100, start: int = 1, sort: str = 'date') -> Dict:
+        """
+        뉴스 검색 API 호출 (키 분산, 레이트 리밋, 재시도 포함)
+
+        Args:
+            query: 검색 쿼리
+            display: 페이지 크기 (최대 100)
+            start: 검색 시작 위치 (최대 1000)
+            sort: 정렬 방식 ('date' 또는 'sim')
+
+        Returns:
+            API 응답 JSON
+
+        Raises:
+            NaverQuotaExceededError: 모든 키의 일일 쿼터 소진
+            NaverApiError: 재시도 후에도 실패
+        """
+        params = {"query": query, "display": display, "start": start, "sort": sort}
+        attempt = 0
+
+        while True:
+            credential = self.key_pool.acquire()
+            credential.bucket.acquire()
+
+            try:
+                response = self.session.get(self.base_url, params=params,
+                                            headers=credential.headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt >= self.max_retries:
+                    raise NaverApiError(f"네이버 API 요청 실패: {e}") from e
+                self._backoff(attempt, None, reason=str(e))
+                attempt += 1
+                continue
+
+            status = response.status_code
+
+            if status in self.REJECT_STATUS:
+                self.key_pool.mark_rejected(credential, f"HTTP {status}")
+                continue
+
+            if status == 429 and self._error_code(response) == self.QUOTA_ERROR_CODE:
+                self.key_pool.mark_exhausted(credential)
+                continue
+
+            if status in self.RETRY_STATUS and attempt < self.max_retries:
+                delay = self._retry_delay(attempt, response)
+                if status == 429:
+                    # 스로틀된 키만 쉬게 하고 다른 키로 바로 재시도
+                    self.key_pool.mark_throttled(credential, delay)
+                    logger.warning(f"네이버 API 스로틀 ({mask_client_id(credential.client_id)}), {delay:.2f}초 제외")
+                else:
+                    logger.warning(f"네이버 API 재시도 {attempt + 1}/{self.max_retries} (HTTP {status}), {delay:.2f}초 대기")
+                    time.sleep(delay)
+                attempt += 1
+                continue
+
+            if status >= 400:
+                raise NaverApiError(
+                    f"네이버 API 오류: HTTP {status} {response.text[:200]}",
+                    status_code=status
+                )
+
+            self.key_pool.mark_success(credential)
+            return response.json()
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response], reason: str):
+        """재시도 전 대기"""
+        delay = self._retry_delay(attempt, response)
+        logger.warning(f"네이버 API 재시도 {attempt + 1}/{self.max_retries} ({reason}), {delay:.2f}초 대기")
+        time.sleep(delay)
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Retry-After 우선, 없으면 지터를 더한 지수 백오프"""
+        delay = self._retry_after(response) if response is not None else None
+        if delay is None:
+            delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            delay = random.uniform(0, delay)  # full jitter
+        return delay
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더 (초 또는 HTTP 날짜) 파싱"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return min(self.backoff_max, max(0.0, float(value)))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return min(self.backoff_max, max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()))
+        except Exception:
+            return None
+
+    def _error_code(self, response: requests.Response) -> Optional[str]:
+        """오류 응답 본문의 errorCode"""
+        try:
+            return str(response.json().get('errorCode'))
+        except Exception:
+            return None
@@ -1,17 +1,76 @@
-import requests
-from datetime import datetime, timedelta
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, List, Dict, Tuple, Optional
 import logging
 
+from app.services.naver_client import NaverApiClient, NaverApiError
+from app.utils.normalization import canonical_key, clean_html
+
 logger = logging.getLogger(__name__)
 
 class NewsCollector:
     """네이버 뉴스 API를 사용한 기사 수집기"""
 
-    def __init__(self, client_id: str, client_secret: str):
+    # 네이버 검색 API 제한: display 최대 100, start 최대 1000
+    MAX_DISPLAY = 100
+    MAX_START = 1000
+
+    # 해시드 관련 기본 검색 쿼리
+    SEARCH_QUERIES = ['해시드', 'Hashed', '해시드 벤처스', '김서준']
+
+    def __init__(self, client_id: str, client_secret: str, max_workers: int = 4,
+                 client: NaverApiClient = None):
         self.client_id = client_id
         self.client_secret = client_secret
-        self.base_url = "https://openapi.naver.com/v1/search/news.json"
+        self.max_workers = max(1, max_workers)
+
+        # 레이트 리밋/재시도/쿼터를 담당하는 공용 API 클라이언트
+        self.client = client or NaverApiClient(client_id, client_secret, pool_size=self.max_workers)
+
+        # 마지막 collect_incremental 실행의 쿼리별 수집 URL
+        self.last_query_urls: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_config(cls, config, quota_used: Dict[str, int] = None) -> 'NewsCollector':
+        """
+        앱 설정으로 수집기 생성
+
+        NAVER_CREDENTIALS의 모든 키를 키 풀로 묶어 요청을 분산한다.
+
+        Args:
+            config: Flask 앱 설정
+            quota_used: client_id별 오늘 이미 사용한 호출 수
+        """
+        credentials = config.get('NAVER_CREDENTIALS') or [
+            (config.get('NAVER_CLIENT_ID'), config.get('NAVER_CLIENT_SECRET'))
+        ]
+        max_workers = config.get('NAVER_MAX_CONCURRENCY', 4)
+        client = NaverApiClient.from_credentials(
+            credentials,
+            quota_used=quota_used,
+            rate_per_sec=config.get('NAVER_RATE_PER_SEC', 10),
+            daily_quota=config.get('NAVER_DAILY_QUOTA', 25000),
+            max_retries=config.get('NAVER_MAX_RETRIES', 4),
+            pool_size=max_workers,
+            base_url=config.get('NAVER_API_BASE_URL')
+        )
+        client_id, client_secret = credentials[0]
+        return cls(client_id, client_secret, max_workers=max_workers, client=client)
+
+    def drain_quota_usage(self) -> Dict[str, int]:
+        """client_id별로 아직 DB에 기록하지 않은 API 호출 수"""
+        return self.client.key_pool.drain_pending()
+
+    def close(self):
+        """공유 세션 종료"""
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def collect_articles(self, query: str = "의료", display: int = 100, start: int = 1) -> List[Dict]:
         """
@@ -25,71 +84,255 @@ class NewsCollector:
         Returns:
             기사 목록
         """
-        headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret
-        }
-
-        params = {
-            "query": query,
-            "display": display,
-            "start": start,
-            "sort": "date"  # 최신순 정렬
-        }
-
         try:
-            response = requests.get(self.base_url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            articles = []
-            for item in data.get('items', []):
-                article = {
-                    'title': self._clean_html(item.get('title', '')),
-                    'description': self._clean_html(item.get('description', '')),
-                    'url': item.get('link', ''),
-                    'source': '네이버뉴스',
-                    'published_date': self._parse_date(item.get('pubDate', ''))
-                }
-                articles.append(article)
-
-            logger.info(f"수집된 기사: {len(articles)}개")
-            return articles
-
-        except requests.RequestException as e:
+            return self.fetch_page(query=query, display=display, start=start)
+        except NaverApiError as e:
             logger.error(f"기사 수집 중 오류 발생: {e}")
             return []
 
+    def fetch_page(self, query: str, display: int = 100, start: int = 1) -> List[Dict]:
+        """
+        검색 결과 한 페이지 수집 (실패 시 예외 전파)
+
+        Raises:
+            NaverApiError: 재시도 후에도 실패했거나 쿼터가 소진된 경우
+        """
+        data = self.client.search_news(query, display=display, start=start)
+
+        articles = []
+        for item in data.get('items', []):
+            link = item.get('link', '')
+            original_url = item.get('originallink', '')
+            article = {
+                'title': self._clean_html(item.get('title', '')),
+                'description': self._clean_html(item.get('description', '')),
+                'url': link,
+                'original_url': original_url or link,
+                # 네이버 링크와 언론사 원문 링크 어느 쪽으로 들어와도 같은 키
+                'canonical_key': canonical_key(link, original_url),
+                'source': '네이버뉴스',
+                'published_date': self._parse_date(item.get('pubDate', ''))
+            }
+            articles.append(article)
+
+        logger.info(f"수집된 기사: {len(articles)}개")
+        return articles
+
+    def collect_pages(self, pages: List[Tuple[str, int, int]]) -> List[List[Dict]]:
+        """
+        여러 (query, start, display) 페이지를 동시에 수집
+
+        Args:
+            pages: (검색 쿼리, 시작 위치, 페이지 크기) 목록
+
+        Returns:
+            입력 순서와 동일한 순서의 페이지별 기사 목록
+        """
+        if self.max_workers == 1 or len(pages) <= 1:
+            return [self.collect_articles(query=q, display=d, start=s) for q, s, d in pages]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pages))) as executor:
+            return list(executor.map(
+                lambda page: self.collect_articles(query=page[0], display=page[2], start=page[1]),
+                pages
+            ))
+
     def collect_medical_articles(self, max_articles: int = 100) -> List[Dict]:
         """
         해시드 관련 기사 수집 (여러 키워드 사용)
 
+        모든 쿼리와 결과 페이지를 한 번에 동시 요청하므로 소요 시간은
+        가장 느린 페이지에 맞춰진다.
+
         Args:
             max_articles: 수집할 최대 기사 수
 
         Returns:
             해시드 관련 기사 목록
         """
-        search_queries = ['해시드', 'Hashed', '해시드 벤처스', '김서준']
-        all_articles = []
-        articles_per_query = max_articles // len(search_queries)
+        search_queries = self.SEARCH_QUERIES
+        articles_per_query = max(1, max_articles // len(search_queries))
 
+        pages = []
         for query in search_queries:
-            articles = self.collect_articles(query=query, display=min(articles_per_query, 100))
-            all_articles.extend(articles)
+            pages.extend(self._plan_pages(query, articles_per_query))
 
-            if len(all_articles) >= max_articles:
-                break
+        all_articles = []
+        for page_articles in self.collect_pages(pages):
+            all_articles.extend(page_articles)
 
-        # URL 기준으로 중복 제거
-        unique_articles = {article['url']: article for article in all_articles}
+        # 정규화 URL 키 기준으로 중복 제거
+        unique_articles = {article['canonical_key']: article for article in all_articles}
         return list(unique_articles.values())[:max_articles]
 
+    def collect_incremental(self, watermarks: Dict[str, Tuple] = None, queries: List[str] = None,
+                            max_per_query: int = MAX_START,
+                            limits: Dict[str, int] = None) -> Tuple[List[Dict], Dict[str, Tuple]]:
+        """
+        워터마크 이후의 새 기사만 수집 (쿼리별 증분 페이지네이션)
+
+        stream_incremental의 결과를 모두 모아 반환한다.
+
+        Returns:
+            (새 기사 목록, 갱신된 쿼리별 워터마크)
+        """
+        pages = []
+        new_watermarks = self.stream_incremental(
+            pages.append, watermarks, queries=queries, max_per_query=max_per_query, limits=limits
+        )
+
+        # 정규화 URL 키 기준으로 중복 제거
+        unique_articles = {article['canonical_key']: article for page in pages for article in page}
+        return list(unique_articles.values()), new_watermarks
+
+    def stream_incremental(self, emit: Callable[[List[Dict]], None], watermarks: Dict[str, Tuple] = None,
+                           queries: List[str] = None, max_per_query: int = MAX_START,
+                           limits: Dict[str, int] = None, probes: Iterable[str] = ()) -> Dict[str, Tuple]:
+        """
+        워터마크 이후의 새 기사를 페이지 단위로 emit에 전달 (쿼리별 증분 페이지네이션)
+
+        쿼리마다 start=1, 101, ... 순으로 페이지를 넘기다가 이미 수집한
+        기사(워터마크)에 도달하면 중단한다. 쿼리들은 동시에 수집되며 emit은
+        워커 스레드에서 호출된다. emit이 블로킹되면 해당 쿼리의 수집도 멈춘다.
+        여러 쿼리에 걸린 같은 기사(정규화 URL 키 기준)는 한 번만 emit한다.
+        쿼리별로 수집한 URL은 last_query_urls에 남는다 (쿼리 계획기 측정용).
+
+        Args:
+            emit: 페이지별 새 기사 목록을 받는 콜백
+            watermarks: 쿼리별 (last_published_date, last_url)
+            queries: 검색 쿼리 목록 (기본값: SEARCH_QUERIES)
+            max_per_query: 쿼리당 최대 수집 기사 수 (API 한도 1000)
+            limits: 쿼리별 최대 수집 기사 수 (QueryPlanner.plan 결과, 0이면 제외).
+                워터마크가 있는 쿼리도 이 수에서 멈추며, 워터마크에 도달하지 못하면
+                워터마크를 그대로 두어 다음 실행이 남은 기사를 이어서 수집한다.
+            probes: 측정용으로 수집하는 쿼리 (QueryPlanner.probes). 워터마크에 도달하지
+                못해도 워터마크를 가장 최근 기사로 옮긴다 (제외된 동안 쌓인 기사는 건너뜀).
+
+        Returns:
+            갱신된 쿼리별 워터마크
+        """
+        queries = queries or self.SEARCH_QUERIES
+        watermarks = watermarks or {}
+        if limits is not None:
+            queries = [query for query in queries if limits.get(query, 0) > 0]
+        probes = set(probes)
+
+        emitted = set()
+        emitted_lock = threading.Lock()
+
+        def emit_unique(articles: List[Dict]):
+            with emitted_lock:
+                fresh = [article for article in articles if article['canonical_key'] not in emitted]
+                emitted.update(article['canonical_key'] for article in fresh)
+            if fresh:
+                emit(fresh)
+
+        def collect(query):
+            limit = max_per_query
+            if limits is not None:
+                limit = min(limit, limits[query])
+            return self._collect_since(query, watermarks.get(query), limit, emit_unique,
+                                       skip_backlog=query in probes)
+
+        if self.max_workers == 1 or len(queries) <= 1:
+            results = [collect(query) for query in queries]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as executor:
+                results = list(executor.map(collect, queries))
+
+        new_watermarks = {}
+        self.last_query_urls = {}
+        for query, (urls, watermark) in zip(queries, results):
+            self.last_query_urls[query] = urls
+            if urls:
+                new_watermarks[query] = watermark
+        return new_watermarks
+
+    def _collect_since(self, query: str, watermark: Optional[Tuple], max_per_query: int,
+                       emit: Callable[[List[Dict]], None],
+                       skip_backlog: bool = False) -> Tuple[List[str], Optional[Tuple]]:
+        """
+        워터마크에 도달할 때까지 한 쿼리의 페이지를 순서대로 수집해 emit에 전달
+
+        max_per_query개를 수집하고도 워터마크에 도달하지 못하면 워터마크를 그대로 둔다
+        (다음 실행에서 이미 저장된 기사는 중복 제거되고 남은 기사까지 이어서 수집).
+        skip_backlog이거나 API 한도(MAX_START)까지 넘긴 경우에만 가장 최근 기사로 옮긴다.
+        """
+        since_date, since_url = watermark or (None, None)
+        if since_date is not None:
+            since_date = self._to_utc_naive(since_date)
+
+        urls = []
+        newest = None
+        for _, start, display in self._plan_pages(query, max_per_query):
+            try:
+                page = self.fetch_page(query=query, display=display, start=start)
+            except NaverApiError as e:
+                # 중간 페이지가 누락되지 않도록 워터마크는 그대로 둔다
+                logger.error(f"'{query}' 수집 중단 (start={start}): {e}")
+                return urls, watermark
+
+            fresh = []
+            reached = False
+            for article in page:
+                if self._is_seen(article, since_date, since_url):
+                    reached = True
+                    break
+                fresh.append(article)
+
+                published = self._to_utc_naive(article['published_date'])
+                if newest is None or published > newest[0]:
+                    newest = (published, article['url'])
+
+            if fresh:
+                urls.extend(article['url'] for article in fresh)
+                emit(fresh)
+
+            if reached or len(page) < display:
+                break
+        else:
+            if urls and (since_date is not None or since_url):
+                if not skip_backlog and max_per_query < self.MAX_START:
+                    # 페이지 예산 안에서 워터마크에 도달하지 못함 → 워터마크를 옮기지 않고 다음 실행에서 이어서 수집
+                    logger.info(f"'{query}' 신규 기사: {len(urls)}개 (페이지 예산 {max_per_query}개 소진, "
+                                f"워터마크까지 남은 기사는 다음 실행에서 수집)")
+                    return urls, watermark
+                # 측정용 수집이거나 API 한도까지 넘김 → 가장 최근 기사까지만 반영하고 나머지는 건너뜀
+                logger.warning(f"'{query}' {max_per_query}개 수집 후에도 워터마크에 도달하지 못해 남은 기사는 건너뜀")
+
+        if not urls:
+            return [], watermark
+
+        logger.info(f"'{query}' 신규 기사: {len(urls)}개")
+        return urls, newest
+
+    def _is_seen(self, article: Dict, since_date: Optional[datetime], since_url: Optional[str]) -> bool:
+        """워터마크 기준으로 이미 수집한 기사인지 확인"""
+        if since_url and article['url'] == since_url:
+            return True
+        if since_date is not None:
+            return self._to_utc_naive(article['published_date']) < since_date
+        return False
+
+    def _to_utc_naive(self, value: datetime) -> datetime:
+        """tz-aware datetime을 UTC naive datetime으로 변환 (DB 저장/비교용)"""
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def _plan_pages(self, query: str, limit: int) -> List[Tuple[str, int, int]]:
+        """쿼리 하나에서 limit개를 가져오기 위한 (query, start, display) 페이지 목록"""
+        pages = []
+        start = 1
+        while start <= min(limit, self.MAX_START):
+            display = min(self.MAX_DISPLAY, limit - start + 1)
+            pages.append((query, start, display))
+            start += display
+        return pages
+
     def _clean_html(self, text: str) -> str:
-        """HTML 태그 제거"""
-        import re
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', text)
+        """HTML 태그 제거 및 엔티티 디코딩"""
+        return clean_html(text)
 
     def _parse_date(self, date_str: str) -> datetime:
         """날짜 문자열을 datetime 객체로 변환"""
@@ -0,0 +1,108 @@
+"""
+Process-pool batch classification for large article sets
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+
+from app.services.article_classifier import ArticleClassifier
+from app.services.classifier_rules import get_classifier
+
+logger = logging.getLogger(__name__)
+
+# 작업 프로세스별 분류기 (initializer에서 한 번만 생성)
+_worker_classifier = None
+
+
+def _init_worker(rules: Dict):
+    """작업 프로세스 초기화: 분류기와 키워드 오토마톤을 한 번만 컴파일"""
+    global _worker_classifier
+    _worker_classifier = ArticleClassifier.from_ruleset(rules)
+
+
+def _classify_chunk(chunk: List[Tuple[str, str]]) -> List[Dict]:
+    """작업 프로세스에서 (제목, 요약) 묶음을 분류"""
+    return [_worker_classifier.score_article(title, description) for title, description in chunk]
+
+
+class ParallelClassifier:
+    """
+    ProcessPoolExecutor로 기사를 청크 단위로 나눠 분류
+
+    작업 프로세스는 주어진 분류기의 규칙으로 분류기를 한 번만 만들고, 작업마다
+    (제목, 요약) 튜플만 주고받는다.
+    결과는 입력 순서대로 반환한다. 기사가 적거나 workers가 1이면 현재 프로세스에서 분류한다.
+    분류 컬럼만 계산하며, 기사 딕셔너리 분류(내용 해시, 규칙 버전 기록)는
+    ArticleClassifier.batch_classify를 쓴다.
+    """
+
+    def __init__(self, classifier: ArticleClassifier, workers: int = 0, chunk_size: int = 2000):
+        """
+        Args:
+            classifier: 현재 프로세스에서 쓸 분류기 (작업 프로세스는 같은 규칙으로 생성)
+            workers: 작업 프로세스 수 (0이면 CPU 코어 수)
+            chunk_size: 작업 하나에 넘길 기사 수
+        """
+        self.classifier = classifier
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self._executor = None
+
+    @classmethod
+    def from_config(cls, config) -> 'ParallelClassifier':
+        """Flask 설정에서 병렬 분류기 생성 (현재 게시된 규칙 사용, 앱 컨텍스트 안에서 호출)"""
+        return cls(
+            get_classifier(config),
+            workers=config.get('CLASSIFY_WORKERS', 0),
+            chunk_size=config.get('CLASSIFY_CHUNK_SIZE', 2000)
+        )
+
+    @property
+    def ruleset_version(self) -> str:
+        return self.classifier.ruleset_version
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """작업 프로세스 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 프로세스 풀은 여러 번의 classify 호출에 걸쳐 재사용
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.classifier.ruleset(),)
+            )
+            logger.info(f"병렬 분류 프로세스 풀 시작: {self.workers}개")
+        return self._executor
+
+    def classify(self, articles: Iterable[Tuple[str, str]]) -> List[Dict]:
+        """
+        (제목, 요약) 목록을 분류
+
+        Args:
+            articles: (title, description) 튜플 목록
+
+        Returns:
+            입력 순서대로의 분류 컬럼 딕셔너리 목록 (ArticleClassifier.score_article 결과)
+        """
+        items = [(title or '', description or '') for title, description in articles]
+        if self.workers <= 1 or len(items) <= self.chunk_size:
+            classifier = self.classifier
+            return [classifier.score_article(title, description) for title, description in items]
+
+        chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        results = []
+        # executor.map은 제출 순서대로 결과를 돌려준다
+        for scored in self._get_executor().map(_classify_chunk, chunks):
+            results.extend(scored)
+        return results
@@ -0,0 +1,175 @@
+"""
+Streaming collect -> classify -> persist pipeline with bounded queues
+"""
+import queue
+import threading
+import logging
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 스테이지 종료 표시
+_DONE = object()
+
+
+class PipelineAborted(Exception):
+    """다른 스테이지 실패로 파이프라인이 중단됨"""
+
+
+class ArticlePipeline:
+    """
+    수집 → 분류 → 저장 스트리밍 파이프라인
+
+    수집 소스가 페이지를 emit하면 제한된 큐를 거쳐 분류 스레드로, 다시 제한된
+    큐를 거쳐 호출 스레드의 저장 단계로 흐른다. 큐가 차면 앞 단계가 대기하므로
+    (backpressure) 메모리 사용량은 전체 수집량이 아니라 큐 크기에 비례한다.
+    저장 단계는 호출 스레드에서 실행되므로 앱 컨텍스트 안에서 run을 호출해야 한다.
+    """
+
+    def __init__(self, classifier, sink: Callable[[List[Dict]], Dict[str, int]],
+                 page_queue_size: int = 8, save_queue_size: int = 8, batch_size: int = 100,
+                 progress: Callable[[Dict[str, int]], None] = None):
+        """
+        Args:
+            classifier: batch_classify를 제공하는 ArticleClassifier
+            sink: 관련 기사 배치를 저장하고 카운트 딕셔너리를 반환 (예: ingest_articles)
+            page_queue_size: 수집 → 분류 큐 크기 (페이지 수)
+            save_queue_size: 분류 → 저장 큐 크기 (페이지 수)
+            batch_size: 저장 배치 크기 (기사 수)
+            progress: 진행 중 통계 스냅샷을 받는 콜백 (저장 단계 스레드에서 페이지마다,
+                      대기 중에는 약 0.2초마다 호출되므로 호출 빈도는 콜백이 조절)
+        """
+        self.classifier = classifier
+        self.sink = sink
+        self.page_queue_size = page_queue_size
+        self.save_queue_size = save_queue_size
+        self.batch_size = batch_size
+        self.progress = progress
+
+    def run(self, source: Callable[[Callable[[List[Dict]], None]], Any]):
+        """
+        파이프라인 실행
+
+        Args:
+            source: emit 콜백을 받아 페이지마다 emit(articles)을 호출하는 수집 함수.
+                    별도 스레드에서 실행되며 반환값은 그대로 돌려준다.
+
+        Returns:
+            (source 반환값, 통계 딕셔너리)
+        """
+        page_queue = queue.Queue(maxsize=self.page_queue_size)
+        save_queue = queue.Queue(maxsize=self.save_queue_size)
+        stop = threading.Event()
+        outcome = {}
+        stats = {'collected': 0, 'relevant': 0}
+        stats_lock = threading.Lock()
+
+        def put(q, item):
+            """stop이 설정되면 대기를 멈추는 blocking put"""
+            while True:
+                if stop.is_set():
+                    raise PipelineAborted()
+                try:
+                    q.put(item, timeout=0.2)
+                    return
+                except queue.Full:
+                    continue
+
+        def emit(articles: List[Dict]):
+            with stats_lock:
+                stats['collected'] += len(articles)
+            put(page_queue, articles)
+
+        def produce():
+            try:
+                outcome['result'] = source(emit)
+            except PipelineAborted:
+                pass
+            except Exception as e:
+                outcome['error'] = e
+                stop.set()
+            finally:
+                try:
+                    put(page_queue, _DONE)
+                except PipelineAborted:
+                    pass
+
+        def classify():
+            try:
+                while True:
+                    articles = self._get(page_queue, stop)
+                    if articles is _DONE:
+                        break
+                    relevant = self.classifier.batch_classify(articles)
+                    if relevant:
+                        put(save_queue, relevant)
+            except PipelineAborted:
+                pass
+            except Exception as e:
+                outcome.setdefault('error', e)
+                stop.set()
+            finally:
+                try:
+                    put(save_queue, _DONE)
+                except PipelineAborted:
+                    pass
+
+        producer = threading.Thread(target=produce, name='pipeline-collect', daemon=True)
+        classifier = threading.Thread(target=classify, name='pipeline-classify', daemon=True)
+        producer.start()
+        classifier.start()
+
+        def report():
+            if self.progress is not None:
+                with stats_lock:
+                    snapshot = dict(stats)
+                self.progress(snapshot)
+
+        try:
+            batch = []
+            while True:
+                articles = self._get(save_queue, stop, idle=report)
+                if articles is _DONE:
+                    break
+                batch.extend(articles)
+                with stats_lock:
+                    stats['relevant'] += len(articles)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, stats, stats_lock)
+                    batch = []
+                report()
+            if batch and 'error' not in outcome:
+                self._flush(batch, stats, stats_lock)
+        except PipelineAborted:
+            pass
+        except Exception:
+            stop.set()
+            raise
+        finally:
+            producer.join()
+            classifier.join()
+
+        if 'error' in outcome:
+            raise outcome['error']
+
+        logger.info(f"파이프라인 완료: {stats}")
+        return outcome.get('result'), stats
+
+    def _flush(self, batch: List[Dict], stats: Dict[str, int], stats_lock: threading.Lock):
+        """저장 배치 실행 및 카운트 합산"""
+        counts = self.sink(batch)
+        with stats_lock:
+            for key, value in counts.items():
+                stats[key] = stats.get(key, 0) + value
+
+    def _get(self, q: queue.Queue, stop: threading.Event, idle: Callable[[], None] = None):
+        """stop이 설정되면 대기를 멈추는 blocking get (대기 중에는 idle 호출)"""
+        while True:
+            try:
+                return q.get(timeout=0.2)
+            except queue.Empty:
+                if stop.is_set():
+                    raise PipelineAborted()
+                if idle is not None:
+                    idle()
+
@@ -0,0 +1,162 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """
+    검색 쿼리별 적응형 폴링 간격 계획기
+
+    수집할 때마다 쿼리별로 지난 수집 이후 새로 나온 기사 수를 경과 시간으로 나눠
+    유입 속도(시간당 기사 수)를 측정한다. 속도가 오르면 바로 반영하고(속보 대응),
+    내려가면 decay_hours 시정수로 천천히 낮춘다. 폴링 간격은 한 번에 약
+    target_per_poll개의 새 기사가 쌓이는 시간이며 [min_interval, max_interval]로
+    제한한다. red 등급 기사가 나온 쿼리는 다음 폴링을 min_interval 뒤로 당긴다.
+    일일 호출 예산을 남은 시간에 나눠 쓰도록 전체 간격을 같은 비율로 늘린다.
+    기본 예산은 매일 1회 수집과 같은 호출 수이므로 평균 사용량은 늘지 않고, 조용한
+    쿼리에서 아낀 호출을 유입이 빠른 쿼리에 몰아 쓴다. 분 단위 대응이 필요하면
+    예산을 따로 지정한다 (예: 쿼리 4개를 5분마다 폴링하면 하루 약 1150회).
+    """
+
+    PAGE_SIZE = 100
+    DECAY_HOURS = 3.0
+    # 이미 간격의 이 비율 이상 지난 쿼리는 함께 수집 (실행 횟수를 줄이고 쿼리 간 중복 측정 유지)
+    BATCH_FRACTION = 0.75
+
+    def __init__(self, min_interval: float = 300, max_interval: float = 21600, target_per_poll: float = 10,
+                 daily_budget: int = 1000, decay_hours: float = DECAY_HOURS):
+        """
+        Args:
+            min_interval: 최소 폴링 간격 (초)
+            max_interval: 최대 폴링 간격 (초)
+            target_per_poll: 폴링 한 번에 목표로 하는 새 기사 수
+            daily_budget: 하루 API 호출 예산 (모든 키 합계, KST 기준)
+            decay_hours: 속도가 내려갈 때 추정치를 낮추는 시정수 (시간)
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.target_per_poll = max(target_per_poll, 1)
+        self.daily_budget = daily_budget
+        self.decay_hours = decay_hours
+
+    @classmethod
+    def from_config(cls, config) -> 'PollScheduler':
+        """앱 설정으로 계획기 생성"""
+        return cls(
+            min_interval=config.get('ADAPTIVE_MIN_INTERVAL_MINUTES', 5) * 60,
+            max_interval=config.get('ADAPTIVE_MAX_INTERVAL_MINUTES', 360) * 60,
+            target_per_poll=config.get('ADAPTIVE_TARGET_NEW_PER_POLL', 10),
+            daily_budget=config.get('ADAPTIVE_DAILY_CALL_BUDGET') or cls.daily_run_calls(config)
+        )
+
+    @classmethod
+    def daily_run_calls(cls, config) -> int:
+        """
+        매일 1회 수집이 쓰던 하루 호출 수 (예산을 지정하지 않았을 때의 기본값)
+
+        쿼리 계획기는 실행당 페이지 예산(QUERY_PAGE_BUDGET, 없으면 MAX_ARTICLES_PER_DAY 기준)을
+        나누되 수집하는 쿼리마다 최소 1페이지를 배정하므로, 둘 중 큰 값이 하루 호출 수다.
+        """
+        page_budget = (config.get('QUERY_PAGE_BUDGET')
+                       or max(1, config.get('MAX_ARTICLES_PER_DAY', 1000) // cls.PAGE_SIZE))
+        queries = {query.strip() for query in config.get('SEARCH_KEYWORDS') or [] if query and query.strip()}
+        return max(page_budget, len(queries), 1)
+
+    def interval_for(self, rate: Optional[float], red: int = 0) -> float:
+        """유입 속도에 맞춘 폴링 간격 (초, 측정 전이거나 red 기사가 있으면 최소 간격)"""
+        if rate is None or red:
+            return self.min_interval
+        if rate <= 0:
+            return self.max_interval
+        return min(self.max_interval, max(self.min_interval, self.target_per_poll / rate * 3600))
+
+    def observe(self, state: Optional[Dict], new: int, red: int, now: datetime) -> Dict:
+        """
+        수집 결과를 반영한 새 상태
+
+        Args:
+            state: 이전 상태 (QueryVelocity.load_states 항목, 없으면 None)
+            new: 이번 수집의 새 기사 수 (워터마크 이후)
+            red: 이번 수집의 red 등급 기사 수
+            now: 수집 시각 (UTC)
+
+        Returns:
+            새 상태 딕셔너리
+        """
+        state = state or {}
+        rate = state.get('rate')
+        last_polled_at = state.get('last_polled_at')
+
+        # 처음 수집한 쿼리는 워터마크 이전 기사까지 가져오므로 속도 측정에서 제외
+        if last_polled_at is not None and now > last_polled_at:
+            hours = (now - last_polled_at).total_seconds() / 3600
+            sample = new / hours
+            if rate is None or sample >= rate:
+                rate = sample
+            else:
+                keep = math.exp(-hours / self.decay_hours)
+                rate = keep * rate + (1 - keep) * sample
+
+        return {
+            'rate': rate,
+            'interval_seconds': int(self.interval_for(rate, red)),
+            'last_polled_at': now,
+            'checked_at': now,
+            'last_new': new,
+            'last_red': red
+        }
+
+    def skip(self, state: Optional[Dict], now: datetime) -> Dict:
+        """수집 실행에 포함됐지만 쿼리 계획기가 제외한 쿼리의 새 상태 (속도 측정 없이 간격만 다시 시작)"""
+        state = dict(state or {})
+        state['checked_at'] = now
+        if state.get('interval_seconds') is None:
+            state['interval_seconds'] = int(self.interval_for(state.get('rate')))
+        return state
+
+    def budget_factor(self, states: Dict[str, Dict], queries: List[str], used_today: int,
+                      seconds_left: float) -> float:
+        """
+        일일 호출 예산을 지키기 위한 간격 배율 (1 이상, 예산을 다 쓰면 inf)
+
+        쿼리별 예상 호출 수(폴링마다 1페이지 + 간격 동안 쌓일 기사 페이지)를 간격으로
+        나눈 수요를, 남은 예산을 남은 시간에 고르게 나눈 공급과 비교한다.
+        """
+        remaining = self.daily_budget - used_today
+        if remaining <= 0:
+            return math.inf
+
+        demand = 0.0
+        for query in queries:
+            state = states.get(query) or {}
+            interval = state.get('interval_seconds') or self.interval_for(state.get('rate'))
+            pages = 1 + int((state.get('rate') or 0) * interval / 3600 / self.PAGE_SIZE)
+            demand += pages / interval
+        supply = remaining / max(seconds_left, 1.0)
+        return max(1.0, demand / supply) if supply > 0 else math.inf
+
+    def due(self, queries: List[str], states: Dict[str, Dict], now: datetime, factor: float = 1.0) -> List[str]:
+        """
+        이번에 수집할 쿼리 목록 (없으면 빈 목록)
+
+        간격이 지난 쿼리가 하나라도 있으면 간격의 BATCH_FRACTION 이상 지난 쿼리도 함께 수집한다.
+        """
+        if math.isinf(factor):
+            return []
+
+        progress = {}
+        for query in queries:
+            state = states.get(query) or {}
+            checked_at = state.get('checked_at')
+            if checked_at is None:
+                progress[query] = math.inf
+                continue
+            interval = (state.get('interval_seconds') or self.interval_for(state.get('rate'))) * factor
+            progress[query] = (now - checked_at).total_seconds() / interval
+
+        if not any(value >= 1.0 for value in progress.values()):
+            return []
+        return [query for query in queries if progress[query] >= self.BATCH_FRACTION]
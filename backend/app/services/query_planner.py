@@ -0,0 +1,155 @@
+from typing import Dict, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QueryPlanner:
+    """
+    검색 쿼리별 페이지 예산 계획기
+
+    최근 실행에서 각 쿼리가 다른 쿼리로는 얻지 못한 기사(고유 수확량)를 몇 개
+    가져왔는지 지수 이동 평균으로 추적하고, 고유 수확량에 비례해 페이지 예산을
+    나눈다. 고유 수확 비율이 낮은 쿼리는 제외하되 probe_every회 제외될 때마다
+    1페이지씩 다시 측정한다. 페이지 예산은 워터마크가 있는 쿼리에도 적용되므로
+    측정용 재수집은 워터마크 이후 쌓인 기사와 관계없이 1페이지로 끝난다.
+    마지막 plan에서 측정용으로 배정한 쿼리는 probes에 남는다 (이 쿼리만 예산이
+    워터마크 전에 끝나도 수집 커서를 최신 기사로 옮긴다).
+    """
+
+    PAGE_SIZE = 100
+    MAX_PAGES_PER_QUERY = 10  # 네이버 API start 최대 1000
+
+    def __init__(self, queries: List[str], page_budget: int = 10, min_unique_ratio: float = 0.05,
+                 min_runs: int = 3, probe_every: int = 5, smoothing: float = 0.3):
+        # 순서를 유지하며 중복 쿼리 제거
+        self.queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+        self.page_budget = max(page_budget, 1)
+        self.min_unique_ratio = min_unique_ratio
+        self.min_runs = min_runs
+        self.probe_every = max(probe_every, 1)
+        self.smoothing = smoothing
+        self.probes: List[str] = []
+
+    @classmethod
+    def from_config(cls, config, queries: List[str] = None) -> 'QueryPlanner':
+        """앱 설정으로 계획기 생성 (queries를 주면 SEARCH_KEYWORDS 중 해당 쿼리만 계획)"""
+        keywords = config.get('SEARCH_KEYWORDS') or []
+        if queries is not None:
+            keywords = [query for query in keywords if query in set(queries)]
+        return cls(
+            keywords,
+            page_budget=(config.get('QUERY_PAGE_BUDGET')
+                         or max(1, config.get('MAX_ARTICLES_PER_DAY', 1000) // cls.PAGE_SIZE)),
+            min_unique_ratio=config.get('QUERY_MIN_UNIQUE_RATIO', 0.05)
+        )
+
+    def plan(self, stats: Dict[str, Dict]) -> Dict[str, int]:
+        """
+        쿼리별 최대 수집 기사 수 계획
+
+        Args:
+            stats: 쿼리별 {'runs', 'fetched', 'unique', 'skipped'}
+                (fetched/unique는 지수 이동 평균, skipped는 연속 제외 횟수)
+
+        Returns:
+            쿼리별 최대 수집 기사 수 (0이면 이번 실행에서 제외)
+        """
+        weights = {}
+        probes = []
+        for query in self.queries:
+            stat = stats.get(query)
+            if not stat or stat['runs'] < self.min_runs:
+                # 측정이 부족한 쿼리는 평균 수준의 가중치로 시작
+                weights[query] = None
+                continue
+
+            # 새 기사가 거의 없는 쿼리는 중복 여부를 판단할 근거가 없으므로 유지
+            ratio = stat['unique'] / stat['fetched'] if stat['fetched'] >= 1 else 1.0
+            if ratio < self.min_unique_ratio:
+                if stat.get('skipped', 0) + 1 >= self.probe_every:
+                    probes.append(query)
+                logger.info(f"쿼리 '{query}' 제외 (고유 수확 비율 {ratio:.2f})")
+                continue
+            weights[query] = stat['unique']
+
+        known = [w for w in weights.values() if w is not None]
+        default_weight = (sum(known) / len(known)) if known else 1.0
+        weights = {q: (default_weight if w is None else w) for q, w in weights.items()}
+
+        self.probes = probes
+        pages = {query: 0 for query in self.queries}
+        for query in probes:
+            pages[query] = 1
+
+        if not weights:
+            return {query: count * self.PAGE_SIZE for query, count in pages.items()}
+
+        budget = max(self.page_budget - len(probes), len(weights))
+        total_weight = sum(weights.values())
+        for query, weight in weights.items():
+            share = (weight / total_weight) if total_weight > 0 else (1.0 / len(weights))
+            pages[query] = min(self.MAX_PAGES_PER_QUERY, max(1, round(budget * share)))
+
+        logger.info(f"쿼리 페이지 계획: {pages}")
+        return {query: count * self.PAGE_SIZE for query, count in pages.items()}
+
+    def measure(self, query_urls: Dict[str, List[str]]) -> Dict[str, Tuple[int, int]]:
+        """
+        이번 실행의 쿼리별 (수집 수, 고유 수) 측정
+
+        결과가 많은 쿼리부터 차례로 이미 나온 URL을 제외한 개수를 고유 수로
+        센다 (탐욕적 집합 덮개). 결과가 같은 두 쿼리 중 하나만 고유 수를 갖는다.
+        """
+        url_sets = {query: set(urls) for query, urls in query_urls.items()}
+        covered = set()
+        measurements = {}
+        for query in sorted(url_sets, key=lambda q: len(url_sets[q]), reverse=True):
+            urls = url_sets[query]
+            measurements[query] = (len(urls), len(urls - covered))
+            covered |= urls
+        return measurements
+
+    def update_stats(self, stats: Dict[str, Dict], measurements: Dict[str, Tuple[int, int]]) -> Dict[str, Dict]:
+        """측정값을 지수 이동 평균으로 반영한 새 통계 (실행되지 않은 쿼리는 skipped 증가)"""
+        updated = {}
+        for query in self.queries:
+            stat = stats.get(query)
+
+            if query not in measurements:
+                if stat:
+                    updated[query] = dict(stat, skipped=stat.get('skipped', 0) + 1)
+                continue
+
+            fetched, unique = measurements[query]
+            if not stat or stat['runs'] == 0:
+                updated[query] = {'runs': 1, 'fetched': float(fetched), 'unique': float(unique), 'skipped': 0}
+                continue
+
+            alpha = self.smoothing
+            updated[query] = {
+                'runs': stat['runs'] + 1,
+                'fetched': (1 - alpha) * stat['fetched'] + alpha * fetched,
+                'unique': (1 - alpha) * stat['unique'] + alpha * unique,
+                'skipped': 0
+            }
+        return updated
+
+    def update_skipped(self, stats: Dict[str, Dict], limits: Dict[str, int]) -> Dict[str, Dict]:
+        """
+        일부 쿼리만 수집한 실행의 통계 갱신 (연속 제외 횟수만 반영)
+
+        단독으로 수집한 쿼리는 다른 쿼리와의 중복을 측정할 수 없으므로 이동 평균은
+        그대로 두고, 제외된 쿼리는 skipped를 늘리고 수집된 쿼리는 0으로 되돌린다.
+        그래야 적응형 스케줄에서도 probe_every회 제외된 쿼리가 다시 측정된다.
+        """
+        updated = {}
+        for query in self.queries:
+            stat = stats.get(query)
+            if not stat:
+                continue
+            if limits.get(query, 0) <= 0:
+                updated[query] = dict(stat, skipped=stat.get('skipped', 0) + 1)
+            elif stat.get('skipped', 0):
+                updated[query] = dict(stat, skipped=0)
+        return updated
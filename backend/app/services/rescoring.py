@@ -0,0 +1,228 @@
+"""
+Rescoring stored articles: shared write path and rule-delta rescoring via the keyword index
+"""
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from app import db
+from app.models.article import Article
+from app.models.article_keyword import ArticleKeyword
+from app.models.classifier_ruleset import ClassifierRuleset
+from app.services.article_classifier import ArticleClassifier, RULESET_LISTS, content_hash
+
+logger = logging.getLogger(__name__)
+
+# 재분류로 갱신하는 컬럼 (관련 여부 is_medical은 유지)
+RESCORE_COLUMNS = [
+    'category', 'confidence_score', 'keywords',
+    'sentiment', 'needs_response', 'risk_level', 'risk_score'
+]
+
+# 키워드 목록별로만 영향을 주는 가중치 (나머지 가중치가 바뀌면 전체 재분류)
+_LIST_WEIGHTS = {
+    'sentiment_title': ('negative_keywords', 'positive_keywords'),
+    'sentiment_body': ('negative_keywords', 'positive_keywords'),
+    'high_risk_title': ('high_risk_keywords',),
+    'high_risk_body': ('high_risk_keywords',),
+    'medium_risk_title': ('medium_risk_keywords',),
+    'medium_risk_body': ('medium_risk_keywords',)
+}
+# 관련도 점수 가중치 (정규화 분모에도 쓰이므로 회사/검색 키워드 전체에 영향)
+_RELEVANCE_WEIGHTS = ('company_title', 'company_body', 'search_title', 'search_body')
+
+
+def write_scores(pending: List[Tuple[int, str]], scored: List[Dict], ruleset_version: str):
+    """
+    재분류 결과를 기본 키 기준 일괄 UPDATE로 저장하고 키워드 역색인 교체 (커밋은 호출자가 수행)
+
+    Args:
+        pending: (기사 ID, 내용 해시) 목록
+        scored: pending과 같은 순서의 score_article 결과
+        ruleset_version: 분류에 쓴 규칙 버전
+    """
+    if not pending:
+        return
+    db.session.execute(db.update(Article), [
+        {
+            'id': article_id,
+            **{column: fields[column] for column in RESCORE_COLUMNS},
+            'content_hash': digest,
+            'ruleset_version': ruleset_version
+        }
+        for (article_id, digest), fields in zip(pending, scored)
+    ])
+    ArticleKeyword.replace({
+        article_id: fields['matched_keywords'] for (article_id, _), fields in zip(pending, scored)
+    })
+
+
+def _patterns(rules: Dict, name: str) -> List[str]:
+    """규칙 목록의 오토마톤 패턴 (회사/검색 키워드는 소문자로 비교)"""
+    keywords = rules.get(name) or []
+    if name in ('hashed_company_keywords', 'search_keywords'):
+        return [keyword.lower() for keyword in keywords]
+    return list(keywords)
+
+
+def changed_keywords(old: Dict, new: Dict) -> Optional[Set[str]]:
+    """
+    두 규칙 사이에 분류 결과가 달라질 수 있는 키워드
+
+    기사의 분류 결과는 기사에 나온 키워드와 그 키워드가 속한 목록의 가중치로만
+    정해지므로, 바뀐 키워드가 하나도 없는 기사는 결과가 같다.
+
+    Args:
+        old: 이전 규칙 (ArticleClassifier.ruleset())
+        new: 새 규칙
+
+    Returns:
+        키워드 집합 (오토마톤 패턴 문자열). 모든 기사에 영향을 주는 변경이면 None
+    """
+    if old.get('revision') != new.get('revision'):
+        return None
+
+    old_weights, new_weights = old.get('weights', {}), new.get('weights', {})
+    changed_weights = {
+        name for name in set(old_weights) | set(new_weights)
+        if old_weights.get(name) != new_weights.get(name)
+    }
+    if changed_weights - set(_LIST_WEIGHTS) - set(_RELEVANCE_WEIGHTS):
+        return None
+
+    changed = set()
+
+    # 회사/검색 키워드: 목록 길이가 정규화 분모이고 순서가 키워드 출력 순서이므로 목록 전체
+    relevance_lists = ('hashed_company_keywords', 'search_keywords')
+    if changed_weights & set(_RELEVANCE_WEIGHTS) or any(old.get(name) != new.get(name) for name in relevance_lists):
+        for rules in (old, new):
+            for name in relevance_lists:
+                changed.update(_patterns(rules, name))
+
+    # 나머지 목록: 출현 여부만 쓰이므로 추가/삭제된 키워드 (가중치가 바뀌면 목록 전체)
+    weighted_lists = {name for weight in changed_weights & set(_LIST_WEIGHTS) for name in _LIST_WEIGHTS[weight]}
+    for name in RULESET_LISTS:
+        if name == 'hashed_company_keywords':
+            continue
+        old_counts, new_counts = Counter(_patterns(old, name)), Counter(_patterns(new, name))
+        if name in weighted_lists:
+            changed.update(old_counts.keys() | new_counts.keys())
+        else:
+            changed.update(keyword for keyword in old_counts.keys() | new_counts.keys()
+                           if old_counts[keyword] != new_counts[keyword])
+
+    # 카테고리: 순서가 동점 처리 기준이므로 이름/순서가 바뀌면 카테고리 키워드 전체
+    old_categories = [(category, Counter(keywords)) for category, keywords in old.get('category_keywords', [])]
+    new_categories = [(category, Counter(keywords)) for category, keywords in new.get('category_keywords', [])]
+    if [category for category, _ in old_categories] != [category for category, _ in new_categories]:
+        for _, counts in old_categories + new_categories:
+            changed.update(counts)
+    else:
+        for (_, old_counts), (_, new_counts) in zip(old_categories, new_categories):
+            changed.update(keyword for keyword in old_counts.keys() | new_counts.keys()
+                           if old_counts[keyword] != new_counts[keyword])
+
+    return changed
+
+
+def _scan_article_ids(keywords: List[str], version: str) -> Set[int]:
+    """
+    색인에 없는 (새로 추가된) 키워드가 나온 기사 후보를 텍스트 검색으로 조회
+
+    대소문자 구분 없이 찾으므로 실제 매칭보다 넓은 후보가 나오고, 후보는 다시 분류한다.
+    (SQLite의 lower()는 ASCII만 변환한다)
+    """
+    text = db.func.lower(Article.title + ' ' + db.func.coalesce(Article.description, ''))
+    ids = set()
+    for keyword in keywords:
+        ids.update(
+            article_id for (article_id,) in db.session.query(Article.id).filter(
+                Article.ruleset_version == version,
+                text.contains(keyword.lower(), autoescape=True)
+            )
+        )
+    return ids
+
+
+def rescore_rule_delta(classifier: ArticleClassifier, scorer=None, batch_size: int = 5000) -> Dict[str, int]:
+    """
+    규칙 변경으로 결과가 달라질 수 있는 기사만 재분류
+
+    이전 규칙 버전으로 분류된 기사마다 저장된 규칙과 현재 규칙을 비교해 바뀐 키워드를
+    구하고, 키워드 역색인(새 키워드는 텍스트 검색)으로 해당 기사만 다시 분류한다.
+    나머지 기사는 결과가 같으므로 규칙 버전만 갱신한다. 규칙이 저장되지 않았거나
+    모든 기사에 영향을 주는 변경이면 그 버전의 기사는 건너뛴다 (일반 재분류 대상).
+    앱 컨텍스트 안에서 호출해야 한다.
+
+    Args:
+        classifier: 현재 규칙의 분류기
+        scorer: classify((제목, 요약) 목록)을 제공하는 채점기 (예: ParallelClassifier, 없으면 classifier로 채점)
+        batch_size: 한 번에 읽고 갱신할 기사 수
+
+    Returns:
+        {'versions', 'rescored', 'carried_over', 'skipped_versions'}
+    """
+    version = classifier.ruleset_version
+    ClassifierRuleset.record(classifier)
+    new_rules = classifier.ruleset()
+    new_vocabulary = set(classifier._automaton.patterns)
+
+    stats = {'versions': 0, 'rescored': 0, 'carried_over': 0, 'skipped_versions': 0}
+    removed = set()
+    old_versions = [
+        old_version for (old_version,) in db.session.query(Article.ruleset_version).filter(
+            Article.is_medical == True,
+            Article.ruleset_version.isnot(None),
+            Article.ruleset_version != version
+        ).distinct()
+    ]
+    for old_version in old_versions:
+        old_rules = ClassifierRuleset.load_rules(old_version)
+        changed = changed_keywords(old_rules, new_rules) if old_rules is not None else None
+        if changed is None:
+            stats['skipped_versions'] += 1
+            logger.info(f"규칙 버전 {old_version}: 규칙 기록이 없거나 전체에 영향을 주는 변경 → 일반 재분류 대상")
+            continue
+
+        old_vocabulary = set(ArticleClassifier.from_ruleset(old_rules)._automaton.patterns)
+        indexed = changed & old_vocabulary
+        added = changed - old_vocabulary
+        removed |= old_vocabulary - new_vocabulary
+
+        # 내용이 바뀐 기사(content_hash 비어 있음)는 색인이 맞지 않으므로 일반 재분류에 맡긴다
+        in_version = db.and_(Article.is_medical == True, Article.ruleset_version == old_version,
+                             Article.content_hash.isnot(None))
+        candidates = ArticleKeyword.article_ids(indexed) | _scan_article_ids(sorted(added), old_version)
+        candidate_ids = sorted(candidates)
+
+        rescored = 0
+        for i in range(0, len(candidate_ids), batch_size):
+            rows = (db.session.query(Article.id, Article.title, Article.description)
+                    .filter(in_version, Article.id.in_(candidate_ids[i:i + batch_size])).all())
+            if not rows:
+                continue
+            if scorer is not None:
+                scored = scorer.classify((row.title, row.description) for row in rows)
+            else:
+                scored = [classifier.score_article(row.title, row.description or "") for row in rows]
+            write_scores([(row.id, content_hash(row.title, row.description or "")) for row in rows],
+                         scored, version)
+            db.session.commit()
+            rescored += len(rows)
+
+        # 바뀐 키워드가 없는 나머지 기사는 결과가 같으므로 버전만 갱신
+        carried_over = (db.session.query(Article).filter(in_version)
+                        .update({Article.ruleset_version: version}, synchronize_session=False))
+        db.session.commit()
+
+        stats['versions'] += 1
+        stats['rescored'] += rescored
+        stats['carried_over'] += carried_over
+        logger.info(f"규칙 버전 {old_version} → {version}: 바뀐 키워드 {len(changed)}개 "
+                    f"(새 키워드 {len(added)}개), 재분류 {rescored}개, 버전만 갱신 {carried_over}개")
+
+    # 규칙에서 빠진 키워드의 색인 정리
+    if removed:
+        ArticleKeyword.remove_keywords(sorted(removed))
+    db.session.commit()
+    return stats
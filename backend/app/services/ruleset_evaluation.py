@@ -0,0 +1,205 @@
+"""
+Offline evaluation of a candidate classifier ruleset against the current one over stored articles
+"""
+import logging
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app import db
+from app.models.article import Article
+from app.services.article_classifier import ArticleClassifier
+from app.services.batch_scoring import BatchScorer, shared_automaton
+
+logger = logging.getLogger(__name__)
+
+# 표본으로 보여줄 변경 종류
+SAMPLE_KINDS = ['relevance_gained', 'relevance_lost', 'category', 'risk_level']
+
+_LEVELS = np.array(['green', 'amber', 'red'], dtype=object)
+_SENTIMENTS = np.array(['neutral', 'negative', 'positive'], dtype=object)
+
+# 작업 프로세스별 (현재, 후보) 채점기와 공용 오토마톤 (initializer에서 한 번만 생성)
+_worker_state = None
+
+
+def _init_worker(current_rules: Dict, candidate_rules: Dict, samples: int):
+    """작업 프로세스 초기화: 두 규칙의 분류기와 공용 오토마톤을 한 번만 컴파일"""
+    global _worker_state
+    current = ArticleClassifier.from_ruleset(current_rules)
+    candidate = ArticleClassifier.from_ruleset(candidate_rules)
+    _worker_state = (BatchScorer(current), BatchScorer(candidate), shared_automaton([current, candidate]), samples)
+
+
+def _labels(scorer: BatchScorer, scores: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """채점 배열을 비교용 라벨 배열로 변환 (카테고리는 이름, 관련 없으면 None)"""
+    names = np.array(scorer.classifier._categories + ['기타', None], dtype=object)
+    return {
+        'is_medical': scores['is_medical'],
+        'category': names[scores['category']],  # -2 → '기타', -1 → None
+        'sentiment': _SENTIMENTS[scores['sentiment']],
+        'needs_response': scores['needs_response'],
+        'risk_level': _LEVELS[scores['risk_level']],
+        'risk_score': scores['risk_score']
+    }
+
+
+def _compare_chunk(rows: List[Tuple[int, str, str]]) -> Dict:
+    """
+    작업 프로세스에서 (ID, 제목, 요약) 묶음을 두 규칙으로 채점해 차이 집계
+
+    텍스트는 공용 오토마톤으로 한 번만 순회하고, 같은 매칭 행렬을 두 규칙으로 채점한다.
+    """
+    current_scorer, candidate_scorer, automaton, samples = _worker_state
+    matrix = current_scorer.extract(((title, description) for _, title, description in rows), automaton)
+    old = _labels(current_scorer, current_scorer.score(matrix))
+    new = _labels(candidate_scorer, candidate_scorer.score(matrix))
+    ids = np.array([article_id for article_id, _, _ in rows], dtype=np.int64)
+
+    gained = ~old['is_medical'] & new['is_medical']
+    lost = old['is_medical'] & ~new['is_medical']
+    category = old['category'] != new['category']
+    risk_level = old['risk_level'] != new['risk_level']
+    changed = (gained | lost | category | risk_level |
+               (old['sentiment'] != new['sentiment']) | (old['needs_response'] != new['needs_response']))
+
+    def transitions(mask, label):
+        changed_rows = np.flatnonzero(mask)
+        return Counter(zip(old[label][changed_rows].tolist(), new[label][changed_rows].tolist()))
+
+    def sample(mask):
+        return [
+            {
+                'id': int(ids[row]),
+                'title': rows[row][1],
+                'current': {label: values[row:row + 1].tolist()[0] for label, values in old.items()},
+                'candidate': {label: values[row:row + 1].tolist()[0] for label, values in new.items()}
+            }
+            for row in np.flatnonzero(mask)[:samples].tolist()
+        ]
+
+    return {
+        'articles': len(rows),
+        'changed': int(changed.sum()),
+        'relevance_gained': int(gained.sum()),
+        'relevance_lost': int(lost.sum()),
+        'sentiment_changes': int((old['sentiment'] != new['sentiment']).sum()),
+        'needs_response_flips': int((old['needs_response'] != new['needs_response']).sum()),
+        'category_changes': transitions(category, 'category'),
+        'risk_level_migrations': transitions(risk_level, 'risk_level'),
+        # 관련 기사의 리스크 레벨 분포 (대시보드에 보이는 기사)
+        'risk_levels': (Counter(old['risk_level'][old['is_medical']].tolist()),
+                        Counter(new['risk_level'][new['is_medical']].tolist())),
+        'samples': {
+            'relevance_gained': sample(gained),
+            'relevance_lost': sample(lost),
+            'category': sample(category & old['is_medical'] & new['is_medical']),
+            'risk_level': sample(risk_level)
+        }
+    }
+
+
+def _iter_chunks(chunk_size: int):
+    """articles 전체를 ID 순서로 (ID, 제목, 요약) 묶음으로 읽기 (키셋 페이지네이션)"""
+    last_id = 0
+    while True:
+        rows = (db.session.query(Article.id, Article.title, Article.description)
+                .filter(Article.id > last_id).order_by(Article.id).limit(chunk_size).all())
+        if not rows:
+            return
+        last_id = rows[-1].id
+        yield [(row.id, row.title or '', row.description or '') for row in rows]
+
+
+def evaluate_ruleset(current: ArticleClassifier, candidate: ArticleClassifier, workers: int = 0,
+                     chunk_size: int = 2000, samples: int = 5) -> Dict:
+    """
+    후보 규칙을 현재 규칙과 나란히 저장된 기사 전체에 적용해 결과 차이 보고
+
+    기사는 chunk_size 단위로 읽어 작업 프로세스에서 채점하고 (동시에 처리 중인
+    묶음은 작업 프로세스 수의 두 배까지), 집계만 돌려받는다. 저장된 기사는
+    수정하지 않는다. 앱 컨텍스트 안에서 호출해야 한다. 작업 프로세스는 spawn으로
+    시작하므로 스레드가 여러 개인 웹 워커에서 호출해도 잠금 상태가 복제되지 않는다.
+
+    Args:
+        current: 현재 규칙의 분류기
+        candidate: 후보 규칙의 분류기
+        workers: 작업 프로세스 수 (0이면 CPU 코어 수, 1이면 현재 프로세스에서 채점)
+        chunk_size: 한 번에 읽고 채점할 기사 수
+        samples: 변경 종류별 표본 기사 수 (ID 순)
+
+    Returns:
+        {'current_version', 'candidate_version', 'articles', 'changed', 'relevance',
+         'category_changes', 'risk_level_migrations', 'risk_levels', 'sentiment_changes',
+         'needs_response_flips', 'samples', 'elapsed_sec'}
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    initargs = (current.ruleset(), candidate.ruleset(), samples)
+
+    totals = Counter()
+    category_changes, risk_migrations = Counter(), Counter()
+    risk_levels = (Counter(), Counter())
+    collected = {kind: [] for kind in SAMPLE_KINDS}
+
+    def merge(result):
+        for name in ('articles', 'changed', 'relevance_gained', 'relevance_lost',
+                     'sentiment_changes', 'needs_response_flips'):
+            totals[name] += result[name]
+        category_changes.update(result['category_changes'])
+        risk_migrations.update(result['risk_level_migrations'])
+        risk_levels[0].update(result['risk_levels'][0])
+        risk_levels[1].update(result['risk_levels'][1])
+        for kind in SAMPLE_KINDS:
+            collected[kind].extend(result['samples'][kind])
+
+    if workers <= 1:
+        _init_worker(*initargs)
+        for chunk in _iter_chunks(chunk_size):
+            merge(_compare_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=initargs) as executor:
+            pending = set()
+            for chunk in _iter_chunks(chunk_size):
+                # 읽기가 채점보다 빠르면 메모리가 늘지 않도록 처리 중인 묶음 수 제한
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        merge(future.result())
+                pending.add(executor.submit(_compare_chunk, chunk))
+            for future in pending:
+                merge(future.result())
+
+    def transition_list(counts):
+        return [{'from': old, 'to': new, 'count': count}
+                for (old, new), count in sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))]
+
+    report = {
+        'current_version': current.ruleset_version,
+        'candidate_version': candidate.ruleset_version,
+        'articles': totals['articles'],
+        'changed': totals['changed'],
+        'relevance': {'gained': totals['relevance_gained'], 'lost': totals['relevance_lost']},
+        'category_changes': transition_list(category_changes),
+        'risk_level_migrations': transition_list(risk_migrations),
+        'risk_levels': {
+            'current': {level: risk_levels[0][level] for level in _LEVELS},
+            'candidate': {level: risk_levels[1][level] for level in _LEVELS}
+        },
+        'sentiment_changes': totals['sentiment_changes'],
+        'needs_response_flips': totals['needs_response_flips'],
+        # 완료 순서와 무관하게 같은 표본이 나오도록 ID가 작은 순
+        'samples': {kind: sorted(rows, key=lambda row: row['id'])[:samples] for kind, rows in collected.items()},
+        'elapsed_sec': round(time.perf_counter() - started, 3)
+    }
+    logger.info(f"규칙 평가 {report['current_version']} → {report['candidate_version']}: "
+                f"기사 {report['articles']}개 중 {report['changed']}개 변경 "
+                f"(관련 +{report['relevance']['gained']}/-{report['relevance']['lost']}), "
+                f"{report['elapsed_sec']}초")
+    return report
@@ -0,0 +1,117 @@
+"""
+Scheduler leader election: only the process holding the 'scheduler' lease runs APScheduler jobs.
+Other processes keep their scheduler paused and take over when the leader's lease expires.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from app import db
+from app.models.lease import Lease
+
+logger = logging.getLogger(__name__)
+
+# 스케줄러 리더 임대 이름
+SCHEDULER_LEASE = 'scheduler'
+
+
+class SchedulerLeader:
+    """
+    APScheduler를 리더 프로세스에서만 실행
+
+    모든 워커가 같은 작업을 등록하고 스케줄러를 일시정지 상태로 시작한다. 임대를 얻은
+    프로세스만 스케줄러를 재개하고 check_interval마다 임대를 갱신한다. 리더가 종료되면
+    임대가 ttl 뒤에 만료되고, 다음 확인에서 다른 프로세스가 임대를 얻어 작업을 인계한다.
+    """
+
+    def __init__(self, app, scheduler, ttl: float = 30, check_interval: float = 10):
+        """
+        Args:
+            app: Flask 앱 (확인 스레드에서 앱 컨텍스트 생성)
+            scheduler: 작업을 등록한 APScheduler (아직 시작하지 않은 상태)
+            ttl: 임대 유효 시간 (초, 리더가 죽은 뒤 인계까지 걸리는 최대 시간)
+            check_interval: 임대 획득/갱신 간격 (초, ttl보다 충분히 짧아야 함)
+        """
+        self.app = app
+        self.scheduler = scheduler
+        self.ttl = timedelta(seconds=ttl)
+        self.check_interval = check_interval
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._renewed_at = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """스케줄러를 일시정지 상태로 시작하고 리더 확인 스레드 실행"""
+        self.scheduler.start(paused=True)
+        self._thread = threading.Thread(target=self._run, name='scheduler-leader', daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """확인 스레드 중지, 보유 중인 임대 반납(다른 프로세스가 바로 인계), 스케줄러 종료"""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.check_interval)
+
+        if self.is_leader:
+            self._demote('프로세스 종료')
+            with self.app.app_context():
+                try:
+                    Lease.release(SCHEDULER_LEASE, self.holder)
+                    db.session.commit()
+                except Exception as e:
+                    logger.warning(f"스케줄러 임대 반납 실패: {e}")
+                    db.session.rollback()
+                finally:
+                    db.session.remove()
+
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+
+    def _run(self):
+        """check_interval마다 임대 획득(팔로워) 또는 갱신(리더)"""
+        while not self._stop.is_set():
+            with self.app.app_context():
+                try:
+                    self._check()
+                finally:
+                    db.session.remove()
+            self._stop.wait(self.check_interval)
+
+    def _check(self):
+        """임대 상태에 따라 스케줄러 재개/일시정지"""
+        try:
+            if self.is_leader:
+                held = Lease.renew(SCHEDULER_LEASE, self.holder, self.ttl)
+            else:
+                held = Lease.acquire(SCHEDULER_LEASE, self.holder, self.ttl)
+            db.session.commit()
+        except Exception as e:
+            logger.warning(f"스케줄러 임대 확인 실패: {e}")
+            db.session.rollback()
+            # 마지막 갱신이 만료되기 전까지는 리더 유지 (일시적인 DB 오류로 작업을 멈추지 않음)
+            if self.is_leader and time.monotonic() - self._renewed_at >= self.ttl.total_seconds() - self.check_interval:
+                self._demote('임대 갱신 실패')
+            return
+
+        if held:
+            self._renewed_at = time.monotonic()
+            if not self.is_leader:
+                self.is_leader = True
+                self.scheduler.resume()
+                logger.info(f"스케줄러 리더 선출: {self.holder}")
+        elif self.is_leader:
+            self._demote('다른 프로세스가 임대 인수')
+
+    def _demote(self, reason: str):
+        """리더 해제 (스케줄러 일시정지)"""
+        self.is_leader = False
+        self.scheduler.pause()
+        logger.info(f"스케줄러 리더 해제 ({reason}): {self.holder}")
@@ -0,0 +1,316 @@
+"""
+Near-duplicate story index (MinHash + LSH) for syndicated articles
+"""
+import hashlib
+import struct
+import threading
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.utils.normalization import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# 스토리 대표 기사에서 재사용하는 AI 분석 필드
+# (risk_level/risk_score는 기사마다 다를 수 있으므로 복사하지 않고 기사 자신의 값 유지)
+AI_ANALYSIS_COLUMNS = ['ai_summary', 'ai_risk_analysis', 'similar_cases']
+
+
+class MinHasher:
+    """
+    문자 n-gram 집합의 MinHash 서명 계산기
+
+    n-gram마다 salt가 다른 blake2b(64바이트) 다이제스트를 이어 붙여 num_perm개의
+    독립적인 32비트 해시를 만들고, 위치별 최솟값을 서명으로 쓴다.
+    """
+
+    _LANES_PER_DIGEST = 16  # 64바이트 다이제스트 = 32비트 해시 16개
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3):
+        if num_perm % self._LANES_PER_DIGEST:
+            raise ValueError(f"num_perm은 {self._LANES_PER_DIGEST}의 배수여야 합니다: {num_perm}")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._salts = [f'minhash{i}'.encode() for i in range(num_perm // self._LANES_PER_DIGEST)]
+        self._format = f'<{num_perm}I'
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """
+        정규화한 텍스트의 MinHash 서명
+
+        Returns:
+            num_perm개의 32비트 정수 (텍스트가 너무 짧으면 None)
+        """
+        normalized = normalize_text(text)
+        size = self.shingle_size
+        if len(normalized) < size:
+            return None
+
+        shingles = {normalized[i:i + size].encode('utf-8') for i in range(len(normalized) - size + 1)}
+        hashes = [
+            struct.unpack(self._format, b''.join(
+                hashlib.blake2b(shingle, digest_size=64, salt=salt).digest() for salt in self._salts
+            ))
+            for shingle in shingles
+        ]
+        return tuple(map(min, zip(*hashes)))
+
+    @staticmethod
+    def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        """두 서명으로 추정한 Jaccard 유사도"""
+        return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+    def to_bytes(self, signature: Tuple[int, ...]) -> bytes:
+        return struct.pack(self._format, *signature)
+
+    def from_bytes(self, data: bytes) -> Optional[Tuple[int, ...]]:
+        if not data or len(data) != self.num_perm * 4:
+            return None
+        return struct.unpack(self._format, data)
+
+
+class Story:
+    """같은 기사로 묶인 유사 기사 묶음 (대표 기사의 canonical_key와 서명)"""
+
+    __slots__ = ('key', 'signature', 'last_seen')
+
+    def __init__(self, key: str, signature: Tuple[int, ...], last_seen: datetime):
+        self.key = key
+        self.signature = signature
+        self.last_seen = last_seen
+
+
+class StoryIndex:
+    """
+    MinHash LSH 스토리 인덱스
+
+    서명을 band_rows개씩 묶은 밴드별 버킷에 스토리를 넣고, 새 기사는 같은 버킷에
+    걸린 후보와만 유사도를 비교한다. 비교 비용은 전체 스토리 수가 아니라 버킷
+    크기에 비례하고, 인덱스에는 최근 window_days 동안 본 스토리만 유지한다.
+    """
+
+    def __init__(self, hasher: MinHasher = None, threshold: float = 0.4, band_rows: int = 3,
+                 window_days: int = 7):
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self.band_rows = band_rows
+        self.window = timedelta(days=window_days)
+        self._stories: Dict[str, Story] = {}
+        self._buckets: Dict[Tuple, set] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._pruned_at = datetime.utcnow()
+
+    def __len__(self):
+        return len(self._stories)
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[Tuple]:
+        rows = self.band_rows
+        return [
+            (i, signature[i:i + rows])
+            for i in range(0, len(signature) - rows + 1, rows)
+        ]
+
+    def match(self, signature: Tuple[int, ...]) -> Optional[Story]:
+        """유사도가 threshold 이상인 스토리 중 가장 비슷한 스토리"""
+        with self._lock:
+            candidates = set()
+            for band in self._bands(signature):
+                candidates.update(self._buckets.get(band, ()))
+
+            best, best_score = None, self.threshold
+            for key in candidates:
+                story = self._stories[key]
+                score = self.hasher.similarity(signature, story.signature)
+                if score >= best_score:
+                    best, best_score = story, score
+            return best
+
+    def add(self, key: str, signature: Tuple[int, ...], seen_at: datetime = None) -> Story:
+        """새 스토리 등록 (이미 있으면 기존 스토리 반환)"""
+        seen_at = seen_at or datetime.utcnow()
+        with self._lock:
+            story = self._stories.get(key)
+            if story is None:
+                story = Story(key, signature, seen_at)
+                self._stories[key] = story
+                for band in self._bands(signature):
+                    self._buckets[band].add(key)
+            return story
+
+    def touch(self, story: Story, seen_at: datetime = None):
+        story.last_seen = max(story.last_seen, seen_at or datetime.utcnow())
+
+    def prune(self, now: datetime = None):
+        """window_days보다 오래 보지 못한 스토리 제거"""
+        now = now or datetime.utcnow()
+        cutoff = now - self.window
+        with self._lock:
+            expired = [story for story in self._stories.values() if story.last_seen < cutoff]
+            for story in expired:
+                del self._stories[story.key]
+                for band in self._bands(story.signature):
+                    bucket = self._buckets.get(band)
+                    if bucket is not None:
+                        bucket.discard(story.key)
+                        if not bucket:
+                            del self._buckets[band]
+            self._pruned_at = now
+        if expired:
+            logger.info(f"스토리 인덱스 정리: {len(expired)}개 제거 (남은 스토리 {len(self._stories)}개)")
+
+    def prune_if_due(self, interval: timedelta = timedelta(hours=1)):
+        if datetime.utcnow() - self._pruned_at >= interval:
+            self.prune()
+
+
+class StoryMatcher:
+    """
+    분류기 앞단의 유사 기사 매칭 단계
+
+    ArticleClassifier와 같은 batch_classify 인터페이스를 제공한다. 분류는 기사마다
+    자신의 텍스트로 하고, 관련 기사(저장되는 기사)만 이미 본 스토리(또는 같은
+    배치의 앞선 관련 기사)와 묶어 story_key를 채운다. 스토리 대표는 저장되는
+    기사이므로 재시작 후 DB에서 다시 불러올 수 있다. 재전송 기사도 제목이나
+    리드 문장이 달라 리스크 점수와 감성이 바뀔 수 있으므로 분류 결과는 복사하지
+    않고, 같은 스토리끼리는 AI 분석 결과만 재사용한다 (reuse_story_analysis).
+    인덱스는 메모리에만 있으므로 분류 스레드에서 DB 접근 없이 실행된다.
+    """
+
+    def __init__(self, classifier, index: StoryIndex):
+        self.classifier = classifier
+        self.index = index
+        self.linked = 0
+
+    @property
+    def ruleset_version(self) -> str:
+        return self.classifier.ruleset_version
+
+    def batch_classify(self, articles: List[Dict]) -> List[Dict]:
+        """
+        기사를 분류한 뒤 관련 기사만 스토리에 연결
+
+        관련 기사에 minhash(서명 바이트)와 story_key(대표 기사 canonical_key)를 채운다.
+
+        Returns:
+            관련 기사 목록 (입력 순서 유지)
+        """
+        relevant = self.classifier.batch_classify(articles)
+
+        linked = 0
+        for article in relevant:
+            signature = self.index.hasher.signature(
+                f"{article.get('title', '')} {article.get('description', '')}"
+            )
+            if signature is None:
+                continue
+            article['minhash'] = self.index.hasher.to_bytes(signature)
+
+            story = self.index.match(signature)
+            if story is not None:
+                linked += 1
+            elif article.get('canonical_key'):
+                story = self.index.add(article['canonical_key'], signature)
+            else:
+                continue
+            self.index.touch(story)
+            article['story_key'] = story.key
+
+        self.linked += linked
+        if linked:
+            logger.info(f"유사 기사 {linked}개를 기존 스토리에 연결")
+        self.index.prune_if_due()
+        return relevant
+
+
+_story_index: Optional[StoryIndex] = None
+_story_index_lock = threading.Lock()
+
+
+def get_story_index(config) -> Optional[StoryIndex]:
+    """
+    프로세스 공용 스토리 인덱스 (처음 호출 시 최근 대표 기사로 채움)
+
+    앱 컨텍스트 안에서 호출해야 한다. NEAR_DUP_ENABLED가 꺼져 있으면 None.
+    """
+    global _story_index
+    if not config.get('NEAR_DUP_ENABLED', True):
+        return None
+
+    with _story_index_lock:
+        if _story_index is None:
+            _story_index = _load_story_index(config)
+        return _story_index
+
+
+def _load_story_index(config) -> StoryIndex:
+    """
+    최근 window_days 동안 저장된 스토리 기사로 인덱스 생성
+
+    대표 기사를 먼저 읽고, 대표 기사가 저장되지 않은 스토리는 가장 먼저 저장된 기사의 서명을 쓴다.
+    """
+    from app import db
+    from app.models.article import Article
+
+    index = StoryIndex(
+        threshold=config.get('NEAR_DUP_THRESHOLD', 0.4),
+        window_days=config.get('NEAR_DUP_WINDOW_DAYS', 7)
+    )
+    since = datetime.utcnow() - index.window
+    is_leader = Article.story_key == Article.canonical_key
+    rows = (db.session.query(Article.story_key, Article.minhash, Article.created_at)
+            .filter(Article.created_at >= since,
+                    Article.minhash.isnot(None),
+                    Article.story_key.isnot(None))
+            .order_by(is_leader.desc(), Article.created_at)
+            .yield_per(5000))
+    for row in rows:
+        signature = index.hasher.from_bytes(row.minhash)
+        if signature is None:
+            continue
+        # 이미 등록된 스토리면 마지막으로 본 시각만 갱신
+        index.touch(index.add(row.story_key, signature, seen_at=row.created_at), row.created_at)
+
+    logger.info(f"스토리 인덱스 로드: {len(index)}개 (최근 {index.window.days}일)")
+    return index
+
+
+def reset_story_index():
+    """다음 호출 때 DB에서 다시 로드하도록 인덱스 초기화"""
+    global _story_index
+    with _story_index_lock:
+        _story_index = None
+
+
+def reuse_story_analysis(article) -> bool:
+    """
+    같은 스토리의 다른 기사에 AI 분석 결과가 있으면 복사 (리스크 레벨/점수는 기사 자신의 값 유지)
+
+    Args:
+        article: AI 분석 대상 Article
+
+    Returns:
+        재사용했으면 True (커밋은 호출자가 수행)
+    """
+    from app.models.article import Article
+
+    if not article.story_key:
+        return False
+
+    analyzed = Article.query.filter(
+        Article.story_key == article.story_key,
+        Article.id != article.id,
+        Article.ai_summary.isnot(None)
+    ).order_by(Article.updated_at.desc()).first()
+    if analyzed is None:
+        return False
+
+    for column in AI_ANALYSIS_COLUMNS:
+        setattr(article, column, getattr(analyzed, column))
+    # 체크리스트는 기사별로 관리하므로 체크 상태는 초기화
+    article.action_items = [
+        {'text': item.get('text'), 'checked': False} for item in (analyzed.action_items or [])
+    ]
+    logger.info(f"기사 {article.id}: 스토리 기사 {analyzed.id}의 AI 분석 재사용")
+    return True
@@ -0,0 +1,106 @@
+"""
+Process-wide Bloom filter over stored article URLs and canonical keys
+"""
+import hashlib
+import math
+import threading
+import logging
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class UrlBloomFilter:
+    """
+    URL 블룸 필터
+
+    might_contain이 False면 확실히 저장되지 않은 URL(또는 canonical_key)이고,
+    True면 저장됐을 수도 있는 값이다 (오탐률 error_rate). 오탐인 값만 DB 확인이
+    필요하다.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1000)
+        self.error_rate = error_rate
+        self.num_bits = int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, url: str):
+        """이중 해싱으로 k개의 비트 위치 계산"""
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, url: str):
+        positions = self._positions(url)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def update(self, urls: Iterable[str]):
+        for url in urls:
+            self.add(url)
+
+    def might_contain(self, url: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(url))
+
+    @property
+    def is_saturated(self) -> bool:
+        """설계 용량을 넘어 오탐률이 높아졌는지 여부"""
+        return self.count > self.capacity
+
+
+_url_filter: Optional[UrlBloomFilter] = None
+_url_filter_lock = threading.Lock()
+
+
+def get_url_filter(config) -> Optional[UrlBloomFilter]:
+    """
+    프로세스 공용 URL 필터 (처음 호출 시 articles.url, canonical_key로 채움)
+
+    앱 컨텍스트 안에서 호출해야 한다. URL_FILTER_ENABLED가 꺼져 있으면 None.
+    저장된 값 수가 용량을 넘으면 용량을 두 배로 늘려 다시 만든다.
+    """
+    global _url_filter
+    if not config.get('URL_FILTER_ENABLED', True):
+        return None
+
+    with _url_filter_lock:
+        if _url_filter is None or _url_filter.is_saturated:
+            _url_filter = _load_url_filter(config, _url_filter)
+        return _url_filter
+
+
+def _load_url_filter(config, previous: Optional[UrlBloomFilter]) -> UrlBloomFilter:
+    """articles.url, canonical_key를 스트리밍으로 읽어 필터 생성 (기사당 최대 2개)"""
+    from app import db
+    from app.models.article import Article
+
+    capacity = config.get('URL_FILTER_CAPACITY', 1_000_000)
+    stored = db.session.query(db.func.count(Article.id)).scalar() or 0
+    if previous is not None:
+        capacity = max(capacity, previous.capacity * 2)
+    while stored * 4 > capacity:
+        capacity *= 2
+
+    url_filter = UrlBloomFilter(capacity, config.get('URL_FILTER_ERROR_RATE', 0.01))
+    for url, key in db.session.query(Article.url, Article.canonical_key).yield_per(10000):
+        url_filter.add(url)
+        if key:
+            url_filter.add(key)
+
+    logger.info(f"URL 필터 로드: {url_filter.count}개 (용량 {url_filter.capacity}, "
+                f"{len(url_filter._bits) // 1024}KB)")
+    return url_filter
+
+
+def reset_url_filter():
+    """다음 호출 때 DB에서 다시 로드하도록 필터 초기화"""
+    global _url_filter
+    with _url_filter_lock:
+        _url_filter = None
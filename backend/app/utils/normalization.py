@@ -0,0 +1,110 @@
+"""
+URL canonicalization and text cleaning for collected articles
+"""
+import hashlib
+import html
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 태그, 공백 정리용 정규식 (모듈 로드 시 한 번만 컴파일)
+_TAG_RE = re.compile(r'<[^>]*>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+# 기사 식별과 무관한 추적용 쿼리 파라미터 (광고/분석 도구가 붙이는 이름만)
+# from, ref, ns처럼 흔한 이름은 언론사에 따라 기사 ID나 섹션을 담으므로 남긴다
+_TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid', 'twclid', 'igshid',
+    'mc_cid', 'mc_eid', '_ga'
+}
+_TRACKING_PREFIXES = ('utm_',)
+
+# 네이버 뉴스 URL 형태: /mnews/article/{oid}/{aid}, /article/{oid}/{aid}, read.naver?oid=&aid=
+_NAVER_HOSTS = {
+    'news.naver.com', 'n.news.naver.com', 'm.news.naver.com',
+    'entertain.naver.com', 'm.entertain.naver.com',
+    'sports.news.naver.com', 'm.sports.naver.com', 'sports.naver.com'
+}
+_NAVER_PATH_RE = re.compile(r'/(?:mnews/)?article/(?:\w+/)?(\d{3})/(\d{10})')
+
+
+def clean_html(text: str) -> str:
+    """HTML 태그 제거 및 엔티티(&quot; &amp; 등) 디코딩"""
+    if not text:
+        return ''
+    text = html.unescape(_TAG_RE.sub('', text))
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def normalize_text(text: str) -> str:
+    """유사도 비교용 텍스트 정규화 (태그/엔티티 정리, 소문자, 공백·문장부호 제거)"""
+    return _NON_WORD_RE.sub('', clean_html(text).lower())
+
+
+def naver_article_id(url: str) -> Optional[str]:
+    """네이버 뉴스 URL이면 '{oid}/{aid}' 반환"""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host not in _NAVER_HOSTS:
+        return None
+
+    match = _NAVER_PATH_RE.search(parts.path)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+
+    params = dict(parse_qsl(parts.query))
+    if params.get('oid') and params.get('aid'):
+        return f"{params['oid']}/{params['aid']}"
+    return None
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL 정규화
+
+    - 스킴은 https, 호스트는 소문자 (www. 제거, 기본 포트 제거)
+    - 추적용 쿼리 파라미터 제거, 나머지는 정렬
+    - 프래그먼트와 경로 끝의 '/' 제거
+    - 네이버 뉴스 URL은 https://n.news.naver.com/mnews/article/{oid}/{aid} 형태로 통일
+    """
+    if not url:
+        return ''
+    url = url.strip()
+
+    naver_id = naver_article_id(url)
+    if naver_id:
+        return f"https://n.news.naver.com/mnews/article/{naver_id}"
+
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url
+
+    host = parts.hostname or ''
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    params = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PREFIXES)
+    ]
+    query = urlencode(sorted(params))
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    return urlunsplit(('https', host, path, query, ''))
+
+
+def canonical_key(url: str, original_url: str = None) -> str:
+    """
+    기사 중복 판단용 고정 키 (정규화 URL의 SHA-1)
+
+    네이버 API는 같은 기사에 대해 네이버 링크(link)와 언론사 원문 링크(originallink)를
+    함께 주므로, 원문 링크가 있으면 원문 링크를 기준으로 키를 만든다.
+    """
+    canonical = canonicalize_url(original_url or url)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
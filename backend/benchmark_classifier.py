@@ -0,0 +1,213 @@
+"""분류기 마이크로벤치마크 (골든 코퍼스 정답 확인 + 메서드별 처리량)"""
+import argparse
+import copy
+import gc
+import json
+import os
+import sys
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'classifier_golden.json')
+
+# 골든 코퍼스 정답 필드
+LABELS = ['is_medical', 'category', 'sentiment', 'needs_response', 'risk_level', 'risk_score']
+
+# 측정할 메서드 (특징 벡터를 공유하지 않는 단독 호출 비용)
+METHODS = [
+    'extract_features', 'classify_article', 'analyze_sentiment', 'check_needs_response',
+    'calculate_risk', 'score_article', 'batch_classify'
+]
+
+
+def load_classifier(rules_path: str = None):
+    """기본 규칙(또는 ruleset() 형식 JSON)으로 분류기 생성"""
+    from config import Config
+    from app.services.article_classifier import ArticleClassifier
+
+    if rules_path:
+        with open(rules_path, encoding='utf-8') as f:
+            rules = json.load(f)
+        # GET /api/classifier/rules 응답도 그대로 사용
+        return ArticleClassifier.from_ruleset(rules.get('rules', rules))
+    return ArticleClassifier(Config.SEARCH_KEYWORDS)
+
+
+def method_labels(classifier, title: str, description: str) -> dict:
+    """공개 메서드를 각각 단독 호출한 결과 (score_article과 같은 필드)"""
+    is_medical, category, _, _ = classifier.classify_article(title, description)
+    risk_level, risk_score = classifier.calculate_risk(title, description)
+    return {
+        'is_medical': is_medical,
+        'category': category,
+        'sentiment': classifier.analyze_sentiment(title, description),
+        'needs_response': classifier.check_needs_response(title, description),
+        'risk_level': risk_level,
+        'risk_score': risk_score
+    }
+
+
+def check_golden(classifier, cases: list) -> list:
+    """
+    골든 코퍼스 정답 확인
+
+    공개 메서드 단독 호출, score_article, batch_classify 결과가 모두 정답과 같아야 한다.
+
+    Returns:
+        불일치 목록 (제목, 경로, 필드, 정답, 결과)
+    """
+    articles = [{'title': case['title'], 'description': case['description']} for case in cases]
+    relevant = classifier.batch_classify(articles)
+    relevant_ids = {id(article) for article in relevant}
+
+    mismatches = []
+    for case, article in zip(cases, articles):
+        expected = case['expected']
+        outputs = {
+            'methods': method_labels(classifier, case['title'], case['description']),
+            'score_article': classifier.score_article(case['title'], case['description']),
+            'batch_classify': {**article, 'is_medical': id(article) in relevant_ids}
+        }
+        for path, output in outputs.items():
+            for label in LABELS:
+                if output.get(label) != expected.get(label):
+                    mismatches.append({
+                        'title': case['title'], 'path': path, 'label': label,
+                        'expected': expected.get(label), 'actual': output.get(label)
+                    })
+    return mismatches
+
+
+def update_golden(classifier, golden: dict, path: str):
+    """현재 분류기 결과로 골든 코퍼스 정답 갱신 (규칙을 의도적으로 바꾼 경우)"""
+    for case in golden['cases']:
+        scored = classifier.score_article(case['title'], case['description'])
+        case['expected'] = {label: scored[label] for label in LABELS}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(golden, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def time_method(classifier, name: str, corpus: list, repeat: int) -> float:
+    """메서드로 코퍼스 전체를 처리하는 데 걸린 최소 시간 (초)"""
+    best = None
+    for _ in range(repeat):
+        if name == 'batch_classify':
+            articles = copy.deepcopy(corpus)
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            if name == 'batch_classify':
+                classifier.batch_classify(articles)
+            else:
+                method = getattr(classifier, name)
+                for article in corpus:
+                    method(article['title'], article['description'])
+            elapsed = time.perf_counter() - started
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(args) -> dict:
+    """골든 코퍼스 확인 후 코퍼스를 반복해 size개 기사로 메서드별 처리량 측정"""
+    classifier = load_classifier(args.rules)
+    with open(args.golden, encoding='utf-8') as f:
+        golden = json.load(f)
+    cases = golden['cases']
+
+    if args.update_golden:
+        update_golden(classifier, golden, args.golden)
+        logger.warning(f"골든 코퍼스 정답 갱신: {args.golden}")
+
+    mismatches = check_golden(classifier, cases)
+
+    corpus = [
+        {'title': cases[i % len(cases)]['title'], 'description': cases[i % len(cases)]['description']}
+        for i in range(args.size)
+    ]
+    methods = {}
+    for name in args.method or METHODS:
+        elapsed = time_method(classifier, name, corpus, args.repeat)
+        methods[name] = {
+            'elapsed_sec': round(elapsed, 4),
+            'articles_per_sec': round(len(corpus) / elapsed, 1) if elapsed else 0.0,
+            'us_per_article': round(elapsed / len(corpus) * 1e6, 2)
+        }
+
+    return {
+        'ruleset_version': classifier.ruleset_version,
+        'articles': len(corpus),
+        'repeat': args.repeat,
+        'golden_cases': len(cases),
+        'golden_mismatches': mismatches,
+        'methods': methods
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list:
+    """기준 결과 대비 tolerance 이상 처리량이 떨어진 메서드 목록"""
+    regressions = []
+    for name, metrics in result['methods'].items():
+        before = baseline.get('methods', {}).get(name, {}).get('articles_per_sec')
+        after = metrics['articles_per_sec']
+        if not before:
+            continue
+        change = (after - before) / before
+        if change < -tolerance:
+            regressions.append(f"{name}: {before} → {after} articles/s ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분류기 마이크로벤치마크 (골든 코퍼스 + 처리량)')
+    parser.add_argument('--golden', default=GOLDEN_PATH, help='골든 코퍼스 JSON')
+    parser.add_argument('--rules', help='분류 규칙 JSON (ruleset() 형식, 없으면 기본 규칙)')
+    parser.add_argument('--size', type=int, default=20000, help='처리량 측정 기사 수 (골든 코퍼스 반복)')
+    parser.add_argument('--repeat', type=int, default=3, help='메서드별 반복 횟수 (최소 시간 사용)')
+    parser.add_argument('--method', action='append', choices=METHODS, help='측정할 메서드 (기본값: 전체)')
+    parser.add_argument('--update-golden', action='store_true', help='현재 결과로 골든 코퍼스 정답 갱신')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (다음 실행의 --baseline으로 사용)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 성능 저하 비율')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    result = run_benchmark(args)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    failed = False
+    if result['golden_mismatches']:
+        print(f"골든 코퍼스 불일치: {len(result['golden_mismatches'])}건")
+        failed = True
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        if regressions:
+            print("성능 회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            failed = True
+        else:
+            print("기준 대비 회귀 없음")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
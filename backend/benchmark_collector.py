@@ -0,0 +1,168 @@
+"""수집기 처리량 벤치마크 (로컬 픽스처 서버 대상, 수집 → 분류 → 저장 전 구간)"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import logging
+
+from naver_fixture_server import FixtureStore, NaverFixtureServer
+
+logger = logging.getLogger(__name__)
+
+# 회귀 판정 지표: (이름, 높을수록 좋은지)
+METRICS = [('pages_per_sec', True), ('articles_per_sec', True), ('p95_page_ms', False)]
+
+
+def percentile(values, pct: float) -> float:
+    """최근접 순위 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def run_benchmark(args) -> dict:
+    """픽스처 서버를 띄우고 빈 DB에 대해 수집 1회를 실행해 지표 측정"""
+    # 설정은 import 시점에 환경 변수를 읽으므로 앱 import 전에 지정
+    db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    db_file.close()
+    os.environ['DATABASE_URL'] = f"sqlite:///{db_file.name}"
+
+    from app import create_app, db
+    from app.services.classifier_rules import get_classifier, reset_classifier
+    from app.services.ingestion import ingest_articles
+    from app.services.news_collector import NewsCollector
+    from app.services.pipeline import ArticlePipeline
+    from app.services.story_index import StoryMatcher, get_story_index, reset_story_index
+    from app.services.url_filter import reset_url_filter
+
+    class TimedCollector(NewsCollector):
+        """페이지별 소요 시간(재시도 포함)을 기록하는 수집기"""
+
+        def __init__(self, *a, **kw):
+            super().__init__(*a, **kw)
+            self.page_seconds = []
+            self._timing_lock = threading.Lock()
+
+        def fetch_page(self, query, display=100, start=1):
+            started = time.perf_counter()
+            try:
+                return super().fetch_page(query=query, display=display, start=start)
+            finally:
+                with self._timing_lock:
+                    self.page_seconds.append(time.perf_counter() - started)
+
+    store = FixtureStore.load(args.fixtures) if args.fixtures else FixtureStore(synthetic_total=args.per_query)
+    server = NaverFixtureServer(
+        store, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate, error_rate=args.error_rate, retry_after=args.retry_after
+    )
+
+    app = create_app('development')
+    app.config.update(
+        NAVER_API_BASE_URL=server.url,
+        NAVER_CREDENTIALS=[(f'bench-{i}', 'bench-secret') for i in range(args.keys)],
+        NAVER_MAX_CONCURRENCY=args.workers,
+        NAVER_RATE_PER_SEC=args.rate,
+        NEAR_DUP_ENABLED=not args.no_near_dup
+    )
+    queries = args.query or app.config.get('SEARCH_KEYWORDS')
+    reset_url_filter()
+    reset_story_index()
+    reset_classifier()
+
+    try:
+        with server, app.app_context():
+            collector = TimedCollector.from_config(app.config)
+            classifier = get_classifier(app.config)
+            story_index = get_story_index(app.config)
+            if story_index is not None:
+                classifier = StoryMatcher(classifier, story_index)
+            pipeline = ArticlePipeline(classifier, ingest_articles,
+                                       batch_size=app.config.get('INGEST_BATCH_SIZE', 100))
+
+            started = time.perf_counter()
+            with collector:
+                _, stats = pipeline.run(lambda emit: collector.stream_incremental(
+                    emit, {}, queries=queries, max_per_query=args.per_query
+                ))
+            elapsed = time.perf_counter() - started
+            db.session.remove()
+    finally:
+        os.unlink(db_file.name)
+
+    pages = len(collector.page_seconds)
+    return {
+        'queries': len(queries),
+        'pages': pages,
+        'collected': stats['collected'],
+        'relevant': stats['relevant'],
+        'inserted': stats.get('inserted', 0),
+        'elapsed_sec': round(elapsed, 3),
+        'pages_per_sec': round(pages / elapsed, 2) if elapsed else 0.0,
+        'articles_per_sec': round(stats['collected'] / elapsed, 2) if elapsed else 0.0,
+        'p50_page_ms': round(percentile(collector.page_seconds, 50) * 1000, 1),
+        'p95_page_ms': round(percentile(collector.page_seconds, 95) * 1000, 1),
+        'server': dict(server.counts)
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list:
+    """기준 결과 대비 tolerance 이상 나빠진 지표 목록"""
+    regressions = []
+    for name, higher_is_better in METRICS:
+        before, after = baseline.get(name), result.get(name)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+            regressions.append(f"{name}: {before} → {after} ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='네이버 수집기 처리량 벤치마크 (오프라인)')
+    parser.add_argument('--query', action='append', help='검색 쿼리 (기본값: SEARCH_KEYWORDS)')
+    parser.add_argument('--per-query', type=int, default=1000, help='쿼리당 수집 기사 수 (최대 1000)')
+    parser.add_argument('--fixtures', help='픽스처 서버 녹화 파일 (없으면 합성 결과)')
+    parser.add_argument('--latency-ms', type=float, default=50)
+    parser.add_argument('--jitter-ms', type=float, default=20)
+    parser.add_argument('--throttle-rate', type=float, default=0.02, help='429 응답 비율')
+    parser.add_argument('--error-rate', type=float, default=0.02, help='5xx 응답 비율')
+    parser.add_argument('--retry-after', type=float, default=0.1, help='429 응답의 Retry-After (초)')
+    parser.add_argument('--workers', type=int, default=4, help='NAVER_MAX_CONCURRENCY')
+    parser.add_argument('--keys', type=int, default=1, help='키 풀 크기')
+    parser.add_argument('--rate', type=float, default=10, help='키별 초당 호출 한도')
+    parser.add_argument('--no-near-dup', action='store_true', help='유사 기사 매칭 끄기')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (다음 실행의 --baseline으로 사용)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 성능 저하 비율')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    result = run_benchmark(args)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        if regressions:
+            print("성능 회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("기준 대비 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,14 @@
 from datetime import datetime, timedelta
 from app import create_app, db
 from app.services.news_collector import NewsCollector
-from app.services.article_classifier import ArticleClassifier
-from app.models.article import Article
-import time
+from app.services.naver_client import NaverApiError, NaverQuotaExceededError, kst_today
+from app.services.classification_memo import MemoizedClassifier
+from app.services.classifier_rules import get_classifier
+from app.services.pipeline import ArticlePipeline
+from app.services.ingestion import ingest_articles
+from app.services.story_index import StoryMatcher, get_story_index
+from app.models.api_quota import ApiQuotaUsage
+from app.models.classifier_ruleset import ClassifierRuleset
 import logging
 
 logging.basicConfig(
@@ -19,107 +24,87 @@ def collect_historical_articles(months=6):
     """
     지난 N개월간의 의료 기사 수집
 
+    페이지가 수집되는 대로 분류/저장 파이프라인으로 흘려보내므로
+    전체 수집량과 무관하게 일정한 메모리로 실행된다.
+
     Args:
         months: 수집할 개월 수
     """
     with app.app_context():
-        client_id = app.config.get('NAVER_CLIENT_ID')
-        client_secret = app.config.get('NAVER_CLIENT_SECRET')
-        search_keywords = app.config.get('SEARCH_KEYWORDS')
+        credentials = app.config.get('NAVER_CREDENTIALS')
 
-        if not client_id or not client_secret:
+        if not credentials:
             logger.error("Naver API 설정이 없습니다.")
             return
 
-        collector = NewsCollector(client_id, client_secret)
-        classifier = ArticleClassifier(search_keywords)
+        # 레이트 리밋/재시도/쿼터는 공용 클라이언트가 처리 (고정 sleep 불필요)
+        quota_used = ApiQuotaUsage.load_usage([c[0] for c in credentials], kst_today())
+        collector = NewsCollector.from_config(app.config, quota_used=quota_used)
+        classifier = get_classifier(app.config)
+        # 규칙 변경 시 바뀐 키워드를 계산할 수 있도록 규칙 기록
+        ClassifierRuleset.record(classifier)
+        db.session.commit()
+        story_index = get_story_index(app.config)
+        if story_index is not None:
+            # 유사 기사를 스토리로 묶음 (분류는 기사별, AI 분석 결과는 스토리 안에서 재사용)
+            classifier = StoryMatcher(classifier, story_index)
+        # 이미 저장된 기사는 내용과 규칙이 같으면 저장된 분류 결과 사용
+        classifier = MemoizedClassifier(classifier)
 
         # 해시드 관련 검색 키워드
         search_queries = [
             '해시드', 'Hashed', '해시드 벤처스', '주식회사 해시드', '김서준'
         ]
 
-        total_collected = 0
-        total_saved = 0
-        total_skipped = 0
-
-        # 각 키워드별로 수집
-        for query in search_queries:
-            logger.info(f"=== '{query}' 키워드로 수집 시작 ===")
-
+        def backfill_source(emit):
+            """키워드별로 페이지를 넘기며 수집한 페이지를 파이프라인에 전달"""
             # 네이버 API는 최대 1000개까지 결과 제공 (start=1~1000)
             # 각 요청은 최대 100개까지
             max_start = 1000
             display = 100
 
-            for start in range(1, max_start, display):
-                try:
-                    logger.info(f"수집 중... start={start}, display={display}")
+            for query in search_queries:
+                logger.info(f"=== '{query}' 키워드로 수집 시작 ===")
 
-                    # 기사 수집
-                    articles = collector.collect_articles(
-                        query=query,
-                        display=display,
-                        start=start
-                    )
+                for start in range(1, max_start, display):
+                    logger.info(f"수집 중... start={start}, display={display}")
+                    try:
+                        articles = collector.fetch_page(query=query, display=display, start=start)
+                    except NaverQuotaExceededError as e:
+                        logger.error(f"일일 쿼터 소진으로 수집 중단: {e}")
+                        return
+                    except NaverApiError as e:
+                        logger.error(f"'{query}' 수집 실패 (start={start}): {e}")
+                        break
 
-                    if not articles:
+                    if articles:
+                        emit(articles)
+                    if len(articles) < display:
                         logger.info(f"'{query}' 키워드의 더 이상 기사 없음")
                         break
 
-                    total_collected += len(articles)
-
-                    # 의료 기사 분류
-                    medical_articles = classifier.batch_classify(articles)
-
-                    # 데이터베이스 저장
-                    saved_count = 0
-                    skipped_count = 0
-
-                    for article_data in medical_articles:
-                        # URL 중복 체크
-                        existing = Article.query.filter_by(url=article_data['url']).first()
-                        if existing:
-                            skipped_count += 1
-                            continue
-
-                        article = Article(
-                            title=article_data['title'],
-                            description=article_data['description'],
-                            url=article_data['url'],
-                            source=article_data['source'],
-                            published_date=article_data['published_date'],
-                            is_medical=article_data['is_medical'],
-                            category=article_data['category'],
-                            keywords=article_data['keywords'],
-                            confidence_score=article_data['confidence_score']
-                        )
-
-                        db.session.add(article)
-                        saved_count += 1
-
-                    db.session.commit()
-
-                    total_saved += saved_count
-                    total_skipped += skipped_count
-
-                    logger.info(f"배치 완료: 수집={len(articles)}, 의료={len(medical_articles)}, 저장={saved_count}, 중복={skipped_count}")
-
-                    # API 호출 제한 고려하여 딜레이
-                    time.sleep(0.5)
+                logger.info(f"=== '{query}' 키워드 수집 완료 ===\n")
 
-                except Exception as e:
-                    logger.error(f"수집 중 오류: {e}")
-                    db.session.rollback()
-                    continue
+        def save_batch(batch):
+            """배치 저장과 함께 API 사용량도 기록"""
+            ApiQuotaUsage.record_usage(collector.drain_quota_usage(), kst_today())
+            return ingest_articles(batch)
 
-            logger.info(f"=== '{query}' 키워드 수집 완료 ===\n")
+        pipeline = ArticlePipeline(classifier, save_batch, batch_size=app.config.get('INGEST_BATCH_SIZE', 100))
+        try:
+            with collector:
+                _, stats = pipeline.run(backfill_source)
+        finally:
+            # 마지막 배치 이후 사용한 호출 수까지 기록
+            db.session.rollback()
+            ApiQuotaUsage.record_usage(collector.drain_quota_usage(), kst_today())
+            db.session.commit()
 
         logger.info("=" * 50)
         logger.info(f"전체 수집 완료!")
-        logger.info(f"총 수집: {total_collected}개")
-        logger.info(f"총 저장: {total_saved}개")
-        logger.info(f"총 중복: {total_skipped}개")
+        logger.info(f"총 수집: {stats['collected']}개")
+        logger.info(f"총 저장: {stats.get('inserted', 0)}개")
+        logger.info(f"총 중복: {stats.get('skipped', 0)}개")
         logger.info("=" * 50)
 
 if __name__ == '__main__':
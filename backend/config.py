@@ -15,6 +15,24 @@ def get_database_url():
         return url
     return 'sqlite:///hashed_articles.db'
 
+def get_naver_credentials():
+    """네이버 API 키 목록 [(client_id, client_secret), ...]
+
+    NAVER_CREDENTIALS="id1:secret1,id2:secret2" 형식으로 여러 키를 지정할 수 있고,
+    NAVER_CLIENT_ID/NAVER_CLIENT_SECRET 단일 키도 함께 사용된다.
+    """
+    credentials = []
+    for pair in os.environ.get('NAVER_CREDENTIALS', '').split(','):
+        client_id, _, client_secret = pair.strip().partition(':')
+        if client_id and client_secret:
+            credentials.append((client_id, client_secret))
+
+    client_id = os.environ.get('NAVER_CLIENT_ID')
+    client_secret = os.environ.get('NAVER_CLIENT_SECRET')
+    if client_id and client_secret and client_id not in [c[0] for c in credentials]:
+        credentials.insert(0, (client_id, client_secret))
+    return credentials
+
 class Config:
     """기본 설정"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
@@ -46,16 +64,67 @@ class Config:
     # Naver News API 설정
     NAVER_CLIENT_ID = os.environ.get('NAVER_CLIENT_ID')
     NAVER_CLIENT_SECRET = os.environ.get('NAVER_CLIENT_SECRET')
+    NAVER_CREDENTIALS = get_naver_credentials()  # 여러 키에 요청 분산
+    NAVER_MAX_CONCURRENCY = int(os.environ.get('NAVER_MAX_CONCURRENCY', 4))  # 동시 요청 수
+    NAVER_RATE_PER_SEC = float(os.environ.get('NAVER_RATE_PER_SEC', 10))  # 키별 초당 호출 한도
+    NAVER_DAILY_QUOTA = int(os.environ.get('NAVER_DAILY_QUOTA', 25000))  # 키별 일일 호출 한도
+    NAVER_MAX_RETRIES = int(os.environ.get('NAVER_MAX_RETRIES', 4))  # 429/5xx 재시도 횟수
+    NAVER_API_BASE_URL = os.environ.get('NAVER_API_BASE_URL')  # 비우면 네이버 오픈 API (로컬 픽스처 서버 사용 시 지정)
 
     # 스케줄러 설정
     SCHEDULER_API_ENABLED = True
+    SCHEDULER_LEADER_TTL_SECONDS = float(os.environ.get('SCHEDULER_LEADER_TTL_SECONDS', 30))  # 리더가 죽은 뒤 다른 워커가 인계하기까지 최대 시간 (초)
+    SCHEDULER_LEADER_CHECK_SECONDS = float(os.environ.get('SCHEDULER_LEADER_CHECK_SECONDS', 10))  # 리더 임대 획득/갱신 간격 (초)
 
     # 해시드 관련 키워드 (김서준 제거)
     SEARCH_KEYWORDS = [
         '해시드', 'Hashed', '해시드 벤처스', '주식회사 해시드'
     ]
 
+    # 원문 본문 수집 설정
+    CONTENT_FETCH_ENABLED = os.environ.get('CONTENT_FETCH_ENABLED', 'true').lower() == 'true'
+    CONTENT_FETCH_WORKERS = int(os.environ.get('CONTENT_FETCH_WORKERS', 8))  # 전체 동시 요청 수
+    CONTENT_FETCH_PER_DOMAIN = int(os.environ.get('CONTENT_FETCH_PER_DOMAIN', 2))  # 도메인별 동시 요청 수
+    CONTENT_FETCH_DOMAIN_DELAY = float(os.environ.get('CONTENT_FETCH_DOMAIN_DELAY', 1.0))  # 도메인별 요청 간격(초)
+    CONTENT_FETCH_MAX_BYTES = int(os.environ.get('CONTENT_FETCH_MAX_BYTES', 2 * 1024 * 1024))  # 응답 크기 제한
+
+    # 쿼리 계획 설정 (SEARCH_KEYWORDS 간 중복 결과 제거)
+    QUERY_PAGE_BUDGET = int(os.environ.get('QUERY_PAGE_BUDGET', 0))  # 실행당 전체 페이지 예산 (0이면 MAX_ARTICLES_PER_DAY 기준)
+    QUERY_MIN_UNIQUE_RATIO = float(os.environ.get('QUERY_MIN_UNIQUE_RATIO', 0.05))  # 이보다 낮으면 쿼리 제외
+
+    # URL 중복 필터 설정 (저장된 URL 블룸 필터)
+    URL_FILTER_ENABLED = os.environ.get('URL_FILTER_ENABLED', 'true').lower() == 'true'
+    URL_FILTER_CAPACITY = int(os.environ.get('URL_FILTER_CAPACITY', 1_000_000))
+    URL_FILTER_ERROR_RATE = float(os.environ.get('URL_FILTER_ERROR_RATE', 0.01))
+
+    # 유사 기사(통신사 기사 재전송) 묶음 설정
+    NEAR_DUP_ENABLED = os.environ.get('NEAR_DUP_ENABLED', 'true').lower() == 'true'
+    NEAR_DUP_THRESHOLD = float(os.environ.get('NEAR_DUP_THRESHOLD', 0.4))  # 같은 스토리로 볼 최소 유사도 (Jaccard)
+    NEAR_DUP_WINDOW_DAYS = int(os.environ.get('NEAR_DUP_WINDOW_DAYS', 7))  # 인덱스에 유지할 스토리 기간(일)
+
+    # 병렬 분류 설정 (대량 재분류용)
+    CLASSIFY_WORKERS = int(os.environ.get('CLASSIFY_WORKERS', 0))  # 분류 프로세스 수 (0이면 CPU 코어 수)
+    CLASSIFY_CHUNK_SIZE = int(os.environ.get('CLASSIFY_CHUNK_SIZE', 2000))  # 프로세스당 한 번에 넘길 기사 수
+
+    # 분류 규칙 저장소 설정 (관리자 API로 게시, 재시작 없이 반영)
+    CLASSIFIER_RULES_CHECK_SECONDS = float(os.environ.get('CLASSIFIER_RULES_CHECK_SECONDS', 10))  # 규칙 세대 변경 확인 간격 (초)
+    RULESET_EVALUATION_TIMEOUT_SECONDS = int(os.environ.get('RULESET_EVALUATION_TIMEOUT_SECONDS', 1800))  # 규칙 평가 작업이 이 시간 안에 끝나지 않으면 실패 처리
+
+    # 수동 수집 작업 설정 (POST /api/scheduler/collect는 작업 ID를 바로 반환)
+    COLLECTION_JOB_WORKERS = int(os.environ.get('COLLECTION_JOB_WORKERS', 1))  # 프로세스당 동시 실행 수집 작업 수
+    COLLECTION_JOB_PROGRESS_SECONDS = float(os.environ.get('COLLECTION_JOB_PROGRESS_SECONDS', 1.0))  # 진행 상황 기록 간격 (초)
+    COLLECTION_JOB_STALE_SECONDS = int(os.environ.get('COLLECTION_JOB_STALE_SECONDS', 600))  # 진행 상황이 이 시간 동안 없으면 실패 처리
+
+    # 적응형 수집 스케줄 설정 (쿼리별 새 기사 유입 속도에 맞춰 폴링 간격 조절)
+    ADAPTIVE_COLLECTION_ENABLED = os.environ.get('ADAPTIVE_COLLECTION_ENABLED', 'true').lower() == 'true'  # false면 매일 ARTICLE_COLLECTION_TIME에 1회 수집
+    ADAPTIVE_TICK_SECONDS = int(os.environ.get('ADAPTIVE_TICK_SECONDS', 60))  # 폴링할 쿼리 확인 간격 (초)
+    ADAPTIVE_MIN_INTERVAL_MINUTES = float(os.environ.get('ADAPTIVE_MIN_INTERVAL_MINUTES', 5))  # 최소 폴링 간격 (속보, red 기사 발생 시)
+    ADAPTIVE_MAX_INTERVAL_MINUTES = float(os.environ.get('ADAPTIVE_MAX_INTERVAL_MINUTES', 360))  # 최대 폴링 간격 (조용한 쿼리)
+    ADAPTIVE_TARGET_NEW_PER_POLL = float(os.environ.get('ADAPTIVE_TARGET_NEW_PER_POLL', 10))  # 폴링 한 번에 목표로 하는 새 기사 수
+    ADAPTIVE_DAILY_CALL_BUDGET = int(os.environ.get('ADAPTIVE_DAILY_CALL_BUDGET', 0))  # 하루 API 호출 예산 (모든 키 합계, 수동 수집 포함, 0이면 매일 1회 수집의 페이지 수)
+
     # 기사 수집 설정
+    INGEST_BATCH_SIZE = int(os.environ.get('INGEST_BATCH_SIZE', 100))  # 저장 배치 크기
     MAX_ARTICLES_PER_DAY = 500  # 100에서 500으로 증가
     ARTICLE_COLLECTION_TIME = "09:00"  # 매일 수집 시간
 
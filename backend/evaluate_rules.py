@@ -0,0 +1,67 @@
+"""후보 분류 규칙을 현재 규칙과 나란히 저장된 기사 전체에 적용해 결과 차이 보고 (DB는 수정하지 않음)"""
+import argparse
+import json
+import logging
+import sys
+
+from app import create_app
+from app.services.classifier_rules import compile_candidate, get_classifier
+from app.services.ruleset_evaluation import evaluate_ruleset
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def load_rules(path: str) -> dict:
+    """규칙 JSON 읽기 (GET /api/classifier/rules 응답도 그대로 사용)"""
+    with open(path, encoding='utf-8') as f:
+        rules = json.load(f)
+    if not isinstance(rules, dict):
+        raise ValueError(f"{path}: 규칙은 JSON 객체여야 합니다")
+    return rules.get('rules', rules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='후보 분류 규칙 오프라인 평가')
+    parser.add_argument('rules', help='후보 규칙 JSON (바꿀 항목만 또는 ruleset() 전체)')
+    parser.add_argument('--base', help='비교 기준 규칙 JSON (없으면 현재 게시된 규칙)')
+    parser.add_argument('--workers', type=int, help='채점 프로세스 수 (기본값: CLASSIFY_WORKERS)')
+    parser.add_argument('--chunk-size', type=int, help='한 번에 읽고 채점할 기사 수 (기본값: CLASSIFY_CHUNK_SIZE)')
+    parser.add_argument('--samples', type=int, default=5, help='변경 종류별 표본 기사 수')
+    parser.add_argument('--output', help='보고서 JSON 저장 경로')
+    args = parser.parse_args()
+
+    app = create_app()
+
+    with app.app_context():
+        current = get_classifier(app.config)
+        if args.base:
+            try:
+                current = compile_candidate(load_rules(args.base), current)
+            except (OSError, ValueError) as e:
+                logger.error(f"기준 규칙 오류: {e}")
+                sys.exit(2)
+        try:
+            candidate = compile_candidate(load_rules(args.rules), current)
+        except (OSError, ValueError) as e:
+            logger.error(f"후보 규칙 오류: {e}")
+            sys.exit(2)
+
+        report = evaluate_ruleset(
+            current, candidate,
+            workers=args.workers if args.workers is not None else app.config.get('CLASSIFY_WORKERS', 0),
+            chunk_size=args.chunk_size or app.config.get('CLASSIFY_CHUNK_SIZE', 2000),
+            samples=args.samples
+        )
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
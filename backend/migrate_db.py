@@ -9,6 +9,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app import create_app, db
+from app.services.ingestion import backfill_canonical_keys
 from sqlalchemy import text, inspect
 
 app = create_app(os.getenv('FLASK_ENV', 'production'))
@@ -88,10 +89,38 @@ def migrate():
             # Add resolved_by_id column
             add_column_if_not_exists(connection, 'articles', 'resolved_by_id', 'INTEGER')
 
+            # Add canonical_key column (normalized URL hash used for dedup)
+            add_column_if_not_exists(connection, 'articles', 'canonical_key', 'VARCHAR(64)')
+            connection.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ix_articles_canonical_key ON articles (canonical_key)"
+            ))
+
+            # Add near-duplicate story columns (story_key groups syndicated copies)
+            add_column_if_not_exists(connection, 'articles', 'story_key', 'VARCHAR(64)')
+            add_column_if_not_exists(connection, 'articles', 'minhash', 'BYTEA')
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_articles_story_key ON articles (story_key)"
+            ))
+
+            # Add classification memo columns (skip rescoring unchanged text under the same rules)
+            add_column_if_not_exists(connection, 'articles', 'content_hash', 'VARCHAR(40)')
+            add_column_if_not_exists(connection, 'articles', 'ruleset_version', 'VARCHAR(16)')
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_articles_ruleset_version ON articles (ruleset_version)"
+            ))
+
+            # Add the query list of collection jobs (decides whether a request can join a running job)
+            if 'collection_jobs' in tables:
+                print("\nAdding missing columns to 'collection_jobs' table...")
+                add_column_if_not_exists(connection, 'collection_jobs', 'queries', 'JSON')
+
             # Commit the changes
             connection.commit()
 
-            print("\nMigration completed successfully!")
+        # Fill canonical_key for articles stored before the key existed
+        print(f"  Backfilled canonical_key: {backfill_canonical_keys()}")
+
+        print("\nMigration completed successfully!")
 
 if __name__ == '__main__':
     migrate()
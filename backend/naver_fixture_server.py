@@ -0,0 +1,299 @@
+"""네이버 뉴스 검색 API 로컬 픽스처 서버 (녹화/재생, 지연·429·5xx 시뮬레이션)"""
+import argparse
+import json
+import random
+import threading
+import time
+import logging
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SEARCH_PATH = '/v1/search/news.json'
+KST = timezone(timedelta(hours=9))
+
+
+class FixtureStore:
+    """쿼리별 검색 결과 (최신순 item 목록)"""
+
+    # 합성 기사 문구 (분류기가 관련/비관련을 섞어 판단하도록 구성)
+    _SUBJECTS = ['해시드', 'Hashed', '해시드 벤처스', '김서준 대표', '블록체인 업계', '가상자산 거래소']
+    _EVENTS = ['신규 펀드 결성', '시리즈A 투자 주도', '웹3 스타트업 투자', '규제 논란 해명', '파트너십 체결',
+               '소송 제기', '포트폴리오 확대', '레이어2 프로젝트 투자', '해외 진출', '투자유치 성공']
+    _PUBLISHERS = ['yna.co.kr', 'news1.kr', 'hankyung.com', 'mk.co.kr', 'edaily.co.kr', 'zdnet.co.kr']
+
+    def __init__(self, results: Dict[str, List[Dict]] = None, synthetic_total: int = 1000, seed: int = 42):
+        self.results = results or {}
+        self.synthetic_total = synthetic_total
+        self.seed = seed
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'FixtureStore':
+        """record 명령으로 저장한 JSON 파일 로드"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(results=data.get('queries', {}), **kwargs)
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'queries': self.results}, f, ensure_ascii=False, indent=1)
+
+    def items(self, query: str) -> List[Dict]:
+        """녹화된 결과가 없는 쿼리는 합성 결과를 만들어 둔다"""
+        with self._lock:
+            if query not in self.results:
+                self.results[query] = self._synthesize(query)
+            return self.results[query]
+
+    def _synthesize(self, query: str) -> List[Dict]:
+        rng = random.Random(f"{self.seed}:{query}")
+        now = datetime.now(KST).replace(microsecond=0)
+        items = []
+        for i in range(self.synthetic_total):
+            subject = rng.choice(self._SUBJECTS)
+            event = rng.choice(self._EVENTS)
+            publisher = rng.choice(self._PUBLISHERS)
+            oid = f"{rng.randint(1, 999):03d}"
+            aid = f"{rng.randint(1, 9_999_999_999):010d}"
+            items.append({
+                'title': f"<b>{subject}</b>, {event} &quot;{i}&quot;",
+                'originallink': f"https://www.{publisher}/news/{aid}?utm_source=naver&utm_medium=search",
+                'link': f"https://n.news.naver.com/mnews/article/{oid}/{aid}?sid=101",
+                'description': f"{subject}가 {event} 소식을 밝혔다. 업계에서는 후속 발표에 주목하고 있다.",
+                'pubDate': format_datetime(now - timedelta(minutes=7 * i + rng.randint(0, 6)))
+            })
+        return items
+
+
+class NaverFixtureServer:
+    """
+    네이버 뉴스 검색 API를 흉내 내는 로컬 HTTP 서버
+
+    display/start 페이지네이션, 응답 지연, 429(처리율 초과)와 5xx 오류를
+    설정한 비율로 재현한다. 백그라운드 스레드로 띄우거나 CLI로 실행한다.
+    """
+
+    def __init__(self, store: FixtureStore = None, host: str = '127.0.0.1', port: int = 0,
+                 latency_ms: float = 50, jitter_ms: float = 20, throttle_rate: float = 0.0,
+                 error_rate: float = 0.0, retry_after: float = None, seed: int = 7):
+        """
+        Args:
+            store: 검색 결과 저장소 (None이면 합성 결과)
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            latency_ms: 응답 지연 평균 (밀리초)
+            jitter_ms: 응답 지연 편차 (밀리초, 균등 분포)
+            throttle_rate: 429 응답 비율 (0.0 ~ 1.0)
+            error_rate: 5xx 응답 비율 (0.0 ~ 1.0)
+            retry_after: 429 응답의 Retry-After 헤더 값 (초, None이면 생략)
+            seed: 지연/오류 난수 시드
+        """
+        self.store = store or FixtureStore()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.counts = {'requests': 0, 'ok': 0, 'throttled': 0, 'errors': 0, 'bad_requests': 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """NAVER_API_BASE_URL로 쓸 검색 API 주소"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{SEARCH_PATH}"
+
+    def start(self) -> 'NaverFixtureServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='naver-fixture', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def serve_forever(self):
+        logger.info(f"픽스처 서버 시작: {self.url}")
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.counts[key] += 1
+
+    def _draw(self):
+        """(지연 초, 'throttle' | 'error' | None)"""
+        with self._lock:
+            delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return delay, 'throttle'
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, 'error'
+        return delay, None
+
+    def respond(self, path: str, headers) -> tuple:
+        """요청 하나 처리 → (상태 코드, 추가 헤더, 본문 딕셔너리)"""
+        self._count('requests')
+        parts = urlsplit(path)
+        if parts.path != SEARCH_PATH:
+            self._count('bad_requests')
+            return 404, {}, {'errorMessage': 'Not Found', 'errorCode': '404'}
+        if not headers.get('X-Naver-Client-Id') or not headers.get('X-Naver-Client-Secret'):
+            self._count('bad_requests')
+            return 401, {}, {'errorMessage': 'Authentication failed', 'errorCode': '024'}
+
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        query = params.get('query', '')
+        try:
+            display = int(params.get('display', 10))
+            start = int(params.get('start', 1))
+        except ValueError:
+            display, start = 0, 0
+        if not query or not 1 <= display <= 100 or not 1 <= start <= 1000:
+            self._count('bad_requests')
+            return 400, {}, {'errorMessage': 'Incorrect query request', 'errorCode': 'SE01'}
+
+        delay, failure = self._draw()
+        time.sleep(delay)
+
+        if failure == 'throttle':
+            self._count('throttled')
+            extra = {'Retry-After': str(self.retry_after)} if self.retry_after is not None else {}
+            return 429, extra, {'errorMessage': 'Rate limit exceeded', 'errorCode': '012'}
+        if failure == 'error':
+            self._count('errors')
+            return self._rng.choice([500, 502, 503]), {}, {'errorMessage': 'System error', 'errorCode': 'SE99'}
+
+        items = self.store.items(query)
+        self._count('ok')
+        return 200, {}, {
+            'lastBuildDate': format_datetime(datetime.now(KST).replace(microsecond=0)),
+            'total': len(items),
+            'start': start,
+            'display': len(items[start - 1:start - 1 + display]),
+            'items': items[start - 1:start - 1 + display]
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive (클라이언트 커넥션 풀 재사용)
+
+            def do_GET(self):
+                status, extra_headers, body = server.respond(self.path, self.headers)
+                payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                for key, value in extra_headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
+
+
+def record(queries: List[str], output: str, pages: int = 10):
+    """
+    실제 네이버 API 응답을 녹화해 재생용 JSON 파일로 저장
+
+    NAVER_CREDENTIALS 또는 NAVER_CLIENT_ID/NAVER_CLIENT_SECRET 환경 변수를 사용한다.
+    """
+    from config import get_naver_credentials
+    from app.services.naver_client import NaverApiClient, NaverApiError
+
+    credentials = get_naver_credentials()
+    if not credentials:
+        logger.error("Naver API 설정이 없습니다.")
+        return
+
+    store = FixtureStore()
+    client = NaverApiClient.from_credentials(credentials)
+    try:
+        for query in queries:
+            items = []
+            for page in range(pages):
+                try:
+                    data = client.search_news(query, display=100, start=page * 100 + 1)
+                except NaverApiError as e:
+                    logger.error(f"'{query}' 녹화 중단: {e}")
+                    break
+                items.extend(data.get('items', []))
+                if len(data.get('items', [])) < 100:
+                    break
+            store.results[query] = items
+            logger.info(f"'{query}' 녹화: {len(items)}개")
+    finally:
+        client.close()
+
+    store.save(output)
+    logger.info(f"녹화 파일 저장: {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='네이버 뉴스 검색 API 로컬 픽스처 서버')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help='녹화/합성 결과로 검색 API 재생')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--fixtures', help='record로 저장한 JSON 파일 (없으면 합성 결과)')
+    serve.add_argument('--synthetic-total', type=int, default=1000, help='합성 쿼리당 결과 수')
+    serve.add_argument('--latency-ms', type=float, default=50)
+    serve.add_argument('--jitter-ms', type=float, default=20)
+    serve.add_argument('--throttle-rate', type=float, default=0.0, help='429 응답 비율')
+    serve.add_argument('--error-rate', type=float, default=0.0, help='5xx 응답 비율')
+    serve.add_argument('--retry-after', type=float, help='429 응답의 Retry-After (초)')
+
+    rec = sub.add_parser('record', help='실제 API 응답 녹화')
+    rec.add_argument('output')
+    rec.add_argument('--query', action='append', required=True, help='녹화할 검색 쿼리 (여러 번 지정 가능)')
+    rec.add_argument('--pages', type=int, default=10, help='쿼리당 최대 페이지 수 (100개 단위)')
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        record(args.query, args.output, args.pages)
+        return
+
+    store = (FixtureStore.load(args.fixtures, synthetic_total=args.synthetic_total) if args.fixtures
+             else FixtureStore(synthetic_total=args.synthetic_total))
+    server = NaverFixtureServer(
+        store, host=args.host, port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate, error_rate=args.error_rate, retry_after=args.retry_after
+    )
+    print(f"NAVER_API_BASE_URL={server.url}")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,11 @@
-"""기존 기사를 새로운 분류 시스템으로 재분류"""
+"""기존 기사를 새로운 분류 시스템으로 재분류 (내용이나 분류 규칙이 바뀐 기사만)"""
+import argparse
 from app import create_app, db
-from app.services.article_classifier import ArticleClassifier
+from app.services.article_classifier import content_hash
+from app.services.parallel_classifier import ParallelClassifier
+from app.services.rescoring import rescore_rule_delta, write_scores
 from app.models.article import Article
+from app.models.classifier_ruleset import ClassifierRuleset
 import logging
 
 logging.basicConfig(
@@ -10,48 +14,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = create_app()
+# 한 번에 DB에서 읽고 갱신할 기사 수
+PAGE_SIZE = 20000
 
-with app.app_context():
-    search_keywords = app.config.get('SEARCH_KEYWORDS')
-    classifier = ArticleClassifier(search_keywords)
 
-    # 모든 의료 기사 가져오기
-    articles = Article.query.filter_by(is_medical=True).all()
+def main():
+    parser = argparse.ArgumentParser(description='기존 기사 재분류')
+    parser.add_argument('--all', action='store_true', help='내용/규칙 버전과 무관하게 전체 재분류')
+    parser.add_argument('--verify', action='store_true',
+                        help='규칙 버전이 최신인 기사도 내용 해시를 다시 계산해 비교하고 유사 기사는 다시 분류 '
+                             '(DB에서 직접 수정했거나 스토리 분류 결과를 복사해 저장하던 버전에서 수집한 경우)')
+    parser.add_argument('--no-delta', action='store_true',
+                        help='규칙 변경분(키워드 역색인) 재분류를 건너뛰고 대상 기사를 모두 다시 분류')
+    args = parser.parse_args()
 
-    logger.info(f"재분류할 기사: {len(articles)}개")
+    app = create_app()
 
-    updated_count = 0
+    with app.app_context():
+        # 작업 프로세스마다 분류기를 한 번만 만들고 페이지 단위로 재사용
+        with ParallelClassifier.from_config(app.config) as classifier:
+            ruleset_version = classifier.ruleset_version
+            ClassifierRuleset.record(classifier.classifier)
+            db.session.commit()
 
-    for article in articles:
-        # 재분류
-        is_medical, category, confidence, keywords = classifier.classify_article(
-            article.title,
-            article.description or ""
-        )
+            # 규칙만 바뀐 경우: 바뀐 키워드가 나온 기사만 재분류하고 나머지는 버전만 갱신
+            if not (args.all or args.no_delta):
+                delta = rescore_rule_delta(classifier.classifier, scorer=classifier, batch_size=PAGE_SIZE)
+                logger.info(f"규칙 변경분 재분류: {delta}")
 
-        # 업데이트
-        article.category = category
-        article.confidence_score = confidence
-        article.keywords = keywords
+            # 모든 의료 기사 중 재분류 대상 (규칙 버전이 다르거나 내용이 바뀐 기사)
+            base_query = db.session.query(
+                Article.id, Article.title, Article.description, Article.content_hash, Article.ruleset_version,
+                Article.story_key, Article.canonical_key
+            ).filter(Article.is_medical == True)
+            if not (args.all or args.verify):
+                # 제목/요약을 ORM으로 바꾸면 content_hash가 비워지므로 SQL로 대상만 고른다
+                base_query = base_query.filter(db.or_(
+                    Article.ruleset_version.is_(None),
+                    Article.ruleset_version != ruleset_version,
+                    Article.content_hash.is_(None)
+                ))
+            total = base_query.count()
 
-        updated_count += 1
+            logger.info(f"규칙 버전: {ruleset_version}, 확인할 기사: {total}개")
 
-        if updated_count % 10 == 0:
-            logger.info(f"진행: {updated_count}/{len(articles)}")
+            updated_count = 0
+            checked_count = 0
+            last_id = 0
 
-    db.session.commit()
+            while True:
+                rows = base_query.filter(Article.id > last_id).order_by(Article.id).limit(PAGE_SIZE).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+                checked_count += len(rows)
 
-    logger.info(f"재분류 완료: {updated_count}개 업데이트됨")
+                # 내용 해시와 규칙 버전이 모두 같은 기사는 건너뜀
+                # (--verify: 예전에 대표 기사의 분류를 복사해 저장한 유사 기사는 자신의 텍스트로 다시 분류)
+                pending = []
+                for row in rows:
+                    digest = content_hash(row.title, row.description or "")
+                    follower = args.verify and row.story_key is not None and row.story_key != row.canonical_key
+                    if (args.all or follower or row.ruleset_version != ruleset_version
+                            or digest != row.content_hash):
+                        pending.append((row, digest))
 
-    # 카테고리별 통계
-    category_stats = db.session.query(
-        Article.category,
-        db.func.count(Article.id)
-    ).filter(
-        Article.is_medical == True
-    ).group_by(Article.category).all()
+                if pending:
+                    # 재분류 (입력 순서대로 결과 반환)
+                    scored = classifier.classify((row.title, row.description) for row, _ in pending)
 
-    logger.info("\n카테고리별 통계:")
-    for category, count in category_stats:
-        logger.info(f"  {category}: {count}개")
+                    # 업데이트 (기본 키 기준 일괄 UPDATE + 키워드 역색인 교체)
+                    write_scores([(row.id, digest) for row, digest in pending], scored, ruleset_version)
+                    db.session.commit()
+                    updated_count += len(pending)
+
+                logger.info(f"진행: {checked_count}/{total} (재분류 {updated_count}개)")
+
+        logger.info(f"재분류 완료: {updated_count}개 업데이트됨 ({checked_count - updated_count}개는 변경 없음)")
+
+        # 카테고리별 통계
+        category_stats = db.session.query(
+            Article.category,
+            db.func.count(Article.id)
+        ).filter(
+            Article.is_medical == True
+        ).group_by(Article.category).all()
+
+        logger.info("\n카테고리별 통계:")
+        for category, count in category_stats:
+            logger.info(f"  {category}: {count}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,14 @@
+import atexit
+import multiprocessing
 import os
 import logging
 from app import create_app, db
 from apscheduler.schedulers.background import BackgroundScheduler
-from app.services.news_collector import NewsCollector
-from app.services.article_classifier import ArticleClassifier
-from app.models.article import Article
+from app.services.collection_jobs import collect_due_queries, submit_collection, wait_for_job
+from app.services.content_fetcher import fill_article_content
+from app.services.ingestion import backfill_canonical_keys
+from app.services.scheduler_leader import SchedulerLeader
+from app.services.url_filter import get_url_filter
 from sqlalchemy import text, inspect
 
 # 로깅 설정
@@ -17,6 +21,10 @@ logger = logging.getLogger(__name__)
 # Flask 앱 생성
 app = create_app(os.getenv('FLASK_ENV', 'development'))
 
+# spawn으로 시작한 작업 프로세스(규칙 평가 채점 등)는 이 모듈을 다시 실행하므로
+# 마이그레이션, 필터 로드, 스케줄러 시작은 메인 프로세스에서만 수행
+IS_MAIN_PROCESS = multiprocessing.parent_process() is None
+
 
 def run_migrations():
     """Run database migrations to add missing columns"""
@@ -52,6 +60,11 @@ def run_migrations():
                     ('similar_cases', 'JSONB', None),
                     ('resolved_at', 'TIMESTAMP', None),
                     ('resolved_by_id', 'INTEGER', None),
+                    ('canonical_key', 'VARCHAR(64)', None),
+                    ('story_key', 'VARCHAR(64)', None),
+                    ('minhash', 'BYTEA', None),
+                    ('content_hash', 'VARCHAR(40)', None),
+                    ('ruleset_version', 'VARCHAR(16)', None),
                 ]
 
                 added_count = 0
@@ -63,19 +76,49 @@ def run_migrations():
                         logger.info(f"Added column: {col_name}")
                         added_count += 1
 
+                # 정규화 URL 키 유니크 인덱스 (NULL은 중복 허용)
+                connection.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ix_articles_canonical_key "
+                    "ON articles (canonical_key)"
+                ))
+                connection.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_articles_story_key ON articles (story_key)"
+                ))
+                # 분류 규칙 버전 인덱스 (증분 재분류 대상 조회용)
+                connection.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_articles_ruleset_version ON articles (ruleset_version)"
+                ))
+                # 수집 작업의 쿼리 목록 (진행 중인 작업에 합류할 수 있는지 판단)
+                if 'collection_jobs' in tables:
+                    job_columns = [col['name'] for col in inspector.get_columns('collection_jobs')]
+                    if 'queries' not in job_columns:
+                        connection.execute(text("ALTER TABLE collection_jobs ADD COLUMN queries JSON"))
+                        logger.info("Added column: collection_jobs.queries")
+                connection.commit()
+
                 if added_count > 0:
-                    connection.commit()
                     logger.info(f"Migration completed: {added_count} columns added")
                 else:
                     logger.info("Database schema is up to date")
 
+            # 키 도입 전에 저장된 기사의 canonical_key 채우기
+            backfill_canonical_keys()
+
         except Exception as e:
             logger.error(f"Migration error: {e}")
             # Don't raise - allow app to continue
 
 
 # Run migrations on startup
-run_migrations()
+if IS_MAIN_PROCESS:
+    run_migrations()
+
+    # 저장된 URL 필터 미리 로드 (이후 수집은 필터로 중복 여부를 먼저 판단)
+    with app.app_context():
+        try:
+            get_url_filter(app.config)
+        except Exception as e:
+            logger.error(f"URL 필터 로드 실패: {e}")
 
 def scheduled_article_collection():
     """스케줄된 기사 수집 작업"""
@@ -84,54 +127,37 @@ def scheduled_article_collection():
             logger.info("=== 스케줄된 기사 수집 시작 ===")
 
             # 설정 가져오기
-            client_id = app.config.get('NAVER_CLIENT_ID')
-            client_secret = app.config.get('NAVER_CLIENT_SECRET')
-            search_keywords = app.config.get('SEARCH_KEYWORDS')
-            max_articles = app.config.get('MAX_ARTICLES_PER_DAY')
-
-            if not client_id or not client_secret:
+            if not app.config.get('NAVER_CREDENTIALS'):
                 logger.error("Naver API 설정이 없습니다. .env 파일을 확인하세요.")
                 return
 
-            # 기사 수집
-            collector = NewsCollector(client_id, client_secret)
-            articles = collector.collect_medical_articles(max_articles=max_articles)
-
-            # 의료 기사 분류
-            classifier = ArticleClassifier(search_keywords)
-            medical_articles = classifier.batch_classify(articles)
-
-            # 데이터베이스 저장
-            saved_count = 0
-            skipped_count = 0
-
-            for article_data in medical_articles:
-                existing = Article.query.filter_by(url=article_data['url']).first()
-                if existing:
-                    skipped_count += 1
-                    continue
-
-                article = Article(
-                    title=article_data['title'],
-                    description=article_data['description'],
-                    url=article_data['url'],
-                    source=article_data['source'],
-                    published_date=article_data['published_date'],
-                    is_medical=article_data['is_medical'],
-                    category=article_data['category'],
-                    keywords=article_data['keywords'],
-                    confidence_score=article_data['confidence_score']
-                )
+            # 수집 → 분류 → 저장 (수동 수집이 진행 중이면 그 작업 결과를 기다림, 원문 수집은 작업이 시작)
+            job, attached = submit_collection(app)
+            if attached:
+                logger.info(f"진행 중인 수집 작업 {job.id} 완료 대기")
+            job = wait_for_job(app.config, job.id)
+            if job is None or job.status != 'succeeded':
+                logger.error(f"스케줄된 기사 수집 실패: {job.error if job else '작업 없음'}")
+                return
 
-                db.session.add(article)
-                saved_count += 1
+            stats = job.counts or {}
+            logger.info(f"=== 기사 수집 완료 === 수집: {stats.get('collected', 0)}, 관련: {stats.get('relevant', 0)}, "
+                        f"저장: {stats.get('inserted', 0)}, 중복: {stats.get('skipped', 0)}")
 
-            db.session.commit()
+        except Exception as e:
+            logger.error(f"스케줄된 기사 수집 중 오류: {e}")
+            db.session.rollback()
 
-            logger.info(f"=== 기사 수집 완료 === 수집: {len(articles)}, 의료: {len(medical_articles)}, 저장: {saved_count}, 중복: {skipped_count}")
+def scheduled_adaptive_collection():
+    """적응형 수집 확인 (폴링 간격이 지난 쿼리가 있으면 수집 작업 등록)"""
+    with app.app_context():
+        try:
+            if not app.config.get('NAVER_CREDENTIALS'):
+                return
+            collect_due_queries(app)
 
         except Exception as e:
-            logger.error(f"스케줄된 기사 수집 중 오류: {e}")
+            logger.error(f"적응형 기사 수집 중 오류: {e}")
             db.session.rollback()
 
 # 스케줄러 설정
@@ -139,24 +165,59 @@ scheduler = BackgroundScheduler()
 collection_time = app.config.get('ARTICLE_COLLECTION_TIME', '09:00')
 hour, minute = map(int, collection_time.split(':'))
 
-# 매일 지정된 시간에 기사 수집
-scheduler.add_job(
-    func=scheduled_article_collection,
-    trigger='cron',
-    hour=hour,
-    minute=minute,
-    id='daily_article_collection',
-    name='매일 의료 기사 수집',
-    replace_existing=True
+adaptive_collection = app.config.get('ADAPTIVE_COLLECTION_ENABLED')
+if adaptive_collection:
+    # 쿼리별 유입 속도에 맞춰 폴링 간격이 지난 쿼리만 수집
+    scheduler.add_job(
+        func=scheduled_adaptive_collection,
+        trigger='interval',
+        seconds=app.config.get('ADAPTIVE_TICK_SECONDS', 60),
+        id='adaptive_article_collection',
+        name='적응형 기사 수집',
+        replace_existing=True
+    )
+else:
+    # 매일 지정된 시간에 기사 수집
+    scheduler.add_job(
+        func=scheduled_article_collection,
+        trigger='cron',
+        hour=hour,
+        minute=minute,
+        id='daily_article_collection',
+        name='매일 의료 기사 수집',
+        replace_existing=True
+    )
+
+# 본문이 비어 있는 기사 원문 수집 (수집 직후 처리하지 못한 기사 포함)
+if app.config.get('CONTENT_FETCH_ENABLED'):
+    scheduler.add_job(
+        func=fill_article_content,
+        args=(app,),
+        trigger='interval',
+        minutes=30,
+        id='article_content_fetch',
+        name='기사 원문 본문 수집',
+        replace_existing=True
+    )
+
+# 여러 워커 프로세스 중 임대를 가진 리더 한 곳에서만 스케줄 작업 실행
+scheduler_leader = SchedulerLeader(
+    app, scheduler,
+    ttl=app.config.get('SCHEDULER_LEADER_TTL_SECONDS', 30),
+    check_interval=app.config.get('SCHEDULER_LEADER_CHECK_SECONDS', 10)
 )
-
-scheduler.start()
-logger.info(f"스케줄러 시작: 매일 {collection_time}에 기사 수집")
+if IS_MAIN_PROCESS:
+    scheduler_leader.start()
+    atexit.register(scheduler_leader.shutdown)
+    if adaptive_collection:
+        logger.info("스케줄러 시작: 적응형 기사 수집 (리더 프로세스에서만 실행)")
+    else:
+        logger.info(f"스케줄러 시작: 매일 {collection_time}에 기사 수집 (리더 프로세스에서만 실행)")
 
 if __name__ == '__main__':
     try:
         port = int(os.environ.get('PORT', 5001))
         app.run(host='0.0.0.0', port=port, debug=app.config['DEBUG'])
     except (KeyboardInterrupt, SystemExit):
-        scheduler.shutdown()
+        scheduler_leader.shutdown()
         logger.info("스케줄러 종료")
@@ -0,0 +1,155 @@
+"""ContentFetcher 동작 확인 (로컬 HTTP 픽스처 서버 사용, 외부 네트워크 없음)"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.content_fetcher import ContentFetcher
+
+PARAGRAPH = '해시드가 투자한 프로젝트에 대한 기사 본문 문단입니다. 충분히 긴 문장으로 구성합니다.'
+ARTICLE_HTML = f'<html><body><article><p>{PARAGRAPH}</p></article></body></html>'.encode('utf-8')
+META_CHARSET_HTML = (f'<html><head><meta charset="utf-8"></head>'
+                     f'<body><article><p>{PARAGRAPH}</p></article></body></html>').encode('utf-8')
+SLOW_SECONDS = 0.3
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """경로별 응답: /article(느린 HTML), /big, /pdf, /redirect, /bogus-charset"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body: bytes, content_type: str = 'text/html; charset=utf-8', status: int = 200):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        host = self.headers.get('Host', '').split(':')[0]
+        with server.lock:
+            server.active[host] = server.active.get(host, 0) + 1
+            server.max_active[host] = max(server.max_active.get(host, 0), server.active[host])
+            server.started.setdefault(host, []).append(time.monotonic())
+        try:
+            if self.path.startswith('/article'):
+                time.sleep(SLOW_SECONDS)
+                self._send(ARTICLE_HTML)
+            elif self.path == '/big':
+                tail = ('<p>TAIL_MARKER ' + 'x' * 100 + '</p>') * 5000
+                self._send(f'<html><body><article><p>{PARAGRAPH}</p>{tail}</article></body></html>'.encode('utf-8'))
+            elif self.path == '/pdf':
+                self._send(b'%PDF-1.4', content_type='application/pdf')
+            elif self.path == '/redirect':
+                self.send_response(302)
+                self.send_header('Location', '/article/redirected')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+            elif self.path == '/bogus-charset':
+                self._send(META_CHARSET_HTML, content_type='text/html; charset=x-bogus')
+            else:
+                self._send(b'not found', content_type='text/plain', status=404)
+        finally:
+            with server.lock:
+                server.active[host] -= 1
+
+
+@pytest.fixture(scope='module')
+def fixture_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.active, server.max_active, server.started = {}, {}, {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def server(fixture_server):
+    with fixture_server.lock:
+        fixture_server.active.clear()
+        fixture_server.max_active.clear()
+        fixture_server.started.clear()
+    return fixture_server
+
+
+def base_url(server, host: str = '127.0.0.1') -> str:
+    return f'http://{host}:{server.server_address[1]}'
+
+
+def test_per_domain_concurrency_limit(server):
+    urls = [f'{base_url(server)}/article/{i}' for i in range(6)]
+    with ContentFetcher(max_workers=6, per_domain_connections=2, per_domain_delay=0) as fetcher:
+        results = fetcher.fetch_many(urls)
+
+    assert all(PARAGRAPH in text for text in results.values())
+    assert server.max_active['127.0.0.1'] == 2
+
+
+def test_domains_are_throttled_independently(server):
+    urls = [f'{base_url(server, host)}/article/{i}' for host in ('127.0.0.1', 'localhost') for i in range(2)]
+    with ContentFetcher(max_workers=4, per_domain_connections=1, per_domain_delay=0) as fetcher:
+        started = time.monotonic()
+        fetcher.fetch_many(urls)
+        elapsed = time.monotonic() - started
+
+    assert server.max_active['127.0.0.1'] == 1
+    assert server.max_active['localhost'] == 1
+    # 도메인끼리는 동시에 진행되므로 2개씩 순서대로 처리한 시간보다 짧다
+    assert elapsed < SLOW_SECONDS * 4
+
+
+def test_per_domain_delay(server):
+    delay = 0.2
+    urls = [f'{base_url(server)}/pdf?{i}' for i in range(4)]
+    with ContentFetcher(max_workers=4, per_domain_connections=4, per_domain_delay=delay) as fetcher:
+        fetcher.fetch_many(urls)
+
+    started = sorted(server.started['127.0.0.1'])
+    gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+    assert len(started) == 4
+    assert min(gaps) >= delay * 0.9
+
+
+def test_max_bytes_cutoff(server):
+    with ContentFetcher(max_workers=1, per_domain_delay=0, max_bytes=32 * 1024,
+                        max_content_length=10 ** 7) as fetcher:
+        text = fetcher.fetch(f'{base_url(server)}/big')
+
+    assert PARAGRAPH in text
+    # 전체 응답(약 550KB)의 TAIL_MARKER 5000개 중 max_bytes까지만 파싱
+    assert 0 < text.count('TAIL_MARKER') < 500
+
+
+def test_non_html_response_is_skipped(server):
+    with ContentFetcher(max_workers=1, per_domain_delay=0) as fetcher:
+        assert fetcher.fetch(f'{base_url(server)}/pdf') is None
+
+
+def test_redirect_is_followed(server):
+    with ContentFetcher(max_workers=1, per_domain_delay=0) as fetcher:
+        text = fetcher.fetch(f'{base_url(server)}/redirect')
+
+    assert PARAGRAPH in text
+    assert len(server.started['127.0.0.1']) == 2
+
+
+def test_http_error_returns_none(server):
+    with ContentFetcher(max_workers=1, per_domain_delay=0) as fetcher:
+        assert fetcher.fetch(f'{base_url(server)}/missing') is None
+
+
+def test_unknown_charset_falls_back(server):
+    urls = [f'{base_url(server)}/bogus-charset', f'{base_url(server)}/article/1']
+    with ContentFetcher(max_workers=2, per_domain_delay=0) as fetcher:
+        results = fetcher.fetch_many(urls)
+
+    # 헤더의 잘못된 charset은 무시하고 meta 태그로 파싱하며, 같은 배치의 다른 페이지는 영향 없음
+    assert PARAGRAPH in results[urls[0]]
+    assert PARAGRAPH in results[urls[1]]
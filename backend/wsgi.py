@@ -5,6 +5,7 @@ This file is used by Gunicorn to run the Flask application.
 import os
 import logging
 from app import create_app, db
+from app.services.ingestion import backfill_canonical_keys
 from sqlalchemy import text, inspect
 
 # Configure logging
@@ -53,6 +54,11 @@ def run_migrations():
                     ('similar_cases', 'JSONB', None),
                     ('resolved_at', 'TIMESTAMP', None),
                     ('resolved_by_id', 'INTEGER', None),
+                    ('canonical_key', 'VARCHAR(64)', None),
+                    ('story_key', 'VARCHAR(64)', None),
+                    ('minhash', 'BYTEA', None),
+                    ('content_hash', 'VARCHAR(40)', None),
+                    ('ruleset_version', 'VARCHAR(16)', None),
                 ]
 
                 added_count = 0
@@ -67,12 +73,34 @@ def run_migrations():
                         except Exception as col_error:
                             logger.warning(f"Could not add column {col_name}: {col_error}")
 
+                # Unique index on the canonical URL key (NULLs may repeat)
+                connection.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ix_articles_canonical_key "
+                    "ON articles (canonical_key)"
+                ))
+                connection.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_articles_story_key ON articles (story_key)"
+                ))
+                # Ruleset version index (finds rows due for incremental reclassification)
+                connection.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_articles_ruleset_version ON articles (ruleset_version)"
+                ))
+                # Query list of collection jobs (decides whether a request can join a running job)
+                if 'collection_jobs' in tables:
+                    job_columns = [col['name'] for col in inspector.get_columns('collection_jobs')]
+                    if 'queries' not in job_columns:
+                        connection.execute(text("ALTER TABLE collection_jobs ADD COLUMN queries JSON"))
+                        logger.info("Added column: collection_jobs.queries")
+                connection.commit()
+
                 if added_count > 0:
-                    connection.commit()
                     logger.info(f"Migration completed: {added_count} columns added")
                 else:
                     logger.info("Database schema is up to date")
 
+            # Fill canonical_key for articles stored before the key existed
+            backfill_canonical_keys()
+
         except Exception as e:
             logger.error(f"Migration error: {e}")
             import traceback
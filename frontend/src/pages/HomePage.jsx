@@ -181,8 +181,8 @@ function HomePage() {
   const handleCollectArticles = async () => {
     try {
       setSnackbar({ open: true, message: 'Starting article collection...', severity: 'info' });
-      await collectArticles();
-      setSnackbar({ open: true, message: 'Article collection completed.', severity: 'success' });
+      const job = await collectArticles();
+      setSnackbar({ open: true, message: `Article collection completed (${job.counts?.inserted ?? 0} new).`, severity: 'success' });
       fetchArticles();
       fetchStats();
     } catch (err) {
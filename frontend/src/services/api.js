@@ -47,12 +47,27 @@ export const getArticle = async (id) => {
   return response.data;
 };
 
-// 수동 기사 수집
-export const collectArticles = async () => {
-  const response = await api.post('/scheduler/collect');
+// 수집 작업 상태 조회
+export const getCollectionJob = async (jobId) => {
+  const response = await api.get(`/scheduler/jobs/${jobId}`);
   return response.data;
 };
 
+// 수동 기사 수집 (백그라운드 작업 등록 후 완료될 때까지 상태 조회)
+export const collectArticles = async ({ onProgress, pollInterval = 2000 } = {}) => {
+  const response = await api.post('/scheduler/collect');
+  let job = { id: response.data.job_id, status: response.data.status };
+  while (job.status !== 'succeeded' && job.status !== 'failed') {
+    await new Promise((resolve) => setTimeout(resolve, pollInterval));
+    job = await getCollectionJob(job.id);
+    if (onProgress) onProgress(job);
+  }
+  if (job.status === 'failed') {
+    throw new Error(job.error || 'Collection job failed');
+  }
+  return job;
+};
+
 // ========== 리스크 관리 API ==========
 
 // 대시보드 통계 조회